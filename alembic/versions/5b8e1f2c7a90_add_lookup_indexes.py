@@ -0,0 +1,31 @@
+"""add lookup indexes
+
+Revision ID: 5b8e1f2c7a90
+Revises: 93a41ec48437
+Create Date: 2026-10-15 10:12:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b8e1f2c7a90'
+down_revision: Union[str, None] = '93a41ec48437'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # MySQL은 부분 인덱스(WHERE deleted_at IS NULL)를 지원하지 않으므로
+    # (조회 컬럼, deleted_at) 복합 인덱스로 논리 삭제 조건까지 인덱스에서 처리한다.
+    op.create_index('ix_organization_name_deleted_at', 'organization', ['name', 'deleted_at'], unique=False)
+    op.create_index('ix_position_title_deleted_at', 'position', ['title', 'deleted_at'], unique=False)
+    op.create_index('ix_rank_title_deleted_at', 'rank', ['title', 'deleted_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_rank_title_deleted_at', table_name='rank')
+    op.drop_index('ix_position_title_deleted_at', table_name='position')
+    op.drop_index('ix_organization_name_deleted_at', table_name='organization')
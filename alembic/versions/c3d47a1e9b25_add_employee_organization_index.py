@@ -0,0 +1,26 @@
+"""add employee organization index
+
+Revision ID: c3d47a1e9b25
+Revises: 5b8e1f2c7a90
+Create Date: 2026-10-15 11:03:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3d47a1e9b25'
+down_revision: Union[str, None] = '5b8e1f2c7a90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # MySQL은 부분 인덱스를 지원하지 않으므로 (organization_seq, deleted_at) 복합 인덱스로 대체한다.
+    op.create_index('ix_employee_organization_seq_deleted_at', 'employee', ['organization_seq', 'deleted_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_employee_organization_seq_deleted_at', table_name='employee')
@@ -0,0 +1,33 @@
+"""add list pagination indexes
+
+Revision ID: d81f0b6a4c12
+Revises: c3d47a1e9b25
+Create Date: 2026-10-15 23:41:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd81f0b6a4c12'
+down_revision: Union[str, None] = 'c3d47a1e9b25'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 목록 조회(WHERE deleted_at IS NULL ORDER BY seq LIMIT ?)와 COUNT(*)를 인덱스만으로 처리한다.
+    op.create_index('ix_organization_deleted_at_seq', 'organization', ['deleted_at', 'seq'], unique=False)
+    op.create_index('ix_position_deleted_at_seq', 'position', ['deleted_at', 'seq'], unique=False)
+    op.create_index('ix_rank_deleted_at_seq', 'rank', ['deleted_at', 'seq'], unique=False)
+    # 조직 목록의 level, parent_seq 필터 조회
+    op.create_index('ix_organization_level_parent_seq', 'organization', ['level', 'parent_seq'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_organization_level_parent_seq', table_name='organization')
+    op.drop_index('ix_rank_deleted_at_seq', table_name='rank')
+    op.drop_index('ix_position_deleted_at_seq', table_name='position')
+    op.drop_index('ix_organization_deleted_at_seq', table_name='organization')
@@ -0,0 +1,47 @@
+"""add organization path
+
+Revision ID: e4a9c2d7f318
+Revises: d81f0b6a4c12
+Create Date: 2026-10-15 23:58:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4a9c2d7f318'
+down_revision: Union[str, None] = 'd81f0b6a4c12'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('organization', sa.Column('path', sa.String(length=255), nullable=True, comment='조직 경로 (최상위부터 자신까지의 seq, 예: /1/4/17/)'))
+    op.create_index('ix_organization_path', 'organization', ['path'], unique=False)
+    # 기존 조직의 경로를 재귀 CTE로 채운다. (수정일은 유지)
+    op.execute(
+        """
+        UPDATE organization o
+        JOIN (
+            WITH RECURSIVE tree (seq, path) AS (
+                SELECT seq, CAST(CONCAT('/', seq, '/') AS CHAR(255))
+                FROM organization
+                WHERE parent_seq IS NULL
+                UNION ALL
+                SELECT c.seq, CONCAT(t.path, c.seq, '/')
+                FROM organization c
+                JOIN tree t ON c.parent_seq = t.seq
+            )
+            SELECT seq, path FROM tree
+        ) t ON o.seq = t.seq
+        SET o.path = t.path, o.updated_at = o.updated_at
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_organization_path', table_name='organization')
+    op.drop_column('organization', 'path')
@@ -0,0 +1,26 @@
+"""add organization parent index
+
+Revision ID: f2b7d9e1c5a3
+Revises: e4a9c2d7f318
+Create Date: 2026-10-16 00:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2b7d9e1c5a3'
+down_revision: Union[str, None] = 'e4a9c2d7f318'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # MySQL은 부분 인덱스를 지원하지 않으므로 (parent_seq, deleted_at) 복합 인덱스로 대체한다.
+    op.create_index('ix_organization_parent_seq_deleted_at', 'organization', ['parent_seq', 'deleted_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_organization_parent_seq_deleted_at', table_name='organization')
@@ -3,18 +3,24 @@ BaseRepository는 직접 인스턴스화해서 사용하지 않고,
 구체적인 Repository(예: UserRepository)가 상속받아 사용하는 추상적인 기본 클래스이기 때문에,
 providers_info에 따로 등록하지 않는다.
 Providers_info에는 실제 DI 컨테이너를 통해 인스턴스를 생성할 구체적인 클래스들만 등록한다.
+
+"scope"를 "singleton"으로 지정하면 애플리케이션 전체에서 하나의 인스턴스를 재사용하고,
+지정하지 않으면 요청마다 새 인스턴스를 생성(Factory)한다.
+Repository와 Service는 상태를 갖지 않으므로 singleton으로 등록한다.
 """
 
 DEPENDENCY_REGISTRY_CONFIG = {
     "user_repository": {
         "module": "src.repository.user.user_repository",   # 모듈 경로
         "class": "UserRepository",                         # 클래스명
+        "scope": "singleton",                              # 인스턴스 범위 (singleton | 기본값: factory)
         "dependencies": {
         },
     },
     "user_service": {
         "module": "src.service.user.user_service",
         "class": "UserService",
+        "scope": "singleton",
         "dependencies": {
             "user_repository": "user_repository",          # 의존성: 자동 등록된 user_repository provider 참조
         },
@@ -22,6 +28,7 @@ DEPENDENCY_REGISTRY_CONFIG = {
     "auth_service": {
         "module": "src.service.auth.auth_service",
         "class": "AuthService",
+        "scope": "singleton",
         "dependencies": {
             "user_repository": "user_repository"
         },
@@ -29,12 +36,14 @@ DEPENDENCY_REGISTRY_CONFIG = {
     "employee_repository": {
         "module": "src.repository.employee.employee_repository",
         "class": "EmployeeRepository",
+        "scope": "singleton",
         "dependencies": {
         },
     },
     "employee_service": {
         "module": "src.service.employee.employee_service",
         "class": "EmployeeService",
+        "scope": "singleton",
         "dependencies": {
             "employee_repository": "employee_repository"
         },
@@ -42,12 +51,14 @@ DEPENDENCY_REGISTRY_CONFIG = {
     "position_repository": {
         "module": "src.repository.position.position_repository",
         "class": "PositionRepository",
+        "scope": "singleton",
         "dependencies": {
         },
     },
     "position_service": {
         "module": "src.service.position.position_service",
         "class": "PositionService",
+        "scope": "singleton",
         "dependencies": {
             "position_repository": "position_repository"
         },
@@ -55,12 +66,14 @@ DEPENDENCY_REGISTRY_CONFIG = {
     "rank_repository": {
         "module": "src.repository.rank.rank_repository",
         "class": "RankRepository",
+        "scope": "singleton",
         "dependencies": {
         },
     },
     "rank_service": {
         "module": "src.service.rank.rank_service",
         "class": "RankService",
+        "scope": "singleton",
         "dependencies": {
             "rank_repository": "rank_repository"
         },
@@ -68,12 +81,14 @@ DEPENDENCY_REGISTRY_CONFIG = {
     "organization_repository": {
         "module": "src.repository.organization.organization_repository",
         "class": "OrganizationRepository",
+        "scope": "singleton",
         "dependencies": {
         },
     },
     "organization_service": {
         "module": "src.service.organization.organization_service",
         "class": "OrganizationService",
+        "scope": "singleton",
         "dependencies": {
             "organization_repository": "organization_repository",
             "employee_repository": "employee_repository"
@@ -82,12 +97,14 @@ DEPENDENCY_REGISTRY_CONFIG = {
     "employee_history_repository": {
         "module": "src.repository.employee.employee_history_repository",
         "class": "EmployeeHistoryRepository",
+        "scope": "singleton",
         "dependencies": {
         },
     },
     "employee_history_service": {
         "module": "src.service.employee.employee_history_service",
         "class": "EmployeeHistoryService",
+        "scope": "singleton",
         "dependencies": {
             "employee_history_repository": "employee_history_repository",
         },
@@ -95,12 +112,14 @@ DEPENDENCY_REGISTRY_CONFIG = {
     "organization_history_repository": {
         "module": "src.repository.organization.organization_history_repository",
         "class": "OrganizationHistoryRepository",
+        "scope": "singleton",
         "dependencies": {
         },
     },
     "organization_history_service": {
         "module": "src.service.organization.organization_history_service",
         "class": "OrganizationHistoryService",
+        "scope": "singleton",
         "dependencies": {
             "organization_history_repository": "organization_history_repository",
         },
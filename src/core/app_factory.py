@@ -1,6 +1,7 @@
 from fastapi import FastAPI
 from src.core.app_lifespan import lifespan
 from src.middleware.cors_middleware import setup_cors
+from src.middleware.singleflight_middleware import setup_singleflight
 from src.exception.exception_handler_registry import ExceptionHandlerRegistry
 from src.routers.v1.router_binder import register_routers
 
@@ -10,6 +11,7 @@ def create_app() -> FastAPI:
 
     - lifespan 설정을 통해 앱 시작/종료 시 실행될 로직을 지정합니다.
     - CORS, 예외 핸들러, 라우터 등 앱의 핵심 설정들을 구성합니다.
+    - 라우터 등록이 끝나면 OpenAPI 스키마를 미리 생성해 둡니다.
 
     Returns:
         설정이 완료된 FastAPI 앱 인스턴스
@@ -18,6 +20,9 @@ def create_app() -> FastAPI:
     # 앱 생성 시 생명주기 관리 설정
     app = FastAPI(lifespan=lifespan)
 
+    # 동시에 들어온 동일한 조회 요청을 한 번만 처리하는 미들웨어 등록 (CORS보다 안쪽에 위치하도록 먼저 등록)
+    setup_singleflight(app)
+
     # CORS 미들웨어 등록 (프론트엔드와의 연동 허용)
     setup_cors(app)
 
@@ -27,4 +32,8 @@ def create_app() -> FastAPI:
     # API 라우터 등록 (v1 기준 도메인별 라우팅 구성)
     register_routers(app)
 
+    # OpenAPI 스키마를 앱 생성 시점에 미리 생성하여 캐싱
+    # (FastAPI는 첫 /docs, /openapi.json 요청 시점에 전체 라우트의 응답 모델 스키마를 생성하므로 그 비용을 기동 시점으로 이동)
+    app.openapi()
+
     return app
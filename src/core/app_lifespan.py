@@ -1,7 +1,12 @@
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
+from anyio import to_thread
 from fastapi import FastAPI
+from sqlalchemy.orm import configure_mappers
+from src.config.dependency_registry_config import DEPENDENCY_REGISTRY_CONFIG
 from src.core.container import container
+from src.core.executors import bcrypt_pool, count_pool
+from src.core.settings import settings
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
@@ -23,12 +28,25 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         # 의존성 주입 컨테이너의 리소스를 초기화
         container.init_resources()
 
-        # 지정된 패키지 내에서 의존성 주입 적용
-        container.wire(packages=["src.routers"])
-
         # Uvicorn 로깅 설정 구성
         container.uvicorn_logger_config().configure()
 
+        # 첫 요청에서 발생하는 초기화 비용을 기동 시점으로 이동
+        # - ORM 매퍼 관계 설정은 첫 쿼리 시점에 지연 수행되므로 미리 구성
+        # - singleton 서비스/리포지토리 인스턴스를 미리 생성 (라우터 의존성은 생성된 인스턴스를 바로 반환)
+        configure_mappers()
+        for provider_name, config in DEPENDENCY_REGISTRY_CONFIG.items():
+            if config.get("scope") == "singleton":
+                getattr(container, provider_name)()
+
+        # 동기(def) 엔드포인트는 스레드풀에서 실행되므로, 동시에 DB를 사용할 수 있는 커넥션 수에 맞춰 스레드 수를 제한
+        # (커넥션보다 스레드가 많으면 초과 스레드는 pool_timeout 동안 커넥션을 기다리며 스레드만 점유함)
+        # COUNT 전용 스레드 풀도 같은 커넥션 풀을 사용하므로 그 워커 수만큼 제외
+        to_thread.current_default_thread_limiter().total_tokens = (
+            settings.THREADPOOL_SIZE if settings.THREADPOOL_SIZE > 0
+            else max(1, settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW - settings.DB_COUNT_WORKERS)
+        )
+
         # lifespan 컨텍스트 유지
         yield
 
@@ -40,3 +58,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     finally:
         # 애플리케이션 종료 시 리소스 정리
         container.shutdown_resources()
+
+        # bcrypt 프로세스 풀 종료 (대기 중인 작업은 취소)
+        bcrypt_pool.shutdown(wait=False, cancel_futures=True)
+
+        # COUNT 전용 스레드 풀 종료
+        count_pool.shutdown(wait=False, cancel_futures=True)
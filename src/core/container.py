@@ -1,4 +1,6 @@
 import importlib
+from functools import lru_cache
+from typing import Any, Callable
 from dependency_injector import containers, providers
 from src.config.dependency_registry_config import DEPENDENCY_REGISTRY_CONFIG
 from src.logging.config.logging_config import LoggingConfig
@@ -6,7 +8,6 @@ from src.logging.config.uvicorn_logging_config import UvicornLoggingConfig
 
 
 class Container(containers.DeclarativeContainer):
-    wiring_config = containers.WiringConfiguration(packages=["src.routers"])
     logger_config = providers.Singleton(LoggingConfig)
     uvicorn_logger_config = providers.Singleton(UvicornLoggingConfig)
 
@@ -31,13 +32,39 @@ def auto_register_dependencies(container_cls: type):
         for dep_param, dep_provider_name in dependencies.items():
             dep_kwargs[dep_param] = getattr(container_cls, dep_provider_name)
 
-        # Factory provider 생성 후 컨테이너 클래스에 등록
-        provider = providers.Factory(cls, **dep_kwargs)
+        # scope에 따라 Singleton 또는 Factory provider 생성 후 컨테이너 클래스에 등록
+        provider_cls = providers.Singleton if config.get("scope") == "singleton" else providers.Factory
+        provider = provider_cls(cls, **dep_kwargs)
         setattr(container_cls, provider_name, provider)
 
 
 # Container 클래스에 provider들을 자동 등록
 auto_register_dependencies(Container)
 
-# Container 인스턴스 생성 (wiring 및 override 시 사용)
+# Container 인스턴스 생성 (라우터 의존성 조회 및 override 시 사용)
 container = Container()
+
+
+def service_dependency(provider_name: str) -> Callable[[], Any]:
+    """
+    컨테이너의 provider를 최초 1회만 호출하고, 이후에는 같은 인스턴스를 반환하는 FastAPI 의존성 함수를 생성합니다.
+    Depends(Provide[...]) + @inject 방식은 요청마다 wiring 래퍼(_patched)를 거쳐 provider를 다시 조회하므로,
+    요청이 많은 엔드포인트에서는 이 함수로 생성한 의존성을 사용합니다.
+
+    Args:
+        provider_name: 컨테이너에 등록된 provider 이름 (예: "employee_service")
+
+    비동기 함수로 생성하므로 FastAPI가 의존성 해석을 위해 스레드풀로 넘기지 않고 이벤트 루프에서 바로 반환합니다.
+
+    Returns:
+        Callable[[], Any]: Depends()에 전달할 의존성 함수
+    """
+    @lru_cache(maxsize=None)
+    def resolve() -> Any:
+        return getattr(container, provider_name)()
+
+    async def dependency() -> Any:
+        return resolve()
+
+    dependency.__name__ = f"get_{provider_name}"
+    return dependency
@@ -1,6 +1,11 @@
+import threading
+from contextvars import ContextVar
+from typing import Optional
+
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import scoped_session, sessionmaker
 from src.core.settings import settings
+from src.core.soft_delete import register_soft_delete_filter
 from src.logging.extensions.sql_query_logging import SqlQueryLogging
 
 DATABASE_URL = (
@@ -10,14 +15,38 @@ DATABASE_URL = (
 
 engine = create_engine(
     DATABASE_URL,
-    pool_size=10,     # 풀 크기 10
-    max_overflow=20,  # 최대 오버플로우 20
-    pool_timeout=30,  # 타임아웃 30초
+    pool_size=settings.DB_POOL_SIZE,        # 풀 크기 (기본 10)
+    max_overflow=settings.DB_MAX_OVERFLOW,  # 최대 오버플로우 (기본 20)
+    pool_timeout=settings.DB_POOL_TIMEOUT,  # 타임아웃 (기본 30초)
+    pool_recycle=settings.DB_POOL_RECYCLE,  # 오래된 커넥션 재생성 주기 (기본 3600초)
+    pool_pre_ping=settings.DB_POOL_PRE_PING,  # 유휴 중 끊어진 커넥션을 체크아웃 시점에 교체
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,  # 컴파일된 SQL 캐시 크기 (기본 1200)
 )
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# 커밋 후 객체를 만료시키지 않음 (커밋 이후 응답 생성 시 속성 접근마다 재조회(SELECT)하지 않도록)
+session_factory = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+
+# 현재 요청을 식별하는 세션 스코프 키 (get_db에서 요청 시작 시 설정)
+session_scope: ContextVar[Optional[int]] = ContextVar("session_scope", default=None)
+
+
+def _current_session_scope():
+    """
+    scoped_session 레지스트리 키를 반환합니다.
+    요청 안에서는 요청 스코프 키를, 요청 밖(스크립트, 배치 등)에서는 현재 스레드를 기준으로 합니다.
+    """
+    scope = session_scope.get()
+    return scope if scope is not None else threading.get_ident()
+
+
+# 요청 단위로 하나의 세션을 공유하는 scoped_session
+# (스레드풀로 넘어간 엔드포인트/서비스 코드도 컨텍스트가 복사되므로 같은 세션을 사용)
+SessionLocal = scoped_session(session_factory, scopefunc=_current_session_scope)
 
 # 슬로우 쿼리 및 일반 쿼리 로깅 리스너 등록
 sql_logger = SqlQueryLogging()
 sql_logger.register_listeners(engine)
-sql_logger.register_session_listeners(SessionLocal)
+sql_logger.register_session_listeners(session_factory)
+
+# 논리 삭제(deleted_at)된 데이터를 조회 대상에서 제외하는 전역 필터 등록
+register_soft_delete_filter(session_factory)
@@ -0,0 +1,14 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from src.core.settings import settings
+
+# bcrypt 해시/검증 전용 프로세스 풀
+# - 요청당 수십~수백 ms의 CPU 연산을 이벤트 루프와 엔드포인트 스레드풀 밖(별도 프로세스)에서 처리
+# - 워커 프로세스는 첫 작업 제출 시점에 생성되며, 애플리케이션 종료 시 lifespan에서 정리
+bcrypt_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+
+# 목록 조회의 COUNT 쿼리 전용 스레드 풀
+# - 페이지 조회와 COUNT를 서로 다른 커넥션에서 동시에 실행하여 목록 API의 DB 대기 시간을 겹침
+# - 엔드포인트 스레드풀 크기에서 이 워커 수만큼을 제외하므로, 두 풀이 함께 커넥션 풀을 초과하지 않음
+count_pool = ThreadPoolExecutor(max_workers=settings.DB_COUNT_WORKERS, thread_name_prefix="db-count")
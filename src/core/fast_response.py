@@ -0,0 +1,72 @@
+from typing import Any, Dict, Optional
+
+import orjson
+from fastapi.responses import Response
+
+# 성공 응답 공통 envelope의 고정 부분 (CommonResponseDto와 동일한 필드 구성)
+_SUCCESS_PREFIX = b'{"status":"success","data":'
+_MESSAGE_PREFIX = b',"message":'
+_SUFFIX = b"}"
+_ITEMS_PREFIX = b'{"items":'
+
+
+def ok(data: Any, message: Optional[str] = None, status_code: int = 200) -> Response:
+    """
+    CommonResponseDto 객체를 생성하지 않고 성공 응답 JSON을 바로 만들어 반환합니다.
+
+    data만 orjson으로 직렬화하고, 고정된 envelope 바이트와 이어 붙입니다.
+    (dataclass 도메인 객체, dict, list, date/datetime은 orjson이 네이티브로 직렬화)
+    반환값이 Response이므로 FastAPI의 response_model 검증/직렬화 단계도 생략됩니다.
+
+    Args:
+        data (Any): 응답 데이터 (응답 DTO와 필드 구성이 같은 도메인 객체 또는 JSON 호환 값)
+        message (Optional[str]): 응답 메시지
+        status_code (int): HTTP 상태 코드 (생성 API는 201)
+
+    Returns:
+        Response: application/json 응답
+    """
+    return Response(
+        content=_SUCCESS_PREFIX + orjson.dumps(data) + _MESSAGE_PREFIX + orjson.dumps(message) + _SUFFIX,
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+def ok_json(data_json: bytes, message: Optional[str] = None, status_code: int = 200) -> Response:
+    """
+    이미 직렬화된 data JSON을 성공 응답 envelope로 감싸 반환합니다.
+
+    캐시해 둔 직렬화 결과를 그대로 응답할 때 사용하며, data를 다시 직렬화하지 않습니다.
+
+    Args:
+        data_json (bytes): 직렬화된 응답 데이터 JSON
+        message (Optional[str]): 응답 메시지
+        status_code (int): HTTP 상태 코드 (생성 API는 201)
+
+    Returns:
+        Response: application/json 응답
+    """
+    return Response(
+        content=_SUCCESS_PREFIX + data_json + _MESSAGE_PREFIX + orjson.dumps(message) + _SUFFIX,
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+def ok_page(items_json: bytes, page_info: Dict[str, Any], message: Optional[str] = None) -> Response:
+    """
+    이미 직렬화된 목록 JSON과 페이지 정보를 이어 붙여 페이지네이션 성공 응답을 반환합니다.
+
+    목록은 TypeAdapter.dump_json으로 바로 바이트로 직렬화하고,
+    페이지 정보(page, size, has_more 등)만 orjson으로 직렬화하여 중간 dict 목록을 만들지 않습니다.
+
+    Args:
+        items_json (bytes): 직렬화된 아이템 목록 JSON 배열
+        page_info (Dict[str, Any]): items를 제외한 페이지네이션 필드 (비어 있지 않아야 함)
+        message (Optional[str]): 응답 메시지
+
+    Returns:
+        Response: application/json 응답 (data = {"items": [...], **page_info})
+    """
+    return ok_json(_ITEMS_PREFIX + items_json + b"," + orjson.dumps(page_info)[1:], message)
@@ -0,0 +1,71 @@
+from typing import Dict, Tuple
+
+from fastapi import FastAPI
+from starlette.routing import Match, Route
+from starlette.types import Receive, Scope, Send
+
+
+def _build_static_route_index(routes: list) -> Dict[Tuple[str, str], Route]:
+    """
+    경로 파라미터가 없는 라우트를 (path, method) 키로 색인합니다.
+
+    Starlette는 등록 순서대로 첫 번째로 일치한 라우트를 사용하므로,
+    앞서 등록된 라우트(예: `/{seq}`)가 같은 경로/메서드에 먼저 일치하는 경우는 색인하지 않습니다.
+    (색인을 사용해도 기존 매칭 결과가 바뀌지 않도록 보장)
+
+    Args:
+        routes (list): 등록된 라우트 목록
+
+    Returns:
+        Dict[Tuple[str, str], Route]: (path, method) → 라우트
+    """
+    index: Dict[Tuple[str, str], Route] = {}
+    for position, route in enumerate(routes):
+        if not isinstance(route, Route) or route.param_convertors or not route.methods:
+            continue
+
+        for method in route.methods:
+            key = (route.path, method)
+            if key in index:
+                continue
+            shadowed = any(
+                previous.path_regex.match(route.path)
+                and (getattr(previous, "methods", None) is None or method in previous.methods)
+                for previous in routes[:position]
+                if hasattr(previous, "path_regex")
+            )
+            if not shadowed:
+                index[key] = route
+    return index
+
+
+def install_route_index(app: FastAPI) -> None:
+    """
+    정적 경로 라우트를 dict로 바로 찾는 라우팅 fast-path를 설치합니다.
+
+    Starlette 라우터는 요청마다 전체 라우트 목록을 순서대로 정규식 매칭합니다.
+    라우터 등록이 끝난 시점의 라우트 목록으로 색인을 한 번 만들고,
+    정적 경로 요청은 색인으로 찾은 라우트 하나만 매칭하여 처리합니다.
+    색인에 없거나(경로 파라미터 포함, 405/리다이렉트 등) 일치하지 않으면 기존 라우터로 처리합니다.
+
+    Args:
+        app (FastAPI): 라우터 등록이 완료된 FastAPI 애플리케이션
+    """
+    router = app.router
+    static_routes = _build_static_route_index(list(router.routes))
+    fallback = router.middleware_stack
+
+    async def indexed_app(scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            route = static_routes.get((scope["path"], scope["method"]))
+            if route is not None:
+                match, child_scope = route.matches(scope)
+                if match == Match.FULL:
+                    if "router" not in scope:
+                        scope["router"] = router
+                    scope.update(child_scope)
+                    await route.handle(scope, receive, send)
+                    return
+        await fallback(scope, receive, send)
+
+    router.middleware_stack = indexed_app
@@ -1,18 +1,63 @@
+import contextvars
+from concurrent.futures import Future
+from itertools import count
+from typing import AsyncGenerator, Callable, TypeVar
+
 from sqlalchemy.orm import Session
-from src.core.database import SessionLocal
+from starlette.concurrency import run_in_threadpool
+
+from src.core.database import SessionLocal, session_factory, session_scope
+from src.core.executors import count_pool
+
+T = TypeVar("T")
+
+# 요청별 세션 스코프 키 발급기
+_scope_ids = count(1)
 
-def get_db() -> Session:
+
+async def get_db() -> AsyncGenerator[Session, None]:
     """
-    요청당 하나의 DB 세션을 생성하고, 요청이 끝나면 세션을 종료합니다.
+    요청당 하나의 DB 세션을 제공하고, 요청이 끝나면 세션을 정리합니다.
 
     이 함수는 FastAPI의 의존성 주입 시스템에서 사용됩니다.
-    `yield`를 통해 세션을 반환하고, 요청이 끝난 후 `finally` 블록에서 세션을 안전하게 닫습니다.
+    요청 컨텍스트에 세션 스코프 키를 설정하므로, 같은 요청 안에서 `SessionLocal()`을 호출하는 모든 코드
+    (엔드포인트, 서비스, 데코레이터 등)는 동일한 세션과 커넥션을 공유합니다.
+    비동기 의존성으로 선언하여 요청 컨텍스트에서 실행되며, 세션 정리(커넥션 반환)는 스레드풀에서 수행합니다.
 
     Yields:
         Session: 데이터베이스 세션 객체
     """
-    db = SessionLocal()
+    token = session_scope.set(next(_scope_ids))
+    db = SessionLocal()  # 세션 생성만으로는 커넥션을 점유하지 않음 (첫 쿼리 시점에 체크아웃)
     try:
         yield db  # 호출자에게 세션을 제공
     finally:
-        db.close()  # 요청이 끝난 후 세션 종료
+        # 요청이 끝난 후 세션 종료 및 레지스트리에서 제거
+        await run_in_threadpool(SessionLocal.remove)
+        session_scope.reset(token)
+
+
+def submit_count(fn: Callable[..., T], *args) -> "Future[T]":
+    """
+    COUNT 조회를 별도 세션(커넥션)에서 COUNT 전용 스레드 풀로 실행합니다.
+
+    요청 세션은 스레드 간에 공유할 수 없으므로 새 세션을 열어 `fn(db, *args)`를 호출하고,
+    끝나면 세션을 닫아 커넥션을 반환합니다. 호출자는 같은 요청 세션으로 페이지 조회를 진행한 뒤
+    `Future.result()`로 결과를 받으므로 두 쿼리의 DB 대기 시간이 겹칩니다.
+    로그(trace_id 등)가 요청과 연결되도록 현재 컨텍스트를 복사하여 실행합니다.
+
+    Args:
+        fn (Callable[..., T]): 첫 번째 인자로 세션을 받는 조회 함수
+        *args: fn에 전달할 나머지 인자
+
+    Returns:
+        Future[T]: 조회 결과
+    """
+    def run() -> T:
+        db = session_factory()
+        try:
+            return fn(db, *args)
+        finally:
+            db.close()
+
+    return count_pool.submit(contextvars.copy_context().run, run)
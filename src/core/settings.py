@@ -16,12 +16,28 @@ class Settings(BaseSettings):
     MYSQL_DB: str = "rms"
     SLOW_QUERY_THRESHOLD: float = 2.0
 
+    # DB 커넥션 풀 설정
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 3600        # 커넥션 재생성 주기(초). MySQL wait_timeout보다 짧게 유지
+    DB_POOL_PRE_PING: bool = True      # 체크아웃 시 끊어진 커넥션 감지 후 재연결
+    DB_QUERY_CACHE_SIZE: int = 1200    # SQL 컴파일 결과 캐시 크기 (정렬/필터 조합별 구문이 밀려나지 않도록 기본값 500보다 크게)
+
+    # 동기(def) 엔드포인트를 실행하는 스레드풀 크기 (0 이하면 DB_POOL_SIZE + DB_MAX_OVERFLOW - DB_COUNT_WORKERS 사용)
+    THREADPOOL_SIZE: int = 0
+    # 목록 조회 시 COUNT 쿼리를 별도 커넥션에서 동시에 실행하는 전용 스레드 수
+    DB_COUNT_WORKERS: int = 2
+
     # JWT 관련 설정
     JWT_SECRET: str = "your_jwt_secret_here"
     JWT_ALGORITHM: str = "HS256"
     JWT_EXPIRATION_MINUTES: int = 1
     JWT_REFRESH_EXPIRATION_MINUTES: int = 1440
 
+    # 비밀번호 해시 bcrypt cost factor (1 증가할 때마다 해시/검증 시간이 2배)
+    BCRYPT_ROUNDS: int = 12
+
     class Config:
         # 순서대로 로드되며, 이후 파일의 값이 우선합니다.
         env_file = [
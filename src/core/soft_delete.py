@@ -0,0 +1,42 @@
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, sessionmaker, with_loader_criteria
+
+from src.entity.base_entity import SoftDeleteMixin
+
+
+def filter_soft_deleted(execute_state: ORMExecuteState) -> None:
+    """
+    ORM SELECT 실행 시 SoftDeleteMixin 엔티티에 deleted_at IS NULL 조건을 전역으로 추가합니다.
+
+    - 컬럼 로딩(refresh 등)과 관계 로딩의 지연 조회에는 적용하지 않습니다.
+    - 실행 옵션 include_deleted=True 가 지정된 쿼리는 논리 삭제된 데이터도 조회합니다.
+    - 목록/개수/검색 조회와 관계 검증(상위 조직, 소속 직원 등)에는 필터가 적용되고,
+      기본 키 단건 조회/수정/삭제(BaseRepository.find_by_id, update, soft_delete_by_id, delete_by_id 등)는
+      include_deleted=True로 논리 삭제된 데이터도 대상으로 합니다. (논리 삭제된 데이터도 seq로 조회/영구 삭제 가능)
+
+    Args:
+        execute_state (ORMExecuteState): ORM 실행 상태 객체
+    """
+    if (
+        execute_state.is_select
+        and not execute_state.is_column_load
+        and not execute_state.is_relationship_load
+        and not execute_state.execution_options.get("include_deleted", False)
+    ):
+        execute_state.statement = execute_state.statement.options(
+            with_loader_criteria(
+                SoftDeleteMixin,
+                lambda cls: cls.deleted_at.is_(None),
+                include_aliases=True,
+            )
+        )
+
+
+def register_soft_delete_filter(session_factory: sessionmaker) -> None:
+    """
+    세션 팩토리에 논리 삭제 필터 리스너를 등록합니다.
+
+    Args:
+        session_factory (sessionmaker): SQLAlchemy 세션 팩토리
+    """
+    event.listen(session_factory, "do_orm_execute", filter_soft_deleted)
@@ -1,13 +1,40 @@
 import json
 import importlib
 import inspect
-from functools import wraps
+from functools import lru_cache, wraps
 from sqlalchemy.orm import Session
 
 from src.provider.history_provider import HistoryProvider
 from src.provider.time_provider import TimeProvider
 
 
+@lru_cache(maxsize=None)
+def _load_history_modules(entity: str):
+    """
+    엔터티 이름을 기준으로 히스토리 도메인 클래스와 도메인 → 엔티티 매퍼를 동적으로 로딩합니다.
+    (엔터티별로 최초 1회만 로딩하고 이후에는 캐시된 결과를 사용)
+    """
+    domain_module = importlib.import_module(f"src.domain.{entity}_history_domain")
+    mapper_module = importlib.import_module(f"src.mapper.{entity}_history_mapper")
+    return getattr(domain_module, f"{entity.capitalize()}HistoryDomain"), getattr(mapper_module, "domain_to_entity")
+
+
+def _build_history_domain(DomainClass, entity: str, action: str, target_seq, before_dict, after_dict, username):
+    """
+    before/after 상태를 JSON 문자열로 직렬화하여 히스토리 도메인 객체를 생성합니다.
+    """
+    return DomainClass(
+        **{
+            f"{entity}_seq": target_seq,
+            "action_type": action,
+            "before_value": json.dumps(before_dict, default=str, sort_keys=True) if before_dict else None,
+            "after_value": json.dumps(after_dict, default=str, sort_keys=True) if after_dict else None,
+            "username": username,
+            "created_at": TimeProvider.get_kst_now(),
+        }
+    )
+
+
 def History(entity: str, action: str):
     """
     AOP 방식으로 히스토리를 자동 기록하는 데코레이터입니다.
@@ -38,6 +65,10 @@ def History(entity: str, action: str):
         History는 entity와 action이라는 파라미터를 받아서,
         실제로 히스토리를 기록하는 wrapper 함수를 반환합니다. (동적으로 wrapper를 생성)
         """
+        # 시그니처 분석은 데코레이터 적용 시 한 번만 수행
+        param_names = list(inspect.signature(func).parameters)
+        db_index = param_names.index("db") if "db" in param_names else None
+
         @wraps(func)
         def wrapper(*args, **kwargs):
             """
@@ -54,19 +85,15 @@ def History(entity: str, action: str):
             """
             from src.core.container import container
 
-            # 함수 시그니처 분석
-            sig = inspect.signature(func)
-            bound = sig.bind_partial(*args, **kwargs)
-            db: Session = bound.arguments.get("db")
+            db: Session = kwargs.get("db")
+            if db is None and db_index is not None and db_index < len(args):
+                db = args[db_index]
             if db is None:
                 raise ValueError("히스토리 저장을 위해서는 db 세션이 주입되어야 합니다.")
 
             username = kwargs.get("username")
 
-            # 서비스 함수의 시그니처 분석 (인자명 기반으로 entity_seq 추출)
-            param_names = list(sig.parameters.keys())
-
-            # 1. entity_seq 추출
+            # 1. entity_seq 추출 (인자명 기반)
             entity_seq = HistoryProvider.extract_entity_seq(entity, args, kwargs, param_names)
 
             repo = getattr(container, f"{entity}_repository")()
@@ -76,7 +103,7 @@ def History(entity: str, action: str):
             if action != "INSERT" and entity_seq:
                 before_entity = getattr(repo, f"get_{entity}_by_seq")(db, entity_seq)
                 if before_entity:
-                    before_dict = HistoryProvider.clean_dict(before_entity.__dict__.copy())
+                    before_dict = HistoryProvider.to_dict(before_entity)
 
             # 3. 서비스 함수 실행
             result = func(*args, **kwargs)
@@ -85,33 +112,57 @@ def History(entity: str, action: str):
             if action == "DELETE":
                 target_seq = entity_seq
             else:
-                after_dict = HistoryProvider.clean_dict(result.__dict__.copy())
+                after_dict = HistoryProvider.to_dict(result)
                 target_seq = result.seq
 
-            # 5. 도메인 및 매퍼 동적 로딩
-            domain_module = importlib.import_module(f"src.domain.{entity}_history_domain")
-            mapper_module = importlib.import_module(f"src.mapper.{entity}_history_mapper")
-            DomainClass = getattr(domain_module, f"{entity.capitalize()}HistoryDomain")
-            domain_to_entity = getattr(mapper_module, "domain_to_entity")
+            # 5. 도메인 클래스 로딩 (엔터티별 1회)
+            DomainClass, _ = _load_history_modules(entity)
 
             # 6. 도메인 객체 생성
-            domain = DomainClass(
-                **{
-                    f"{entity}_seq": target_seq,
-                    "action_type": action,
-                    "before_value": json.dumps(before_dict, default=str, sort_keys=True) if before_dict else None,
-                    "after_value": json.dumps(after_dict, default=str, sort_keys=True) if after_dict else None,
-                    "username": username,
-                    "created_at": TimeProvider.get_kst_now(),
-                }
-            )
-
-            # 7. 히스토리 저장
+            domain = _build_history_domain(DomainClass, entity, action, target_seq, before_dict, after_dict, username)
+
+            # 7. 히스토리 저장 (호출한 서비스의 트랜잭션 안에서 INSERT 1회, 저장된 엔티티 재조회(refresh) 없음)
             history_repo = getattr(container, f"{entity}_history_repository")()
-            history_repo.save_history(db=db, domain_obj=domain, domain_to_entity=domain_to_entity)
+            history_repo.save_histories(db=db, domain_objs=[domain])
 
             return result
 
         return wrapper
 
-    return decorator
\ No newline at end of file
+    return decorator
+
+
+def record_histories(db: Session, entity: str, action: str, changes: list, username: str | None = None) -> int:
+    """
+    대량 처리 서비스에서 여러 건의 히스토리를 한 번의 다중 행 INSERT로 기록합니다.
+    (@History는 호출 1건당 히스토리 1건을 기록하므로, 목록 단위 서비스는 이 함수를 직접 호출합니다.)
+
+    Args:
+        db (Session): 데이터베이스 세션 (호출한 서비스의 트랜잭션에 포함됨)
+        entity (str): 대상 엔터티 이름 (예: "employee")
+        action (str): 수행되는 작업 유형 ("INSERT", "UPDATE", "DELETE")
+        changes (list): (entity_seq, before 도메인, after 도메인) 튜플 목록 (없는 상태는 None)
+        username (str | None): 작업자 이름
+
+    Returns:
+        int: 기록된 히스토리 개수
+    """
+    from src.core.container import container
+
+    DomainClass, domain_to_entity = _load_history_modules(entity)
+
+    domains = [
+        _build_history_domain(
+            DomainClass,
+            entity,
+            action,
+            target_seq,
+            HistoryProvider.to_dict(before) if before else None,
+            HistoryProvider.to_dict(after) if after else None,
+            username,
+        )
+        for target_seq, before, after in changes
+    ]
+
+    history_repo = getattr(container, f"{entity}_history_repository")()
+    return history_repo.save_histories(db=db, domain_objs=domains)
@@ -2,11 +2,29 @@ import inspect
 from functools import wraps
 from sqlalchemy.orm import Session
 
+# 세션이 이미 @Transactional 범위 안에 있는지 표시하는 session.info 키
+_IN_TRANSACTION_KEY = "transactional_depth"
+
+def _has_work(db: Session) -> bool:
+    """
+    세션에 커밋/롤백할 작업이 있는지 확인합니다.
+    - 쿼리를 한 번도 실행하지 않았고 flush 대기 중인 변경도 없으면 트랜잭션이 시작되지 않은 상태이므로
+      commit()/rollback() 호출(트랜잭션 생성 및 flush 검사)을 생략할 수 있습니다.
+
+    Args:
+        db (Session): 데이터베이스 세션
+
+    Returns:
+        bool: 진행 중인 트랜잭션 또는 flush 대기 중인 변경이 있으면 True
+    """
+    return db.in_transaction() or bool(db.new or db.dirty or db.deleted)
+
 def Transactional(func):
     """
     주입된 세션(db)을 기반으로 트랜잭션을 처리하는 데코레이터.
     - 반드시 외부에서 db가 주입되어야 하며,
     - 세션 생성은 FastAPI의 Depends(get_db)를 통해 수행되어야 합니다.
+    - 이미 트랜잭션 범위 안에서 호출된 경우(중첩 호출) 커밋/롤백은 가장 바깥 호출에서만 수행합니다.
 
     Args:
         func (Callable): 트랜잭션 처리가 적용될 함수
@@ -14,6 +32,10 @@ def Transactional(func):
     Returns:
         Callable: 트랜잭션을 적용한 함수
     """
+    # 시그니처 분석은 데코레이터 적용 시 한 번만 수행
+    sig = inspect.signature(func)
+    params = list(sig.parameters)
+    db_index = params.index("db") if "db" in params else None
 
     @wraps(func)
     def wrapper(*args, **kwargs):
@@ -35,19 +57,47 @@ def Transactional(func):
         Returns:
             Any: 원래 함수의 반환값
         """
-        sig = inspect.signature(func)
-        bound = sig.bind_partial(*args, **kwargs)
-
-        db: Session = bound.arguments.get("db")
+        db: Session = kwargs.get("db")
+        if db is None and db_index is not None and db_index < len(args):
+            db = args[db_index]
 
         if db is None:
             raise ValueError("트랜잭션을 적용하려면 db 세션이 주입되어야 합니다.")
 
+        # 바깥 @Transactional이 커밋/롤백을 담당하므로 중첩 호출은 함수만 실행
+        depth = db.info.get(_IN_TRANSACTION_KEY, 0)
+        if depth:
+            return func(*args, **kwargs)
+
+        db.info[_IN_TRANSACTION_KEY] = 1
         try:
             result = func(*args, **kwargs)
-            db.commit()
+            if _has_work(db):
+                db.commit()
             return result
         except Exception as e:
-            db.rollback()
+            # 쿼리 실행 전에 검증 예외가 발생한 경우 롤백할 트랜잭션이 없으므로 생략
+            if _has_work(db):
+                db.rollback()
             raise
+        finally:
+            db.info.pop(_IN_TRANSACTION_KEY, None)
     return wrapper
+
+
+@Transactional
+def execute_transaction(db: Session, func, *args, **kwargs):
+    """
+    임의의 함수를 하나의 트랜잭션으로 실행합니다. (서비스 메서드 밖에서 개별 트랜잭션이 필요한 경우)
+    이미 트랜잭션 범위 안에서 호출되면 새 커밋 없이 바깥 트랜잭션에 합류합니다.
+
+    Args:
+        db (Session): 데이터베이스 세션
+        func (Callable): db를 첫 번째 인자로 받는 함수
+        *args: func에 전달할 위치 인자
+        **kwargs: func에 전달할 키워드 인자
+
+    Returns:
+        Any: func의 반환값
+    """
+    return func(db, *args, **kwargs)
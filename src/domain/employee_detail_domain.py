@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from src.domain.employee_domain import EmployeeDomain
+from src.domain.organization_domain import OrganizationDomain
+from src.domain.position_domain import PositionDomain
+from src.domain.rank_domain import RankDomain
+
+@dataclass(slots=True)
+class EmployeeDetailDomain:
+    employee: EmployeeDomain
+    organization: Optional[OrganizationDomain] = None
+    position: Optional[PositionDomain]         = None
+    rank: Optional[RankDomain]                 = None
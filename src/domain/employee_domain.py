@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from datetime import date, datetime
 from typing import Optional
 
-@dataclass
+@dataclass(slots=True)
 class EmployeeDomain:
     status: str
     name: str
@@ -2,7 +2,7 @@ from dataclasses import dataclass, field
 from typing import Optional,List
 from datetime import datetime
 
-@dataclass
+@dataclass(slots=True)
 class OrganizationDomain:
     name: str
     level: int
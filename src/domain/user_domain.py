@@ -3,7 +3,7 @@ from typing import Optional
 from datetime import datetime
 from pydantic import EmailStr
 
-@dataclass
+@dataclass(slots=True)
 class UserDomain:
     username: str
     email: EmailStr
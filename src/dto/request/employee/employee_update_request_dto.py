@@ -15,4 +15,23 @@ class EmployeeUpdateRequestDto(BaseModel):
     birth_date: date                  = Field(default_factory=date.today, description="생일(오늘날짜로 기본 설정)")
     incentive_yn: str                 = Field("N", description="인센티브 여부 (Y/N)")
     marketer_yn: str                  = Field("Y", description="마케터 여부 (Y/N)")
-    status: EmployeeStatusEnum        = Field(..., description="직원 상태 코드 (100: 재직, 200: 휴직, 300: 퇴사)")
\ No newline at end of file
+    status: EmployeeStatusEnum        = Field(..., description="직원 상태 코드 (100: 재직, 200: 휴직, 300: 퇴사)")
+
+class EmployeeBulkUpdateRequestDto(BaseModel):
+    """
+    여러 직원 일괄 수정 요청 항목.
+    - employee_seq 외의 모든 필드는 선택이며, 요청에 포함된 필드만 수정함 (기본값으로 덮어쓰지 않음)
+    """
+    employee_seq: int                       = Field(..., description="수정할 직원 순번")
+    position_seq: Optional[int]             = Field(None, description="직책 순번")
+    rank_seq: Optional[int]                 = Field(None, description="직위 순번")
+    organization_seq: Optional[int]         = Field(None, description="소속 조직 순번")
+    name: Optional[str]                     = Field(None, max_length=100, description="직원 이름")
+    email: Optional[EmailStr]               = Field(None, description="이메일")
+    phone_number: Optional[str]             = Field(None, max_length=20, description="핸드폰 번호")
+    extension_number: Optional[str]         = Field(None, max_length=10, description="내선 번호")
+    hire_date: Optional[date]               = Field(None, description="입사일")
+    birth_date: Optional[date]              = Field(None, description="생년월일")
+    incentive_yn: Optional[str]             = Field(None, description="인센티브 여부 (Y/N)")
+    marketer_yn: Optional[str]              = Field(None, description="마케터 여부 (Y/N)")
+    status: Optional[EmployeeStatusEnum]    = Field(None, description="직원 상태 코드 (100: 재직, 200: 휴직, 300: 퇴사)")
@@ -26,4 +26,12 @@ class TeamCreateRequestDto(BaseModel):
     name: str = Field(..., max_length=100, description="팀명")
     level: int = Field(3,          description="팀 (level=3)")
     parent_seq: int = Field(...,   description="상위 본부 ID (필수)")
-    is_visible: bool = Field(True, description="조직 표시 여부 (TRUE: 표시, FALSE: 숨김)")
\ No newline at end of file
+    is_visible: bool = Field(True, description="조직 표시 여부 (TRUE: 표시, FALSE: 숨김)")
+class OrganizationBulkCreateRequestDto(BaseModel):
+    """
+    조직 일괄 생성 요청 항목 DTO (level=1: parent_seq 없음, level=2/3: 상위 조직 ID 필수)
+    """
+    name: str = Field(..., max_length=100, description="조직명")
+    level: int = Field(..., ge=1, le=3, description="조직 수준 (1: 부문, 2: 본부, 3: 팀)")
+    parent_seq: Optional[int] = Field(None, description="상위 조직 ID (부문은 없음, 본부는 부문 ID, 팀은 본부 ID)")
+    is_visible: bool = Field(True, description="조직 표시 여부 (TRUE: 표시, FALSE: 숨김)")
@@ -1,4 +1,14 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
+
+from src.utils.security import BCRYPT_MAX_PASSWORD_BYTES
 
 class PasswordUpdateRequestDto(BaseModel):
     password: str = Field(..., min_length=6, description="새 비밀번호")
+
+    @field_validator("password")
+    @classmethod
+    def check_password_bytes(cls, value: str) -> str:
+        # bcrypt는 72바이트 이후 입력을 무시하므로 초과 비밀번호는 거부
+        if len(value.encode("utf-8")) > BCRYPT_MAX_PASSWORD_BYTES:
+            raise ValueError(f"비밀번호는 UTF-8 기준 {BCRYPT_MAX_PASSWORD_BYTES}바이트 이하여야 합니다.")
+        return value
@@ -1,4 +1,6 @@
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, EmailStr, Field, field_validator
+
+from src.utils.security import BCRYPT_MAX_PASSWORD_BYTES
 
 class UserCreateRequestDto(BaseModel):
     username: str = Field(..., max_length=50, description="회원 아이디")
@@ -6,3 +8,11 @@ class UserCreateRequestDto(BaseModel):
     password: str = Field(..., min_length=6, description="회원 비밀번호")
     type: str = Field("100", description="회원 유형")
     status: str = Field("100", description="회원 상태")
+
+    @field_validator("password")
+    @classmethod
+    def check_password_bytes(cls, value: str) -> str:
+        # bcrypt는 72바이트 이후 입력을 무시하므로 초과 비밀번호는 거부
+        if len(value.encode("utf-8")) > BCRYPT_MAX_PASSWORD_BYTES:
+            raise ValueError(f"비밀번호는 UTF-8 기준 {BCRYPT_MAX_PASSWORD_BYTES}바이트 이하여야 합니다.")
+        return value
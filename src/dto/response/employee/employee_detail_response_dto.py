@@ -0,0 +1,17 @@
+from pydantic import BaseModel, Field
+from typing import Optional
+
+from src.dto.response.employee.employee_response_dto import EmployeeResponseDto
+from src.dto.response.organization.organization_response_dto import OrganizationResponseDto
+from src.dto.response.position.position_response_dto import PositionResponseDto
+from src.dto.response.rank.rank_response_dto import RankResponseDto
+
+class EmployeeDetailResponseDto(BaseModel):
+    employee: EmployeeResponseDto                     = Field(..., description="직원 정보")
+    organization: Optional[OrganizationResponseDto]   = Field(None, description="소속 조직 정보")
+    position: Optional[PositionResponseDto]           = Field(None, description="직책 정보")
+    rank: Optional[RankResponseDto]                   = Field(None, description="직위 정보")
+
+    model_config = {
+        "from_attributes": True,  # ORM 모델에서 데이터를 읽어올 때 사용
+    }
@@ -0,0 +1,10 @@
+from typing import Generic, TypeVar, List, Optional
+from pydantic import BaseModel, Field
+
+T = TypeVar("T")
+
+class KeysetPaginatedResponseDto(BaseModel, Generic[T]):
+    items: List[T] = Field(...,              description="아이템 목록")
+    size: int = Field(...,                   description="한 페이지당 아이템 수")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 조회 커서 (마지막 페이지면 NULL)")
+    has_more: bool = Field(...,              description="다음 페이지 존재 여부")
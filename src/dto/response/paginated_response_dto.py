@@ -1,11 +1,13 @@
-from typing import Generic, TypeVar, List
+from typing import Generic, TypeVar, List, Optional
 from pydantic import BaseModel, Field
 
 T = TypeVar("T")
 
 class PaginatedResponseDto(BaseModel, Generic[T]):
-    items: List[T] = Field(...,   description="아이템 목록")
-    total: int = Field(...,       description="전체 아이템 수")
-    page: int = Field(...,        description="현재 페이지 (1-based)")
-    size: int = Field(...,        description="한 페이지당 아이템 수")
-    total_pages: int = Field(..., description="전체 페이지 수")
+    items: List[T] = Field(...,                 description="아이템 목록")
+    page: int = Field(...,                      description="현재 페이지 (1-based)")
+    size: int = Field(...,                      description="한 페이지당 아이템 수")
+    has_more: bool = Field(...,                 description="다음 페이지 존재 여부")
+    next_cursor: Optional[str] = Field(None,    description="다음 페이지 조회 커서 (마지막 페이지면 NULL, page 대신 cursor로 전달)")
+    total: Optional[int] = Field(None,          description="전체 아이템 수 (include_total=true 요청 시에만 포함)")
+    total_pages: Optional[int] = Field(None,    description="전체 페이지 수 (include_total=true 요청 시에만 포함)")
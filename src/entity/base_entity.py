@@ -1,4 +1,15 @@
+from sqlalchemy import Column, DateTime
 from sqlalchemy.ext.declarative import declarative_base
 
 # SQLAlchemy에서 ORM을 사용할 때, 테이블을 정의하고 매핑하기 위한 기반 클래스를 생성하는 함수
 Base = declarative_base()
+
+
+class SoftDeleteMixin:
+    """
+    논리 삭제(deleted_at)를 지원하는 엔티티임을 나타내는 Mixin.
+    이 Mixin을 상속한 엔티티는 목록/검색 조회 시 deleted_at IS NULL 조건이 전역으로 적용됩니다. (src.core.soft_delete 참고)
+    전역 필터의 조건식이 Mixin 클래스 기준으로도 만들어지므로 deleted_at 컬럼을 Mixin에 선언하며,
+    각 엔티티는 주석 등을 지정하기 위해 같은 이름의 컬럼으로 재정의할 수 있습니다.
+    """
+    deleted_at = Column(DateTime, nullable=True, comment="삭제일 (삭제되지 않은 경우 NULL)")
@@ -1,7 +1,8 @@
-from sqlalchemy import Column, Integer, String, Date, Enum, DateTime, func
-from src.entity.base_entity import Base
+from sqlalchemy import Index, Column, Integer, String, Date, Enum, DateTime, func
+from sqlalchemy.orm import relationship
+from src.entity.base_entity import Base, SoftDeleteMixin
 
-class EmployeeEntity(Base):
+class EmployeeEntity(Base, SoftDeleteMixin):
     __tablename__ = "employee"
 
     seq               = Column(Integer, primary_key=True, autoincrement=True, comment="직원 고유 순번")
@@ -20,3 +21,14 @@ class EmployeeEntity(Base):
     created_at        = Column(DateTime, default=func.now(), comment="직원 생성일")
     updated_at        = Column(DateTime, default=func.now(), onupdate=func.now(), comment="직원 수정일")
     deleted_at        = Column(DateTime, nullable=True, comment="퇴사일 (퇴사하지 않은 경우 NULL)")
+
+    # 소속 조직/직책/직위 (DB 외래키가 없으므로 조인 조건을 명시하며, 조회 전용으로만 사용)
+    # lazy="raise_on_sql": joinedload 등으로 함께 조회하지 않은 상태에서 접근하면 지연 로딩(N+1 쿼리) 대신 예외 발생
+    organization = relationship("OrganizationEntity", primaryjoin="foreign(EmployeeEntity.organization_seq) == OrganizationEntity.seq", viewonly=True, lazy="raise_on_sql")
+    position     = relationship("PositionEntity", primaryjoin="foreign(EmployeeEntity.position_seq) == PositionEntity.seq", viewonly=True, lazy="raise_on_sql")
+    rank         = relationship("RankEntity", primaryjoin="foreign(EmployeeEntity.rank_seq) == RankEntity.seq", viewonly=True, lazy="raise_on_sql")
+
+    __table_args__ = (
+        # 조직별 재직 직원 수 조회 시 (WHERE organization_seq = ? AND deleted_at IS NULL) 인덱스 범위 탐색으로 처리
+        Index("ix_employee_organization_seq_deleted_at", "organization_seq", "deleted_at"),
+    )
@@ -1,14 +1,28 @@
-from sqlalchemy import Column, Integer, String, DateTime, func, Boolean
-from src.entity.base_entity import Base
+from sqlalchemy import Index, Column, Integer, String, DateTime, func, Boolean
+from src.entity.base_entity import Base, SoftDeleteMixin
 
-class OrganizationEntity(Base):
+class OrganizationEntity(Base, SoftDeleteMixin):
     __tablename__ = "organization"
 
     seq        = Column(Integer,     primary_key=True, autoincrement=True, comment="조직 고유 순번")
     name       = Column(String(100), nullable=False,     comment="조직명 (부문, 본부, 팀명)")
     level      = Column(Integer,     nullable=False,     comment="조직 수준 (1: 부문, 2: 본부, 3: 팀)")
     parent_seq = Column(Integer,     nullable=True,      comment="상위 조직 순번 (부모 ID)")
+    path       = Column(String(255), nullable=True,      comment="조직 경로 (최상위부터 자신까지의 seq, 예: /1/4/17/)")
     is_visible = Column(Boolean,     default=True,       comment="조직 표시 여부 (TRUE: 표시, FALSE: 숨김)")
     created_at = Column(DateTime,    default=func.now(), comment="조직 생성일")
     updated_at = Column(DateTime,    default=func.now(), onupdate=func.now(), comment="조직 수정일")
-    deleted_at = Column(DateTime,    nullable=True,      comment="조직 삭제일 (삭제되지 않은 경우 NULL)")
\ No newline at end of file
+    deleted_at = Column(DateTime,    nullable=True,      comment="조직 삭제일 (삭제되지 않은 경우 NULL)")
+
+    __table_args__ = (
+        # 조직명 조회 시 (WHERE name = ? AND deleted_at IS NULL) 단일 인덱스 탐색으로 처리
+        Index("ix_organization_name_deleted_at", "name", "deleted_at"),
+        # 목록 조회 시 (WHERE deleted_at IS NULL ORDER BY seq LIMIT ?) 및 COUNT를 인덱스만으로 처리
+        Index("ix_organization_deleted_at_seq", "deleted_at", "seq"),
+        # level, parent_seq 필터 목록 조회 및 COUNT 시 인덱스 범위 탐색으로 처리
+        Index("ix_organization_level_parent_seq", "level", "parent_seq"),
+        # 하위 조직 존재 여부 확인 시 (WHERE parent_seq = ? AND deleted_at IS NULL) 인덱스 탐색으로 처리
+        Index("ix_organization_parent_seq_deleted_at", "parent_seq", "deleted_at"),
+        # 하위 조직 전체 조회/이동 시 (WHERE path LIKE '/1/4/%') 인덱스 범위 탐색으로 처리
+        Index("ix_organization_path", "path"),
+    )
@@ -1,7 +1,7 @@
-from sqlalchemy import Column, Integer, String, DateTime, func
-from src.entity.base_entity import Base
+from sqlalchemy import Index, Column, Integer, String, DateTime, func
+from src.entity.base_entity import Base, SoftDeleteMixin
 
-class RankEntity(Base):
+class RankEntity(Base, SoftDeleteMixin):
     __tablename__ = "rank"
 
     seq = Column(Integer, primary_key=True, autoincrement=True, comment="직위 고유 순번")
@@ -10,3 +10,10 @@ class RankEntity(Base):
     created_at = Column(DateTime, default=func.now(), comment="직위 생성일")
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now(), comment="직위 수정일")
     deleted_at = Column(DateTime, nullable=True,      comment="직위 삭제일 (삭제되지 않은 경우 NULL)")
+
+    __table_args__ = (
+        # 직위명 조회 시 (WHERE title = ? AND deleted_at IS NULL) 단일 인덱스 탐색으로 처리
+        Index("ix_rank_title_deleted_at", "title", "deleted_at"),
+        # 목록 조회 시 (WHERE deleted_at IS NULL ORDER BY seq LIMIT ?) 및 COUNT를 인덱스만으로 처리
+        Index("ix_rank_deleted_at_seq", "deleted_at", "seq"),
+    )
@@ -1,7 +1,7 @@
 from sqlalchemy import Column, Integer, String, DateTime, func
-from src.entity.base_entity import Base
+from src.entity.base_entity import Base, SoftDeleteMixin
 
-class UserEntity(Base):
+class UserEntity(Base, SoftDeleteMixin):
     __tablename__ = "users"
 
     seq      = Column(Integer, primary_key=True, autoincrement=True, index=True, comment="회원 고유 순번")
@@ -42,4 +42,8 @@ class EmployeesExistInOrganizationException(HTTPException):
 
 class OrganizationUpdateDataNotFoundException(HTTPException):
     def __init__(self):
-        super().__init__(status_code=status.HTTP_400_BAD_REQUEST, detail="수정할 데이터가 없습니다.")
\ No newline at end of file
+        super().__init__(status_code=status.HTTP_400_BAD_REQUEST, detail="수정할 데이터가 없습니다.")
+
+class InvalidOrganizationMoveException(HTTPException):
+    def __init__(self):
+        super().__init__(status_code=status.HTTP_400_BAD_REQUEST, detail="조직을 자기 자신 또는 하위 조직 아래로 이동할 수 없습니다.")
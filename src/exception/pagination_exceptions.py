@@ -0,0 +1,5 @@
+from fastapi import HTTPException, status
+
+class InvalidCursorException(HTTPException):
+    def __init__(self):
+        super().__init__(status_code=status.HTTP_400_BAD_REQUEST, detail="유효하지 않은 페이지 커서입니다.")
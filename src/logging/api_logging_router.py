@@ -1,4 +1,5 @@
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
 from src.logging.logging_route_for_request_response import LoggingRouteForRequestResponse
 
 
@@ -22,5 +23,8 @@ class APILoggingRouter(APIRouter):
         if not debug:
             kwargs.setdefault("route_class", LoggingRouteForRequestResponse)
 
+        # 응답 직렬화는 표준 json 대신 orjson 사용 (datetime 등도 네이티브로 직렬화)
+        kwargs.setdefault("default_response_class", ORJSONResponse)
+
         # APIRouter 초기화
         super().__init__(*args, **kwargs)
@@ -1,17 +1,72 @@
+import atexit
+import copy
 import logging
-from logging.handlers import TimedRotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 from pathlib import Path
 from datetime import datetime
 import sys
 
 from src.core.settings import settings
+from src.logging.context.request_logging_context import RequestLoggingContext
 from src.logging.formatter.formatter_strategies import FormatterFactory
 
 
+class _ContextQueueHandler(QueueHandler):
+    """
+    로그 레코드를 큐에 넣기만 하는 핸들러입니다.
+    포매팅은 백그라운드 리스너 스레드에서 수행되므로, 요청 스레드에서는
+    컨텍스트(trace_id)만 레코드에 고정하고 메시지 포매팅은 하지 않습니다.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        # 리스너 스레드에서는 요청 컨텍스트를 알 수 없으므로 큐에 넣기 전에 trace_id를 기록
+        if not hasattr(record, "trace_id"):
+            record.trace_id = RequestLoggingContext.get_trace_id()
+        return record
+
+
+class _LoggerDispatchHandler(logging.Handler):
+    """
+    리스너 스레드에서 레코드를 로거 이름별 실제 핸들러(파일/콘솔)로 전달하는 핸들러입니다.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._handlers: dict[str, list[logging.Handler]] = {}
+
+    def register(self, name: str, handlers: list[logging.Handler]) -> None:
+        self._handlers[name] = handlers
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        for handler in self._handlers.get(record.name, ()):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        return True
+
+    def close(self) -> None:
+        for handlers in self._handlers.values():
+            for handler in handlers:
+                handler.close()
+        super().close()
+
+
+# 모든 도메인 로거가 공유하는 로그 큐와 백그라운드 리스너 (프로세스당 하나)
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_queue_handler = _ContextQueueHandler(_log_queue)
+_dispatch_handler = _LoggerDispatchHandler()
+_listener = QueueListener(_log_queue, _dispatch_handler)
+_listener.start()
+# 종료 시 큐에 남은 로그를 모두 기록한 뒤 리스너 스레드를 정리
+atexit.register(_listener.stop)
+
+
 class LoggingConfig:
     """
     환경별로 도메인 기반 로거를 생성하고,
     설정에 따라 콘솔/파일 핸들러를 분리해 적용하는 로깅 설정 클래스입니다.
+    로거에는 큐 핸들러만 연결되며, 포매팅과 파일/콘솔 출력은 백그라운드 리스너 스레드에서 수행됩니다.
     """
 
     def __init__(self):
@@ -95,13 +150,18 @@ class LoggingConfig:
         )
 
         file_handler.setFormatter(self.formatter)
-        logger.addHandler(file_handler)
+        handlers: list[logging.Handler] = [file_handler]
 
         # 콘솔 핸들러 추가 (설정값에 따라)
         if settings.LOG_TO_CONSOLE:
             console_handler = logging.StreamHandler(sys.stdout)
             console_handler.setLevel(level)
             console_handler.setFormatter(self.console_formatter)
-            logger.addHandler(console_handler)
+            handlers.append(console_handler)
+
+        # 실제 출력 핸들러는 리스너 스레드에 등록하고, 로거에는 공유 큐 핸들러만 연결
+        _dispatch_handler.register(name, handlers)
+        if _queue_handler not in logger.handlers:
+            logger.addHandler(_queue_handler)
 
         return logger
@@ -83,11 +83,12 @@ class RequestLoggingContext:
         기본 로거와 새로운 trace_id를 설정합니다.
         (예: 요청 스코프가 사라졌거나 예외 발생 후 복구 상황)
         """
-        from src.logging.config.logging_config import LoggingConfig
+        from src.core.container import container
         import uuid
 
         trace_id = str(uuid.uuid4())[:8]  # 간단한 trace_id 생성
-        base_logger = LoggingConfig().get_logger("default")
+        # 공유 LoggingConfig의 캐시된 로거 사용 (호출마다 핸들러를 새로 구성하지 않음)
+        base_logger = container.logger_config().get_logger("default")
         default_logger = StructuredLoggingAdapter(base_logger, trace_id)
 
         cls._logger_var.set(default_logger)
@@ -1,6 +1,7 @@
 from fastapi.routing import APIRoute
 from fastapi.requests import Request
 from fastapi.responses import Response
+import logging
 import time
 import uuid
 
@@ -20,31 +21,39 @@ class LoggingRouteForRequestResponse(APIRoute):
     """
 
     def get_route_handler(self):
-        # 기존 라우트 핸들러 가져오기
+        # 기존 라우트 핸들러 가져오기 (의존성 트리는 APIRoute 생성 시 한 번만 구성됨)
         original_handler = super().get_route_handler()
 
+        # 라우트마다 고정된 값은 등록 시 한 번만 계산
+        logging_router_provider = LoggingRouterProvider()
+
+        # 라우트 경로로부터 도메인 추출 (ex: "/v1/user/{user_seq}" → "user")
+        domain = logging_router_provider.extract_domain_from_path(self.path_format)
+
+        # 엔드포인트 함수 이름 추출
+        handler_name = logging_router_provider.resolve_handler_name(self.endpoint)
+
+        # 도메인/slow_query 로거는 라우트마다 첫 요청에서 한 번만 조회하여 재사용
+        loggers: tuple[logging.Logger, logging.Logger] | None = None
+
         async def custom_handler(request: Request) -> Response:
-            # 의존성 주입 컨테이너
-            from src.core.container import container
+            nonlocal loggers
+            if loggers is None:
+                # 의존성 주입 컨테이너
+                from src.core.container import container
 
-            logging_router_provider = LoggingRouterProvider()
+                logger_config: LoggingConfig = container.logger_config()
+                loggers = (logger_config.get_logger(domain), logger_config.get_logger("slow_query"))
+            domain_logger, slow_query_logger = loggers
 
             # 요청 시작 시간
             start_time = time.time()
             # 짧은 trace_id 생성
             trace_id = str(uuid.uuid4())[:8]
 
-            # 요청 경로로부터 도메인 추출 (ex: "/user/login" → "user")
-            domain = logging_router_provider.extract_domain_from_path(str(request.url.path))
-
-            # 엔드포인트 함수 이름 추출
-            handler_name = logging_router_provider.resolve_handler_name(self.endpoint)
-
-            # 도메인별 로거 설정 및 trace_id 포함한 StructuredLogger 생성
-            logger_config: LoggingConfig = container.logger_config()
-
-            logger = StructuredLoggingAdapter(logger_config.get_logger(domain), trace_id)
-            slow_logger = logger.clone_with_logger(logger_config.get_logger("slow_query"))
+            # trace_id 포함한 StructuredLogger 생성
+            logger = StructuredLoggingAdapter(domain_logger, trace_id)
+            slow_logger = logger.clone_with_logger(slow_query_logger)
 
             # 요청 컨텍스트에 로거 설정
             RequestLoggingContext.set(logger)
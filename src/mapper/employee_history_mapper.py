@@ -1,6 +1,11 @@
+from dataclasses import fields
+from operator import attrgetter
 from src.entity.employee_history_entity import EmployeeHistoryEntity
 from src.domain.employee_history_domain import EmployeeHistoryDomain
 
+# 도메인 필드 선언 순서대로 엔티티 속성을 한 번에 조회하는 getter
+_FIELDS = attrgetter(*(field.name for field in fields(EmployeeHistoryDomain)))
+
 def entity_to_domain(employee_history_entity: EmployeeHistoryEntity) -> EmployeeHistoryDomain:
     """
     (ORM 엔티티 → 도메인 객체 변환)
@@ -9,15 +14,7 @@ def entity_to_domain(employee_history_entity: EmployeeHistoryEntity) -> Employee
     Domain은 비즈니스 로직을 수행하는 도메인 객체입니다.
     도메인 계층에서 데이터베이스 종속성을 줄이기 위해 Domain으로 변환하여 사용합니다.
     """
-    return EmployeeHistoryDomain(
-        seq=employee_history_entity.seq,
-        employee_seq=employee_history_entity.employee_seq,
-        action_type=employee_history_entity.action_type,
-        before_value=employee_history_entity.before_value,
-        after_value=employee_history_entity.after_value,
-        username=employee_history_entity.username,
-        created_at=employee_history_entity.created_at
-    )
+    return EmployeeHistoryDomain(*_FIELDS(employee_history_entity))
 
 def domain_to_entity(employee_history_domain: EmployeeHistoryDomain) -> EmployeeHistoryEntity:
     """
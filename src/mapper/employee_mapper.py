@@ -1,5 +1,12 @@
+from dataclasses import fields
+from operator import attrgetter
+from src.domain.employee_detail_domain import EmployeeDetailDomain
 from src.domain.employee_domain import EmployeeDomain
 from src.entity.employee_entity import EmployeeEntity
+from src.mapper import organization_mapper, position_mapper, rank_mapper
+
+# 도메인 필드 선언 순서대로 엔티티 속성을 한 번에 조회하는 getter
+_FIELDS = attrgetter(*(field.name for field in fields(EmployeeDomain)))
 
 def entity_to_domain(employee_entity: EmployeeEntity) -> EmployeeDomain:
     """
@@ -9,23 +16,22 @@ def entity_to_domain(employee_entity: EmployeeEntity) -> EmployeeDomain:
     Domain은 비즈니스 로직을 수행하는 도메인 객체입니다.
     도메인 계층에서 데이터베이스 종속성을 줄이기 위해 Domain으로 변환하여 사용합니다.
     """
-    return EmployeeDomain(
-        seq              = employee_entity.seq,
-        position_seq     = employee_entity.position_seq,
-        rank_seq         = employee_entity.rank_seq,
-        organization_seq = employee_entity.organization_seq,
-        status           = employee_entity.status,
-        name             = employee_entity.name,
-        email            = employee_entity.email,
-        phone_number     = employee_entity.phone_number,
-        extension_number = employee_entity.extension_number,
-        hire_date        = employee_entity.hire_date,
-        birth_date       = employee_entity.birth_date,
-        incentive_yn     = employee_entity.incentive_yn,
-        marketer_yn      = employee_entity.marketer_yn,
-        created_at       = employee_entity.created_at,
-        updated_at       = employee_entity.updated_at,
-        deleted_at       = employee_entity.deleted_at,
+    return EmployeeDomain(*_FIELDS(employee_entity))
+
+def entity_to_detail_domain(employee_entity: EmployeeEntity) -> EmployeeDetailDomain:
+    """
+    (ORM 엔티티 → 상세 도메인 객체 변환)
+    연관 조직/직책/직위가 함께 로딩된 직원 Entity를 상세 도메인 객체로 변환합니다.
+    연관 데이터가 없으면 해당 필드는 None 입니다.
+    """
+    organization = employee_entity.organization
+    position = employee_entity.position
+    rank = employee_entity.rank
+    return EmployeeDetailDomain(
+        employee     = entity_to_domain(employee_entity),
+        organization = organization_mapper.entity_to_domain(organization) if organization else None,
+        position     = position_mapper.entity_to_domain(position) if position else None,
+        rank         = rank_mapper.entity_to_domain(rank) if rank else None,
     )
 
 def domain_to_entity(employee_domain: EmployeeDomain) -> EmployeeEntity:
@@ -49,3 +55,24 @@ def domain_to_entity(employee_domain: EmployeeDomain) -> EmployeeEntity:
         created_at       = employee_domain.created_at,
         updated_at       = employee_domain.updated_at,
     )
+
+def domain_to_mapping(employee_domain: EmployeeDomain) -> dict:
+    """
+    (도메인 객체 → 컬럼 딕셔너리 변환)
+    대량 INSERT(bulk insert)에 사용할 컬럼명-값 딕셔너리로 변환합니다.
+    created_at, updated_at은 제외하여 컬럼 기본값(func.now())이 적용되도록 합니다.
+    """
+    return {
+        "position_seq":     employee_domain.position_seq,
+        "rank_seq":         employee_domain.rank_seq,
+        "organization_seq": employee_domain.organization_seq,
+        "status":           employee_domain.status,
+        "name":             employee_domain.name,
+        "email":            employee_domain.email,
+        "phone_number":     employee_domain.phone_number,
+        "extension_number": employee_domain.extension_number,
+        "hire_date":        employee_domain.hire_date,
+        "birth_date":       employee_domain.birth_date,
+        "incentive_yn":     employee_domain.incentive_yn,
+        "marketer_yn":      employee_domain.marketer_yn,
+    }
@@ -1,6 +1,11 @@
+from dataclasses import fields
+from operator import attrgetter
 from src.entity.organization_history_entity import OrganizationHistoryEntity
 from src.domain.organization_history_domain import OrganizationHistoryDomain
 
+# 도메인 필드 선언 순서대로 엔티티 속성을 한 번에 조회하는 getter
+_FIELDS = attrgetter(*(field.name for field in fields(OrganizationHistoryDomain)))
+
 def entity_to_domain(organization_history_entity: OrganizationHistoryEntity) -> OrganizationHistoryDomain:
     """
     (ORM 엔티티 → 도메인 객체 변환)
@@ -9,15 +14,7 @@ def entity_to_domain(organization_history_entity: OrganizationHistoryEntity) ->
     Domain은 비즈니스 로직을 수행하는 도메인 객체입니다.
     도메인 계층에서 데이터베이스 종속성을 줄이기 위해 Domain으로 변환하여 사용합니다.
     """
-    return OrganizationHistoryDomain(
-        seq=organization_history_entity.seq,
-        organization_seq=organization_history_entity.organization_seq,
-        action_type=organization_history_entity.action_type,
-        before_value=organization_history_entity.before_value,
-        after_value=organization_history_entity.after_value,
-        username=organization_history_entity.username,
-        created_at=organization_history_entity.created_at
-    )
+    return OrganizationHistoryDomain(*_FIELDS(organization_history_entity))
 
 def domain_to_entity(organization_history_domain: OrganizationHistoryDomain) -> OrganizationHistoryEntity:
     """
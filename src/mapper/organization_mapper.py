@@ -1,6 +1,11 @@
+from dataclasses import fields
+from operator import attrgetter
 from src.domain.organization_domain import OrganizationDomain
 from src.entity.organization_entity import OrganizationEntity
 
+# 도메인 필드 선언 순서대로 엔티티 속성을 한 번에 조회하는 getter (children 제외)
+_FIELDS = attrgetter(*(field.name for field in fields(OrganizationDomain) if field.name != "children"))
+
 
 def entity_to_domain(organization_entity: OrganizationEntity) -> OrganizationDomain:
     """
@@ -10,16 +15,7 @@ def entity_to_domain(organization_entity: OrganizationEntity) -> OrganizationDom
     Domain은 비즈니스 로직을 수행하는 도메인 객체입니다.
     도메인 계층에서 데이터베이스 종속성을 줄이기 위해 Domain으로 변환하여 사용합니다.
     """
-    return OrganizationDomain(
-        seq=organization_entity.seq,
-        name=organization_entity.name,
-        level=organization_entity.level,
-        parent_seq=organization_entity.parent_seq,
-        is_visible=organization_entity.is_visible,
-        created_at=organization_entity.created_at,
-        updated_at=organization_entity.updated_at,
-        deleted_at=organization_entity.deleted_at,
-    )
+    return OrganizationDomain(*_FIELDS(organization_entity))
 
 
 def domain_to_entity(organization_domain: OrganizationDomain) -> OrganizationEntity:
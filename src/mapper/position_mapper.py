@@ -1,7 +1,12 @@
+from dataclasses import fields
+from operator import attrgetter
 from src.entity.position_entity import PositionEntity
 from src.domain.position_domain import PositionDomain
 from src.dto.request.position.position_update_request_dto import PositionUpdateRequestDto
 
+# 도메인 필드 선언 순서대로 엔티티 속성을 한 번에 조회하는 getter
+_FIELDS = attrgetter(*(field.name for field in fields(PositionDomain)))
+
 def entity_to_domain(position_entity: PositionEntity) -> PositionDomain:
     """
     (ORM 엔티티 → 도메인 객체 변환)
@@ -10,15 +15,7 @@ def entity_to_domain(position_entity: PositionEntity) -> PositionDomain:
     Domain은 비즈니스 로직을 수행하는 도메인 객체입니다.
     도메인 계층에서 데이터베이스 종속성을 줄이기 위해 Domain으로 변환하여 사용합니다.
     """
-    return PositionDomain(
-        seq=position_entity.seq,
-        title=position_entity.title,
-        role_seq=position_entity.role_seq,
-        description=position_entity.description,
-        created_at=position_entity.created_at,
-        updated_at=position_entity.updated_at,
-        deleted_at=position_entity.deleted_at,
-    )
+    return PositionDomain(*_FIELDS(position_entity))
 
 def domain_to_entity(position_domain: PositionDomain) -> PositionEntity:
     """
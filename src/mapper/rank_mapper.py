@@ -1,6 +1,11 @@
+from dataclasses import fields
+from operator import attrgetter
 from src.domain.rank_domain import RankDomain
 from src.entity.rank_entity import RankEntity
 
+# 도메인 필드 선언 순서대로 엔티티 속성을 한 번에 조회하는 getter
+_FIELDS = attrgetter(*(field.name for field in fields(RankDomain)))
+
 
 def entity_to_domain(rank_entity: RankEntity) -> RankDomain:
     """
@@ -10,14 +15,7 @@ def entity_to_domain(rank_entity: RankEntity) -> RankDomain:
     Domain은 비즈니스 로직을 수행하는 도메인 객체입니다.
     도메인 계층에서 데이터베이스 종속성을 줄이기 위해 Domain으로 변환하여 사용합니다.
     """
-    return RankDomain(
-        seq=rank_entity.seq,
-        title=rank_entity.title,
-        description=rank_entity.description,
-        created_at=rank_entity.created_at,
-        updated_at=rank_entity.updated_at,
-        deleted_at=rank_entity.deleted_at,
-    )
+    return RankDomain(*_FIELDS(rank_entity))
 
 
 def domain_to_entity(rank_domain: RankDomain) -> RankEntity:
@@ -1,6 +1,11 @@
+from dataclasses import fields
+from operator import attrgetter
 from src.domain.user_domain import UserDomain
 from src.entity.user_entity import UserEntity
 
+# 도메인 필드 선언 순서대로 엔티티 속성을 한 번에 조회하는 getter
+_FIELDS = attrgetter(*(field.name for field in fields(UserDomain)))
+
 def entity_to_domain(user_entity: UserEntity) -> UserDomain:
     """
     (ORM 엔티티 → 도메인 객체 변환)
@@ -9,19 +14,7 @@ def entity_to_domain(user_entity: UserEntity) -> UserDomain:
     Domain은 비즈니스 로직을 수행하는 도메인 객체입니다.
     도메인 계층에서 데이터베이스 종속성을 줄이기 위해 Domain으로 변환하여 사용합니다.
     """
-    return UserDomain(
-        seq=user_entity.seq,
-        username=user_entity.username,
-        email=user_entity.email,
-        type=user_entity.type,
-        status=user_entity.status,
-        password = user_entity.password,
-        current_refresh_token=user_entity.current_refresh_token,
-        created_at=user_entity.created_at,
-        updated_at=user_entity.updated_at,
-        deleted_at=user_entity.deleted_at
-
-    )
+    return UserDomain(*_FIELDS(user_entity))
 
 def domain_to_entity(user_domain: UserDomain, password: str) -> UserEntity:
     """
@@ -0,0 +1,130 @@
+import asyncio
+from typing import Dict, FrozenSet, Optional, Tuple
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# 중복 요청 합치기를 적용할 조회 API 경로
+# ("/v1/employee" 접두사가 "/v1/employee-history"도 포함)
+SINGLEFLIGHT_PATH_PREFIXES = (
+    "/v1/employee",
+    "/v1/organization-history",
+)
+
+# 접두사가 일치해도 적용하지 않는 경로 (스트리밍 응답은 본문 전체를 모아 공유할 수 없음)
+SINGLEFLIGHT_EXCLUDED_PATHS = frozenset({
+    "/v1/employee/stream",
+})
+
+# (status, headers, body)
+CapturedResponse = Tuple[int, list, bytes]
+
+
+class SingleflightMiddleware:
+    """
+    동일한 GET 요청이 동시에 여러 번 들어오면 한 번만 처리하고, 그 응답을 나머지 요청에 함께 전달하는 ASGI 미들웨어입니다.
+
+    - 키: 메서드 + 경로 + 쿼리 문자열 + Authorization + If-None-Match (사용자/조건부 요청별로 구분)
+    - 먼저 들어온 요청(leader)만 엔드포인트를 실행하고, 처리 중에 들어온 같은 키의 요청은 그 결과를 기다렸다가 재사용합니다.
+    - 처리가 끝나면 키를 즉시 제거하므로, 결과를 캐싱하지 않고 "동시에 처리 중인" 요청만 합칩니다.
+    - 요청에 `Cache-Control: no-store`가 있으면 적용하지 않습니다.
+    - 제외 경로(스트리밍 API)는 적용하지 않으며, 응답 본문이 여러 조각으로 나뉘어 전송되면(more_body)
+      본문을 모으지 않고 그대로 전달합니다. (기다리던 요청은 각자 다시 처리)
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        path_prefixes: Tuple[str, ...] = SINGLEFLIGHT_PATH_PREFIXES,
+        excluded_paths: FrozenSet[str] = SINGLEFLIGHT_EXCLUDED_PATHS,
+    ):
+        self.app = app
+        self.path_prefixes = path_prefixes
+        self.excluded_paths = excluded_paths
+        self._in_flight: Dict[tuple, asyncio.Future] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "GET"
+            or not scope["path"].startswith(self.path_prefixes)
+            or scope["path"] in self.excluded_paths
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        if "no-store" in headers.get("cache-control", ""):
+            await self.app(scope, receive, send)
+            return
+
+        key = (
+            scope["path"],
+            scope["query_string"],
+            headers.get("authorization"),
+            headers.get("if-none-match"),
+        )
+
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            captured: Optional[CapturedResponse] = await asyncio.shield(in_flight)
+            if captured is not None:
+                await self._replay(send, captured)
+                return
+            # leader 처리 중 예외가 발생했거나 스트리밍 응답이었던 경우, 각자 다시 처리
+            await self.app(scope, receive, send)
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+
+        status_code = 500
+        response_headers: list = []
+        body_chunks: list = []
+        streaming = False
+
+        async def capture_send(message: Message) -> None:
+            nonlocal status_code, response_headers, streaming
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                response_headers = list(message.get("headers", []))
+            elif message["type"] == "http.response.body" and not streaming:
+                if message.get("more_body", False):
+                    # 스트리밍 응답은 본문을 메모리에 모으지 않고 그대로 전달만 함
+                    streaming = True
+                    body_chunks.clear()
+                else:
+                    body_chunks.append(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, capture_send)
+        except BaseException:
+            future.set_result(None)
+            raise
+        else:
+            future.set_result(None if streaming else (status_code, response_headers, b"".join(body_chunks)))
+        finally:
+            self._in_flight.pop(key, None)
+
+    @staticmethod
+    async def _replay(send: Send, captured: CapturedResponse) -> None:
+        """
+        leader 요청에서 기록한 응답을 그대로 전송합니다.
+        """
+        status_code, headers, body = captured
+        await send({"type": "http.response.start", "status": status_code, "headers": headers})
+        await send({"type": "http.response.body", "body": body, "more_body": False})
+
+
+def setup_singleflight(app):
+    """
+    FastAPI 앱에 동시 중복 GET 요청 합치기(Singleflight) 미들웨어를 설정합니다.
+
+    CORS 미들웨어보다 먼저 등록하여 안쪽에 위치시킵니다.
+    (CORS 헤더는 재사용된 응답에도 요청별 Origin 기준으로 다시 설정됨)
+
+    Args:
+        app: 미들웨어를 적용할 FastAPI 애플리케이션 인스턴스
+    """
+    app.add_middleware(SingleflightMiddleware)
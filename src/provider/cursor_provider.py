@@ -0,0 +1,83 @@
+import base64
+import json
+from typing import Any, Optional, Sequence, Tuple
+
+from src.exception.pagination_exceptions import InvalidCursorException
+
+# 커서의 last_val로 허용하는 값 타입 (정렬 컬럼 값은 JSON 스칼라로만 인코딩됨)
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+class CursorProvider:
+    """
+    키셋(Keyset) 페이지네이션에 사용하는 커서의 생성 및 해석을 담당하는 클래스
+    커서는 마지막으로 조회한 항목의 {"last_seq", "last_val"}을 JSON 직렬화 후 URL-safe base64로 인코딩한 문자열이다.
+    """
+
+    @staticmethod
+    def encode(last_seq: int, last_val: Any = None) -> str:
+        """
+        마지막 항목의 seq와 정렬 컬럼 값을 커서 문자열로 인코딩합니다.
+
+        Args:
+            last_seq (int): 마지막 항목의 seq
+            last_val (Any): 마지막 항목의 정렬 컬럼 값 (날짜/시간 등은 문자열로 변환)
+
+        Returns:
+            str: 인코딩된 커서 문자열
+        """
+        payload = json.dumps({"last_seq": last_seq, "last_val": last_val}, default=str, separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+    @staticmethod
+    def decode(cursor: Optional[str]) -> Optional[Tuple[int, Any]]:
+        """
+        커서 문자열을 (last_seq, last_val) 튜플로 디코딩합니다.
+
+        Args:
+            cursor (Optional[str]): 인코딩된 커서 문자열 (첫 페이지는 None)
+
+        Returns:
+            Optional[Tuple[int, Any]]: (last_seq, last_val), 커서가 없으면 None
+
+        Raises:
+            InvalidCursorException: 커서 형식이 올바르지 않거나 last_val이 스칼라 값이 아닌 경우
+        """
+        if not cursor:
+            return None
+
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+            last_seq = payload["last_seq"]
+        except (ValueError, TypeError, KeyError):
+            raise InvalidCursorException()
+
+        if not isinstance(last_seq, int) or isinstance(last_seq, bool):
+            raise InvalidCursorException()
+
+        # 배열/객체 값은 정렬 컬럼 값이 될 수 없으며, 해시 불가능한 값이 캐시 키 등에 사용되지 않도록 거부
+        last_val = payload.get("last_val")
+        if not isinstance(last_val, _SCALAR_TYPES):
+            raise InvalidCursorException()
+
+        return last_seq, last_val
+
+    @staticmethod
+    def next_cursor(items: Sequence[Any], has_more: bool, sort_by: Optional[str] = None) -> Optional[str]:
+        """
+        조회된 목록의 마지막 항목으로 다음 페이지 커서를 생성합니다.
+
+        Args:
+            items (Sequence[Any]): 조회된 항목 목록 (seq 속성 필요)
+            has_more (bool): 다음 페이지 존재 여부
+            sort_by (Optional[str]): 정렬 컬럼명 (None이면 seq 기준)
+
+        Returns:
+            Optional[str]: 다음 페이지 커서, 다음 페이지가 없으면 None
+        """
+        if not has_more or not items:
+            return None
+
+        last_item = items[-1]
+        last_val = getattr(last_item, sort_by) if sort_by else None
+        return CursorProvider.encode(last_item.seq, last_val)
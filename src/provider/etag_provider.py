@@ -0,0 +1,80 @@
+import hashlib
+from typing import Any, Optional
+
+from fastapi import Request, status
+from fastapi.responses import Response
+
+
+class EtagProvider:
+    """
+    조회(GET) API의 HTTP 조건부 요청(ETag / If-None-Match) 처리를 담당하는 클래스
+    클라이언트가 보낸 ETag가 현재 데이터의 ETag와 같으면, 응답 본문 없이 304 Not Modified를 반환하여
+    데이터 조회 및 직렬화를 생략할 수 있도록 합니다.
+    """
+
+    # 브라우저/클라이언트 캐시 정책 (공유 캐시 저장 금지, 10초 동안 재검증 없이 사용)
+    CACHE_CONTROL = "private, max-age=10"
+
+    @staticmethod
+    def make(*parts: Any) -> str:
+        """
+        데이터의 버전을 나타내는 값들로 약한(Weak) ETag를 생성합니다.
+
+        Args:
+            *parts (Any): ETag 계산에 사용할 값 (예: seq, updated_at, 조회 조건)
+
+        Returns:
+            str: W/"..." 형식의 ETag 문자열
+        """
+        digest = hashlib.sha1("|".join(map(str, parts)).encode("utf-8")).hexdigest()
+        return f'W/"{digest}"'
+
+    @staticmethod
+    def is_requested(request: Request) -> bool:
+        """
+        요청에 If-None-Match 헤더가 포함되어 있는지 확인합니다.
+        (헤더가 없으면 ETag 비교를 위한 사전 조회를 생략할 수 있음)
+        """
+        return "if-none-match" in request.headers
+
+    @staticmethod
+    def not_modified(request: Request, etag: Optional[str]) -> Optional[Response]:
+        """
+        If-None-Match 헤더가 현재 ETag와 일치하면 304 응답을 반환합니다.
+
+        Args:
+            request (Request): 현재 요청
+            etag (Optional[str]): 현재 데이터의 ETag (데이터가 없으면 None)
+
+        Returns:
+            Optional[Response]: 일치하면 304 응답, 그렇지 않으면 None
+        """
+        if etag is None:
+            return None
+
+        if_none_match = request.headers.get("if-none-match")
+        if not if_none_match:
+            return None
+
+        candidates = {candidate.strip() for candidate in if_none_match.split(",")}
+        if etag not in candidates and "*" not in candidates:
+            return None
+
+        return EtagProvider.attach(Response(status_code=status.HTTP_304_NOT_MODIFIED), etag)
+
+    @staticmethod
+    def attach(response: Response, etag: Optional[str]) -> Response:
+        """
+        응답에 ETag 및 Cache-Control 헤더를 설정합니다.
+
+        Args:
+            response (Response): 헤더를 설정할 응답
+            etag (Optional[str]): 설정할 ETag (None이면 설정하지 않음)
+
+        Returns:
+            Response: 헤더가 설정된 응답
+        """
+        if etag is not None:
+            response.headers["ETag"] = etag
+            response.headers["Cache-Control"] = EtagProvider.CACHE_CONTROL
+        return response
@@ -1,3 +1,6 @@
+import dataclasses
+
+
 class HistoryProvider:
     """
     히스토리에서 사용하는 유틸리티 함수를 제공하는 클래스
@@ -31,6 +34,24 @@ class HistoryProvider:
                     break
         return entity_seq
 
+    @staticmethod
+    def to_dict(obj) -> dict:
+        """
+        도메인 객체 또는 SQLAlchemy ORM 객체의 필드 값을 내부 상태 필드를 제거한 딕셔너리로 반환합니다.
+        도메인 객체는 __slots__ dataclass이므로 __dict__ 대신 필드 목록으로 값을 읽습니다.
+
+        Args:
+            obj: 도메인 객체(dataclass) 또는 ORM 엔티티 객체
+
+        Returns:
+            dict: 필드명 → 값 딕셔너리
+        """
+        if dataclasses.is_dataclass(obj):
+            data = {field.name: getattr(obj, field.name) for field in dataclasses.fields(obj)}
+        else:
+            data = obj.__dict__.copy()
+        return HistoryProvider.clean_dict(data)
+
     @staticmethod
     def clean_dict(data: dict) -> dict:
         """
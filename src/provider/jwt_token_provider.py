@@ -1,10 +1,32 @@
+import base64
+import hashlib
+import hmac
+import time
 import jwt
+import orjson
 from datetime import timedelta
 from src.core.settings import settings
 from src.exception.token_exceptions import (
     TokenExpiredException, InvalidTokenException, InvalidTokenSubjectMissingException
 )
 from src.provider.time_provider import TimeProvider
+from src.utils.ttl_cache import TTLCache
+
+# 검증이 끝난 토큰의 payload 캐시 (토큰 원문 대신 SHA-256 해시 앞 16바이트를 키로 사용)
+TOKEN_CACHE_TTL_SECONDS = 30
+_token_cache = TTLCache(maxsize=10000, ttl=TOKEN_CACHE_TTL_SECONDS)
+
+# 서명 키는 요청마다 인코딩하지 않도록 모듈 로딩 시 bytes로 한 번만 변환
+_SECRET_KEY = settings.JWT_SECRET.encode("utf-8")
+
+
+def _b64url(data: bytes) -> bytes:
+    """ JWT 규격의 base64url 인코딩 (패딩 '=' 제거) """
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+# HS256 토큰의 헤더 세그먼트는 항상 같으므로 미리 인코딩
+_HS256_HEADER_SEGMENT = _b64url(orjson.dumps({"alg": "HS256", "typ": "JWT"}))
 
 class JwtTokenProvider:
     """
@@ -23,7 +45,7 @@ class JwtTokenProvider:
             "scope": "access"
         }
 
-        return jwt.encode(payload, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
+        return JwtTokenProvider._encode(payload)
 
     @staticmethod
     def generate_refresh_token(username: str) -> str:
@@ -37,13 +59,32 @@ class JwtTokenProvider:
             "scope": "refresh"
         }
 
-        return jwt.encode(payload, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
+        return JwtTokenProvider._encode(payload)
+
+    @staticmethod
+    def _encode(payload: dict) -> str:
+        """
+        payload를 서명하여 JWT 문자열을 생성합니다.
+        HS256은 미리 인코딩한 헤더와 hmac으로 직접 서명하여 PyJWT의 헤더 구성/키 변환/알고리즘 조회를 생략하고,
+        그 외 알고리즘은 PyJWT로 생성합니다. (결과는 jwt.decode로 그대로 검증 가능)
+        """
+        if settings.JWT_ALGORITHM != "HS256":
+            return jwt.encode(payload, _SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
+
+        signing_input = _HS256_HEADER_SEGMENT + b"." + _b64url(orjson.dumps(payload))
+        signature = hmac.new(_SECRET_KEY, signing_input, hashlib.sha256).digest()
+        return (signing_input + b"." + _b64url(signature)).decode("ascii")
 
     @staticmethod
     def validate_token(token: str) -> dict:
+        # 최근에 검증한 토큰이면 서명 검증을 생략하고 캐시된 payload를 반환
+        cache_key = JwtTokenProvider._cache_key(token)
+        cached_payload = _token_cache.get(cache_key)
+        if cached_payload is not None:
+            return cached_payload
+
         try:
-            payload = jwt.decode(token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM])
-            return payload
+            payload = jwt.decode(token, _SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
         except jwt.ExpiredSignatureError:
             # 토큰 만료 예외 처리
             raise TokenExpiredException()
@@ -51,6 +92,21 @@ class JwtTokenProvider:
             # 일반적인 JWT 오류 처리
             raise InvalidTokenException()
 
+        # 캐시 유지 시간은 토큰 만료 시각을 넘지 않도록 제한
+        exp = payload.get("exp")
+        ttl = TOKEN_CACHE_TTL_SECONDS if exp is None else min(TOKEN_CACHE_TTL_SECONDS, exp - time.time())
+        _token_cache.set(cache_key, payload, ttl=ttl)
+        return payload
+
+    @staticmethod
+    def invalidate_token(token: str) -> None:
+        """ 캐시된 토큰 검증 결과를 제거 (로그아웃 등으로 더 이상 유효하지 않은 토큰) """
+        _token_cache.pop(JwtTokenProvider._cache_key(token))
+
+    @staticmethod
+    def _cache_key(token: str) -> bytes:
+        return hashlib.sha256(token.encode("utf-8")).digest()[:16]
+
     @staticmethod
     def get_username_from_token(token: str) -> str:
         payload = JwtTokenProvider.validate_token(token)
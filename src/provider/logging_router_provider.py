@@ -12,6 +12,8 @@ class LoggingRouterProvider:
     - 라우터 디렉터리 기준으로 도메인의 유효성을 검증
     """
 
+    DOMAIN_REGEX = re.compile(r"^/v1/([a-zA-Z0-9_-]+)")
+
     def __init__(self, version: str = "v1", marker: str = "src"):
         """
         초기화 시 라우터 디렉토리 경로와 도메인 목록을 설정합니다.
@@ -73,8 +75,7 @@ class LoggingRouterProvider:
         Returns:
             str: 추출된 도메인 (유효하지 않으면 "general" 반환)
         """
-        DOMAIN_REGEX = re.compile(r"^/v1/([a-zA-Z0-9_-]+)")
-        match = DOMAIN_REGEX.match(path)
+        match = self.DOMAIN_REGEX.match(path)
         if match:
             raw = match.group(1).replace("-", "_")
             # _history 접미사가 있으면 원래 도메인으로 치환하여 확인
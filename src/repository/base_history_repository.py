@@ -1,5 +1,8 @@
 from src.repository.base_repository import BaseRepository
-from typing import TypeVar, Generic
+from dataclasses import asdict
+from typing import Any, TypeVar, Generic, List, Optional, Tuple
+from sqlalchemy import func, select
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
 from src.entity.base_entity import Base
 
@@ -26,3 +29,66 @@ class BaseHistoryRepository(BaseRepository[T], Generic[T]):
         """
         entity = domain_to_entity(domain_obj)
         return self.save(db=db, entity=entity)
+
+    def save_histories(self, db: Session, domain_objs: List) -> int:
+        """
+        여러 히스토리 도메인 객체를 한 번의 다중 행 INSERT로 저장하는 메서드.
+
+        Args:
+            db (Session): 데이터베이스 트랜잭션 세션.
+            domain_objs (List): 히스토리 도메인 객체 목록 (예: List[EmployeeHistoryDomain]).
+
+        Returns:
+            int: 저장된 히스토리 개수.
+        """
+        mappings = [
+            {key: value for key, value in asdict(domain_obj).items() if key != "seq"}
+            for domain_obj in domain_objs
+        ]
+        return self.bulk_insert(db=db, mappings=mappings)
+
+    def find_rows_by_keyset(
+        self,
+        db: Session,
+        cursor: Optional[Tuple[int, Any]] = None,
+        size: int = 10,
+        sort_by: Optional[str] = None,
+        order: str = "asc",
+    ) -> Tuple[List[Row], bool]:
+        """
+        키셋 페이지네이션으로 히스토리 목록을 ORM 엔티티가 아닌 컬럼 Row로 조회하는 메서드.
+        히스토리는 읽기 전용 데이터이므로 엔티티 객체 생성(identity map 등록)을 생략한다.
+
+        Args:
+            db (Session): 데이터베이스 세션.
+            cursor (Optional[Tuple[int, Any]]): 직전 페이지 마지막 항목의 (seq, 정렬 컬럼 값), 첫 페이지는 None.
+            size (int): 한 페이지에 가져올 데이터 개수.
+            sort_by (Optional[str]): 정렬할 컬럼명 (예: "seq", "created_at").
+            order (str): 정렬 방식 ("asc" 또는 "desc").
+
+        Returns:
+            Tuple[List[Row], bool]: 히스토리 Row 목록과 다음 페이지 존재 여부.
+        """
+        last_seq, last_val = cursor if cursor else (None, None)
+        return self.find_by_keyset(
+            db,
+            size=size,
+            sort_by=sort_by,
+            order=order,
+            last_seq=last_seq,
+            last_val=last_val,
+            columns=list(self.entity.__table__.columns),
+        )
+
+    def get_max_seq(self, db: Session) -> Optional[int]:
+        """
+        가장 최근에 기록된 히스토리의 seq를 조회하는 메서드.
+        히스토리는 추가만 되는(append-only) 데이터이므로, 이 값이 같으면 목록 내용도 같다.
+
+        Args:
+            db (Session): 데이터베이스 세션.
+
+        Returns:
+            Optional[int]: 최대 seq (히스토리가 없으면 None).
+        """
+        return db.execute(select(func.max(self.primary_key))).scalar()
@@ -1,8 +1,10 @@
-from typing import Type, TypeVar, Generic, List, Optional, Any, Dict
+from typing import Type, TypeVar, Generic, Iterator, List, Optional, Any, Dict, Tuple
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
-from sqlalchemy import text, desc, asc, inspect, delete, func, and_
+from sqlalchemy import text, desc, asc, inspect, delete, func, and_, or_, select, insert, update, bindparam
 from sqlalchemy.sql.expression import ColumnElement
 from src.entity.base_entity import Base  # SQLAlchemy Base 클래스
+from src.utils.ttl_cache import TTLCache
 
 # T가 항상 SQLAlchemy의 Base를 상속하는 모델이 되도록 제한
 T = TypeVar("T", bound=Base)
@@ -14,6 +16,11 @@ class BaseRepository(Generic[T]):
     모든 엔티티 리포지토리는 이 클래스를 상속받아 공통 기능을 재사용함.
     """
 
+    # 행 수가 이 값 이상인 테이블은 count_fast에서 COUNT(*) 대신 통계 기반 추정치를 사용
+    ESTIMATED_COUNT_THRESHOLD = 100_000
+    # 대용량 테이블의 전체 개수(추정치) 재사용 시간 (초)
+    ESTIMATED_COUNT_CACHE_TTL_SECONDS = 300
+
     def __init__(self, entity: Type[T]):
         """
         :param entity: ORM 모델 클래스 (Base를 상속해야 함)
@@ -31,6 +38,22 @@ class BaseRepository(Generic[T]):
         # SQLAlchemy 컬럼 객체로 변환
         self.primary_key: ColumnElement = getattr(self.entity, primary_key_name)
 
+        # 정렬/수정 시 유효성 검사에 사용하는 컬럼명 집합 (요청마다 재계산하지 않도록 미리 계산)
+        self.entity_columns = frozenset(column.name for column in inspect(self.entity).c)
+
+        # count_fast: 대용량 테이블로 확인되었는지 여부와 그 전체 개수(추정치) 캐시
+        self._is_large_table = False
+        self._estimated_count_cache = TTLCache(maxsize=1, ttl=self.ESTIMATED_COUNT_CACHE_TTL_SECONDS)
+
+        # 기본 키 단건 조회 문장 (호출마다 문장을 새로 구성하지 않고 파라미터만 바꿔 실행하며, 컴파일 캐시 키도 재사용)
+        # 논리 삭제된 데이터도 seq로 조회/수정/삭제할 수 있도록 전역 필터를 적용하지 않음
+        self._find_by_id_stmt = (
+            select(self.entity)
+            .where(self.primary_key == bindparam("entity_id"))
+            .limit(1)
+            .execution_options(include_deleted=True)
+        )
+
     def find_all(
         self,
         db: Session,
@@ -38,7 +61,8 @@ class BaseRepository(Generic[T]):
         size: int = 10,
         sort_by: Optional[str] = None,
         order: str = "asc",
-        filters: Optional[list] = None  # 필터 조건을 리스트로 받음
+        filters: Optional[list] = None,  # 필터 조건을 리스트로 받음
+        limit: Optional[int] = None
     ) -> List[T]:
         """
         페이징 및 정렬을 지원하는 목록 조회 메서드.
@@ -50,6 +74,7 @@ class BaseRepository(Generic[T]):
             sort_by (Optional[str]): 정렬할 컬럼명 (예: "seq", "username").
             order (str): 정렬 방식 ("asc" 또는 "desc").
             filters (Optional[list]): (선택) 필터 조건 리스트 (예: [self.entity.level == 1, self.entity.status == 'active']).
+            limit (Optional[int]): (선택) 조회할 최대 개수 (기본값은 size, 오프셋은 항상 size 기준).
 
         Returns:
             List[T]: 조회된 목록.
@@ -62,19 +87,151 @@ class BaseRepository(Generic[T]):
 
         # 정렬 컬럼 유효성 체크
         if sort_by:
-            entity_columns = {column.name for column in inspect(self.entity).c}
-            if sort_by not in entity_columns:
-                raise ValueError(f"정렬할 컬럼 '{sort_by}'가 존재하지 않습니다. 사용 가능한 컬럼: {entity_columns}")
+            if sort_by not in self.entity_columns:
+                raise ValueError(f"정렬할 컬럼 '{sort_by}'가 존재하지 않습니다. 사용 가능한 컬럼: {set(self.entity_columns)}")
 
-            sort_attr = getattr(self.entity, sort_by)
-            query = query.order_by(desc(sort_attr) if order.lower() == "desc" else asc(sort_attr))
+        # 정렬 컬럼 값이 같은 행의 순서가 페이지마다 달라지지 않도록 기본 키를 보조 정렬로 사용
+        # (키셋 조회와 같은 순서이므로, 어느 페이지의 마지막 항목으로도 다음 페이지 커서를 만들 수 있음)
+        direction = desc if order.lower() == "desc" else asc
+        if sort_by and sort_by != self.primary_key.key:
+            query = query.order_by(direction(getattr(self.entity, sort_by)), direction(self.primary_key))
+        else:
+            query = query.order_by(direction(self.primary_key))
 
         # 페이징 적용
-        return query.offset((page - 1) * size).limit(size).all()
+        return query.offset((page - 1) * size).limit(limit if limit is not None else size).all()
+
+    def find_page(
+        self,
+        db: Session,
+        page: int = 1,
+        size: int = 10,
+        sort_by: Optional[str] = None,
+        order: str = "asc",
+        filters: Optional[list] = None,
+        cursor: Optional[Tuple[int, Any]] = None
+    ) -> Tuple[List[T], bool]:
+        """
+        페이지 목록과 다음 페이지 존재 여부를 함께 조회하는 메서드.
+        COUNT(*) 없이 size + 1 건을 조회하여 다음 페이지 존재 여부를 판단한다.
+        cursor가 주어지면 OFFSET 대신 키셋 방식으로 커서 이후의 데이터를 조회한다. (page는 무시)
+
+        Args:
+            db (Session): 데이터베이스 세션.
+            page (int): 1-based 페이지 번호.
+            size (int): 한 페이지에 가져올 데이터 개수.
+            sort_by (Optional[str]): 정렬할 컬럼명.
+            order (str): 정렬 방식 ("asc" 또는 "desc").
+            filters (Optional[list]): (선택) 필터 조건 리스트.
+            cursor (Optional[Tuple[int, Any]]): (선택) 직전 페이지 마지막 항목의 (seq, 정렬 컬럼 값).
+
+        Returns:
+            Tuple[List[T], bool]: 조회된 목록과 다음 페이지 존재 여부.
+        """
+        if cursor is not None:
+            last_seq, last_val = cursor
+            return self.find_by_keyset(
+                db=db, size=size, sort_by=sort_by, order=order, last_seq=last_seq, last_val=last_val, filters=filters
+            )
+
+        rows = self.find_all(db=db, page=page, size=size, sort_by=sort_by, order=order, filters=filters, limit=size + 1)
+        return rows[:size], len(rows) > size
+
+    def find_by_keyset(
+        self,
+        db: Session,
+        size: int = 10,
+        sort_by: Optional[str] = None,
+        order: str = "asc",
+        last_seq: Optional[int] = None,
+        last_val: Any = None,
+        filters: Optional[list] = None,
+        columns: Optional[list] = None
+    ) -> Tuple[List[Any], bool]:
+        """
+        키셋(Keyset) 방식으로 목록을 조회하는 메서드.
+        OFFSET 대신 마지막으로 조회한 (정렬 컬럼 값, 기본 키) 이후의 데이터를 조회하므로,
+        뒤쪽 페이지로 갈수록 느려지는 OFFSET 방식과 달리 인덱스 범위 탐색으로 처리된다.
+        COUNT(*) 없이 size + 1 건을 조회하여 다음 페이지 존재 여부를 판단한다.
+
+        Args:
+            db (Session): 데이터베이스 세션.
+            size (int): 한 페이지에 가져올 데이터 개수.
+            sort_by (Optional[str]): 정렬할 컬럼명 (None이면 기본 키 기준).
+            order (str): 정렬 방식 ("asc" 또는 "desc").
+            last_seq (Optional[int]): 직전 페이지 마지막 항목의 기본 키 (첫 페이지는 None).
+            last_val (Any): 직전 페이지 마지막 항목의 정렬 컬럼 값.
+            filters (Optional[list]): (선택) 필터 조건 리스트.
+            columns (Optional[list]): (선택) 조회할 컬럼 목록. 지정하면 ORM 엔티티 대신 컬럼 Row를 반환한다.
+
+        Returns:
+            Tuple[List[Any], bool]: 조회된 목록(엔티티 또는 Row)과 다음 페이지 존재 여부.
+        """
+        stmt = select(*columns) if columns else select(self.entity)
+
+        if filters:
+            stmt = stmt.where(and_(*filters))
+
+        descending = order.lower() == "desc"
+        direction = desc if descending else asc
+
+        if sort_by and sort_by != self.primary_key.key:
+            if sort_by not in self.entity_columns:
+                raise ValueError(f"정렬할 컬럼 '{sort_by}'가 존재하지 않습니다. 사용 가능한 컬럼: {set(self.entity_columns)}")
+
+            sort_attr = getattr(self.entity, sort_by)
+            if last_seq is not None:
+                stmt = stmt.where(self._keyset_condition(sort_attr, descending, last_seq, last_val))
+            stmt = stmt.order_by(direction(sort_attr), direction(self.primary_key))
+        else:
+            if last_seq is not None:
+                stmt = stmt.where(self.primary_key < last_seq if descending else self.primary_key > last_seq)
+            stmt = stmt.order_by(direction(self.primary_key))
+
+        result = db.execute(stmt.limit(size + 1))
+        rows = result.all() if columns else result.scalars().all()
+        has_more = len(rows) > size
+        return rows[:size], has_more
+
+    def _keyset_condition(self, sort_attr, descending: bool, last_seq: int, last_val: Any) -> ColumnElement:
+        """
+        (정렬 컬럼, 기본 키) 기준으로 직전 페이지 마지막 항목 "이후"의 데이터를 가리키는 조건을 생성한다.
+        MySQL은 NULL을 오름차순에서 가장 앞, 내림차순에서 가장 뒤에 정렬하므로 NULL 구간을 함께 고려한다.
+        """
+        pk = self.primary_key
+        nullable = self.entity.__table__.c[sort_attr.key].nullable
+
+        if not descending:
+            if last_val is None:
+                return or_(and_(sort_attr.is_(None), pk > last_seq), sort_attr.is_not(None))
+            return or_(sort_attr > last_val, and_(sort_attr == last_val, pk > last_seq))
+
+        if last_val is None:
+            return and_(sort_attr.is_(None), pk < last_seq)
+        condition = or_(sort_attr < last_val, and_(sort_attr == last_val, pk < last_seq))
+        return or_(condition, sort_attr.is_(None)) if nullable else condition
+
+    def stream_rows(self, db: Session, *order_by, batch_size: int = 500) -> Iterator[Row]:
+        """
+        전체 엔티티의 컬럼 값을 서버 사이드 커서로 batch_size 단위씩 조회하는 메서드.
+        - ORM 객체/도메인 객체를 만들지 않고 Row를 그대로 반환하므로, 전체 결과를 메모리에 올리지 않는다.
+        - 논리 삭제된 데이터는 전역 필터(src.core.soft_delete)에 의해 제외됨
+
+        Args:
+            db (Session): 데이터베이스 세션 (반복이 끝날 때까지 커넥션을 점유함).
+            *order_by: 정렬 기준 컬럼
+            batch_size (int): 한 번에 가져올 행 수.
+
+        Returns:
+            Iterator[Row]: 컬럼 값으로 구성된 Row 반복자.
+        """
+        columns = [getattr(self.entity, column.key) for column in self.entity.__table__.columns]
+        stmt = select(*columns).order_by(*order_by).execution_options(yield_per=batch_size)
+        return iter(db.execute(stmt))
 
     def find_by_id(self, db: Session, entity_id: int) -> Optional[T]:
         """
-        ID를 기반으로 엔티티를 조회하는 메서드.
+        ID를 기반으로 엔티티를 조회하는 메서드. (논리 삭제된 엔티티도 조회)
 
         Args:
             db (Session): 데이터베이스 세션.
@@ -83,7 +240,48 @@ class BaseRepository(Generic[T]):
         Returns:
             Optional[T]: 조회된 엔티티 (없으면 None).
         """
-        return db.query(self.entity).filter(self.primary_key == entity_id).first()
+        return db.execute(self._find_by_id_stmt, {"entity_id": entity_id}).scalar_one_or_none()
+
+    def find_one_by(self, db: Session, *criteria, include_deleted: bool = False) -> Optional[T]:
+        """
+        조건에 맞는 단일 엔티티를 조회하는 메서드.
+        SELECT ... WHERE ... LIMIT 1 로 조회하며, 기본적으로 논리 삭제(deleted_at)된 데이터는 전역 필터에 의해 제외됩니다.
+        populate_existing 옵션으로 세션에 이미 로드된 엔티티도 DB 값으로 갱신합니다.
+
+        Args:
+            db (Session): 데이터베이스 세션.
+            *criteria: 조회 조건 (예: self.entity.email == email).
+            include_deleted (bool): 논리 삭제된 데이터 포함 여부.
+
+        Returns:
+            Optional[T]: 조회된 엔티티 (없으면 None).
+        """
+        stmt = (
+            select(self.entity)
+            .where(*criteria)
+            .limit(1)
+            .execution_options(populate_existing=True, include_deleted=include_deleted)
+        )
+        return db.execute(stmt).scalar_one_or_none()
+
+    def exists_by(self, db: Session, *criteria, include_deleted: bool = False) -> bool:
+        """
+        조건에 맞는 엔티티 존재 여부를 확인하는 메서드.
+        SELECT EXISTS(SELECT seq ... WHERE ...) 로 조회하여 엔티티를 로딩하지 않고 bool 값만 반환합니다.
+
+        Args:
+            db (Session): 데이터베이스 세션.
+            *criteria: 조회 조건 (예: self.entity.email == email).
+            include_deleted (bool): 논리 삭제된 데이터 포함 여부.
+
+        Returns:
+            bool: 존재 여부 (True/False).
+        """
+        stmt = (
+            select(select(self.primary_key).where(*criteria).exists())
+            .execution_options(include_deleted=include_deleted)
+        )
+        return bool(db.execute(stmt).scalar())
 
     def count_all(self, db: Session, filters=None) -> int:
         """
@@ -96,12 +294,52 @@ class BaseRepository(Generic[T]):
         Returns:
             int: 전체 엔티티 개수.
         """
-        query = db.query(self.entity)
+        # Query.count()는 원본 쿼리를 서브쿼리로 감싸므로, SELECT count(*) FROM table WHERE ... 형태로 직접 조회
+        stmt = select(func.count()).select_from(self.entity)
 
         if filters:
-            query = query.filter(and_(*filters))
+            stmt = stmt.where(and_(*filters))
+
+        return db.execute(stmt).scalar_one()
+
+    def count_fast(self, db: Session) -> int:
+        """
+        필터 없이 전체 엔티티 개수를 빠르게 반환하는 메서드. (페이지네이션 표시용)
+        - 작은 테이블은 추가 조회 없이 정확한 COUNT(*) 결과를 반환합니다.
+        - COUNT 결과가 ESTIMATED_COUNT_THRESHOLD 이상이면 대용량 테이블로 기억하고, 그 값을
+          ESTIMATED_COUNT_CACHE_TTL_SECONDS 동안 재사용합니다.
+        - 이후 캐시가 만료되면 COUNT(*) 대신 information_schema.TABLES의 TABLE_ROWS(InnoDB 통계 기반 추정치)로 갱신합니다.
+          TABLE_ROWS는 논리 삭제된 행도 포함하고 MySQL 8에서는 통계 캐시(information_schema_stats_expiry)
+          만큼 늦게 반영되므로, 대용량 테이블의 개수는 근사값입니다.
+          (추정치가 기준 미만으로 내려가면 다시 정확한 COUNT(*)를 수행)
+
+        Args:
+            db (Session): 데이터베이스 세션.
 
-        return query.count()
+        Returns:
+            int: 전체 엔티티 개수 (대용량 테이블은 논리 삭제된 행을 포함할 수 있는 근사값).
+        """
+        cached_count = self._estimated_count_cache.get("count")
+        if cached_count is not None:
+            return cached_count
+
+        if self._is_large_table:
+            estimated_rows = db.execute(
+                text(
+                    "SELECT TABLE_ROWS FROM information_schema.TABLES "
+                    "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table_name"
+                ),
+                {"table_name": self.entity.__tablename__}
+            ).scalar()
+            if estimated_rows is not None and estimated_rows >= self.ESTIMATED_COUNT_THRESHOLD:
+                self._estimated_count_cache.set("count", int(estimated_rows))
+                return int(estimated_rows)
+
+        total_count = self.count_all(db=db)
+        self._is_large_table = total_count >= self.ESTIMATED_COUNT_THRESHOLD
+        if self._is_large_table:
+            self._estimated_count_cache.set("count", total_count)
+        return total_count
 
     def save(self, db: Session, entity: T) -> T:
         """
@@ -117,7 +355,11 @@ class BaseRepository(Generic[T]):
         try:
             db.add(entity)
             db.flush()  # 변경 사항을 DB에 즉시 반영
-            db.refresh(entity)
+
+            # INSERT ... RETURNING을 지원하는 DB는 flush 시점에 seq/기본값 컬럼을 함께 받아오므로 재조회하지 않는다.
+            # (MySQL은 RETURNING을 지원하지 않으므로 기존처럼 refresh로 재조회)
+            if not db.get_bind().dialect.insert_returning:
+                db.refresh(entity)
             return entity
         except Exception as e:
             db.rollback()
@@ -135,12 +377,12 @@ class BaseRepository(Generic[T]):
         Returns:
             Optional[T]: 업데이트된 엔티티 (없으면 None).
         """
-        entity = db.query(self.entity).filter(self.primary_key == entity_id).first()
+        # 같은 세션에서 이미 조회한 엔티티(예: 히스토리 기록용 변경 전 조회)는 추가 SELECT 없이 재사용
+        entity = db.get(self.entity, entity_id, execution_options={"include_deleted": True})
         if not entity:
             return None
 
-        entity_columns = {column.name for column in inspect(self.entity).c}
-        valid_data = {key: value for key, value in kwargs.items() if key in entity_columns}
+        valid_data = {key: value for key, value in kwargs.items() if key in self.entity_columns}
 
         for key, value in valid_data.items():
             setattr(entity, key, value)
@@ -153,6 +395,79 @@ class BaseRepository(Generic[T]):
             db.rollback()
             raise e
 
+    def bulk_insert(self, db: Session, mappings: List[Dict[str, Any]]) -> int:
+        """
+        여러 엔티티를 ORM Unit of Work를 거치지 않고 한 번의 다중 행 INSERT로 저장하는 메서드.
+
+        Args:
+            db (Session): 데이터베이스 세션.
+            mappings (List[Dict[str, Any]]): 저장할 컬럼명-값 딕셔너리 목록 (모든 항목의 키 구성이 동일해야 함).
+
+        Returns:
+            int: 저장된 엔티티 개수.
+        """
+        if not mappings:
+            return 0
+
+        try:
+            db.execute(insert(self.entity), mappings)
+            return len(mappings)
+        except Exception as e:
+            db.rollback()
+            raise e
+
+    def bulk_update(self, db: Session, entity_ids: List[int], **kwargs) -> int:
+        """
+        여러 ID의 엔티티를 한 번의 UPDATE 문으로 동일한 값으로 수정하는 메서드.
+
+        Args:
+            db (Session): 데이터베이스 세션.
+            entity_ids (List[int]): 수정할 엔티티 ID 목록.
+            kwargs (dict): 수정할 필드 및 값.
+
+        Returns:
+            int: 수정된 엔티티 개수.
+        """
+        valid_data = {key: value for key, value in kwargs.items() if key in self.entity_columns}
+        if not entity_ids or not valid_data:
+            return 0
+
+        stmt = update(self.entity).where(self.primary_key.in_(entity_ids)).values(**valid_data)
+        try:
+            result = db.execute(stmt)
+            db.flush()
+            return result.rowcount
+        except Exception as e:
+            db.rollback()
+            raise e
+
+    def bulk_update_mappings(self, db: Session, mappings: List[Dict[str, Any]]) -> int:
+        """
+        여러 엔티티를 행마다 서로 다른 값으로 수정하는 메서드.
+        기본 키를 포함한 딕셔너리 목록을 ORM bulk UPDATE(executemany)로 한 번에 실행합니다.
+
+        Args:
+            db (Session): 데이터베이스 세션.
+            mappings (List[Dict[str, Any]]): 기본 키와 수정할 컬럼명-값을 담은 딕셔너리 목록.
+
+        Returns:
+            int: 수정 요청된 엔티티 개수.
+        """
+        valid_mappings = [
+            {key: value for key, value in mapping.items() if key in self.entity_columns}
+            for mapping in mappings
+        ]
+        if not valid_mappings:
+            return 0
+
+        try:
+            db.execute(update(self.entity), valid_mappings)
+            db.flush()
+            return len(valid_mappings)
+        except Exception as e:
+            db.rollback()
+            raise e
+
     def delete_by_id(self, db: Session, entity_id: int) -> bool:
         """
         특정 ID의 엔티티를 삭제하는 메서드.
@@ -185,7 +500,8 @@ class BaseRepository(Generic[T]):
         Returns:
             Optional[T]: 소프트 삭제된 엔티티 (없으면 None).
         """
-        entity = db.query(self.entity).filter(self.primary_key == entity_id).first()
+        # 같은 세션에서 이미 조회한 엔티티(예: 히스토리 기록용 변경 전 조회)는 추가 SELECT 없이 재사용
+        entity = db.get(self.entity, entity_id, execution_options={"include_deleted": True})
 
         if not entity:
             return None
@@ -209,7 +525,7 @@ class BaseRepository(Generic[T]):
         Returns:
             bool: 존재 여부 (True/False).
         """
-        return db.query(self.entity).filter(self.primary_key == entity_id).first() is not None
+        return self.exists_by(db, self.primary_key == entity_id, include_deleted=True)
 
     def find_by_native_query(self, db: Session, sql: str,
                              params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
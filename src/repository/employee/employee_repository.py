@@ -1,10 +1,14 @@
-from typing import Optional, List
-from sqlalchemy.orm import Session
+from datetime import datetime
+from typing import Any, Iterator, Optional, List, Tuple
+from sqlalchemy import delete, select
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session, joinedload
 
 from src.entity import EmployeeEntity
 from src.repository.base_repository import BaseRepository
-from src.mapper.employee_mapper import entity_to_domain, domain_to_entity
+from src.mapper.employee_mapper import entity_to_domain, domain_to_entity, entity_to_detail_domain, domain_to_mapping
 from src.domain.employee_domain import EmployeeDomain
+from src.domain.employee_detail_domain import EmployeeDetailDomain
 
 
 class EmployeeRepository(BaseRepository[EmployeeEntity]):
@@ -23,55 +27,55 @@ class EmployeeRepository(BaseRepository[EmployeeEntity]):
     def get_employees(
         self,
         db: Session,
-        page: int = 1,
+        cursor: Optional[Tuple[int, Any]] = None,
         size: int = 10,
         sort_by: str = None,
         order: str = "asc",
-    ) -> List[EmployeeDomain]:
+    ) -> Tuple[List[EmployeeDomain], bool]:
         """
-        페이징 및 정렬을 적용하여 모든 직원을 조회하는 메서드.
+        키셋 페이지네이션 및 정렬을 적용하여 직원 목록을 조회하는 메서드.
 
         Args:
             db (Session): 데이터베이스 세션.
-            page (int): 1부터 시작하는 페이지 번호.
+            cursor (Optional[Tuple[int, Any]]): 직전 페이지 마지막 항목의 (seq, 정렬 컬럼 값), 첫 페이지는 None.
             size (int): 한 페이지에 가져올 데이터 개수.
-            sort_by (str): 정렬할 컬럼명 (예: "seq", "username").
+            sort_by (str): 정렬할 컬럼명 (예: "seq", "name").
             order (str): 정렬 방식 ("asc" 또는 "desc").
 
         Returns:
-            List[EmployeeDomain]: 조회된 직원 목록 (EmployeeDomain 객체 리스트).
+            Tuple[List[EmployeeDomain], bool]: 조회된 직원 목록과 다음 페이지 존재 여부.
         """
-        employee_entities = self.find_all(db=db, page=page, size=size, sort_by=sort_by, order=order)
-        return [entity_to_domain(employee) for employee in employee_entities]
+        last_seq, last_val = cursor if cursor else (None, None)
+        employee_entities, has_more = self.find_by_keyset(
+            db=db, size=size, sort_by=sort_by, order=order, last_seq=last_seq, last_val=last_val
+        )
+        return list(map(entity_to_domain, employee_entities)), has_more
 
-    def count_employees(self, db: Session) -> int:
+    def stream_employee_rows(self, db: Session, batch_size: int = 500) -> Iterator[Row]:
         """
-        전체 직원 수를 반환하는 메서드.
+        전체 직원을 seq 순서대로 서버 사이드 커서로 조회하는 메서드.
+        - 결과를 한 번에 메모리에 올리지 않고 batch_size 단위로 가져온다.
 
         Args:
-            db (Session): 데이터베이스 세션.
+            db (Session): 데이터베이스 세션 (반복이 끝날 때까지 커넥션을 점유함).
+            batch_size (int): 한 번에 가져올 행 수.
 
         Returns:
-            int: 직원 총 개수.
+            Iterator[Row]: 직원 컬럼 값으로 구성된 Row 반복자.
         """
-        return self.count_all(db=db)
+        return self.stream_rows(db, self.primary_key, batch_size=batch_size)
 
-    def count_employees_by_organization_seq(self, db: Session, organization_seq: int) -> int:
+    def count_employees(self, db: Session) -> int:
         """
-        특정 조직에 속한 전체 직원 수를 반환하는 메서드.
+        전체 직원 수를 반환하는 메서드.
 
         Args:
             db (Session): 데이터베이스 세션.
-            organization_seq (int): 참조할 조직 ID.
 
         Returns:
-            int: 특정 조직에 속한 직원 총 개수.
+            int: 직원 총 개수 (대용량 테이블은 추정치).
         """
-        filters = [
-            self.entity.organization_seq == organization_seq,
-            self.entity.deleted_at.is_(None)
-        ]
-        return self.count_all(filters=filters, db=db)
+        return self.count_fast(db=db)
 
     def get_employee_by_seq(self, db: Session, employee_seq: int) -> Optional[EmployeeDomain]:
         """
@@ -87,6 +91,44 @@ class EmployeeRepository(BaseRepository[EmployeeEntity]):
         entity = self.find_by_id(db=db, entity_id=employee_seq)
         return entity_to_domain(entity) if entity else None
 
+    def get_employee_updated_at(self, db: Session, employee_seq: int) -> Optional[datetime]:
+        """
+        직원 seq를 기반으로 수정 시각(updated_at)만 조회하는 메서드. (ETag 비교용, 기본 키 조회)
+
+        Args:
+            db (Session): 데이터베이스 세션.
+            employee_seq (int): 조회할 직원 seq.
+
+        Returns:
+            Optional[datetime]: 직원 수정 시각 (직원이 없으면 None).
+        """
+        stmt = select(self.entity.updated_at).where(self.primary_key == employee_seq).execution_options(include_deleted=True)
+        return db.execute(stmt).scalar_one_or_none()
+
+    def get_employee_with_relations(self, db: Session, employee_seq: int) -> Optional[EmployeeDetailDomain]:
+        """
+        직원 seq를 기반으로 소속 조직, 직책, 직위를 한 번의 조인 쿼리로 함께 조회하는 메서드.
+
+        Args:
+            db (Session): 데이터베이스 세션.
+            employee_seq (int): 조회할 직원 seq.
+
+        Returns:
+            Optional[EmployeeDetailDomain]: 조회된 직원 상세 도메인 객체 (없으면 None).
+        """
+        stmt = (
+            select(self.entity)
+            .options(
+                joinedload(self.entity.organization),
+                joinedload(self.entity.position),
+                joinedload(self.entity.rank),
+            )
+            .where(self.primary_key == employee_seq)
+            .execution_options(include_deleted=True)
+        )
+        entity = db.execute(stmt).unique().scalar_one_or_none()
+        return entity_to_detail_domain(entity) if entity else None
+
     def get_employee_by_email(self, db: Session, email: str) -> Optional[EmployeeDomain]:
         """
         이메일을 기반으로 직원 정보를 조회하는 메서드.
@@ -98,14 +140,25 @@ class EmployeeRepository(BaseRepository[EmployeeEntity]):
         Returns:
             Optional[EmployeeDomain]: 조회된 EmployeeDomain 객체 (없으면 None).
         """
-        entity = db.query(self.entity).filter(self.entity.email == email).first()
-
-        if entity:
-            entity = db.merge(entity)
-            db.refresh(entity)
+        # email 컬럼은 테이블 전체에 UNIQUE 제약이 있어, 논리 삭제된 데이터도 값을 점유하므로 함께 조회한다.
+        entity = self.find_one_by(db, self.entity.email == email, include_deleted=True)
 
         return entity_to_domain(entity) if entity else None
 
+    def exists_by_email(self, db: Session, email: str) -> bool:
+        """
+        이메일을 기반으로 직원 존재 여부를 확인하는 메서드.
+
+        Args:
+            db (Session): 데이터베이스 세션.
+            email (str): 확인할 이메일.
+
+        Returns:
+            bool: 존재 여부 (True/False).
+        """
+        # email 컬럼은 테이블 전체에 UNIQUE 제약이 있어, 논리 삭제된 데이터까지 함께 확인한다.
+        return self.exists_by(db, self.entity.email == email, include_deleted=True)
+
     def create_employee(self, db: Session, employee_domain: EmployeeDomain) -> EmployeeDomain:
         """
         새로운 직원을 생성하는 메서드.
@@ -136,6 +189,93 @@ class EmployeeRepository(BaseRepository[EmployeeEntity]):
         updated = self.update(db=db, entity_id=employee_seq, **update_data)
         return updated
 
+    def create_employees(self, db: Session, employee_domains: List[EmployeeDomain]) -> int:
+        """
+        여러 직원을 한 번의 다중 행 INSERT로 생성하는 메서드. (대량 등록/데이터 이관용)
+
+        Args:
+            db (Session): 데이터베이스 세션.
+            employee_domains (List[EmployeeDomain]): 저장할 EmployeeDomain 객체 목록.
+
+        Returns:
+            int: 생성된 직원 수.
+        """
+        return self.bulk_insert(db=db, mappings=[domain_to_mapping(domain) for domain in employee_domains])
+
+    def update_employees(self, db: Session, employee_seqs: List[int], update_data: dict) -> int:
+        """
+        여러 직원 정보를 한 번의 UPDATE 문으로 동일하게 수정하는 메서드.
+
+        Args:
+            db (Session): 데이터베이스 세션.
+            employee_seqs (List[int]): 수정할 직원 seq 목록.
+            update_data (dict): 수정할 직원 정보.
+
+        Returns:
+            int: 수정된 직원 수.
+        """
+        return self.bulk_update(db=db, entity_ids=employee_seqs, **update_data)
+
+    def update_employees_by_seq(self, db: Session, update_mappings: List[dict]) -> int:
+        """
+        여러 직원 정보를 직원마다 서로 다른 값으로 한 번에 수정하는 메서드.
+
+        Args:
+            db (Session): 데이터베이스 세션.
+            update_mappings (List[dict]): seq와 수정할 직원 정보를 담은 딕셔너리 목록.
+
+        Returns:
+            int: 수정된 직원 수.
+        """
+        return self.bulk_update_mappings(db=db, mappings=update_mappings)
+
+    def get_employees_by_seqs(self, db: Session, employee_seqs: List[int]) -> List[EmployeeDomain]:
+        """
+        여러 직원 seq를 기반으로 직원 목록을 한 번의 IN 쿼리로 조회하는 메서드.
+
+        Args:
+            db (Session): 데이터베이스 세션.
+            employee_seqs (List[int]): 조회할 직원 seq 목록.
+
+        Returns:
+            List[EmployeeDomain]: 조회된 직원 목록 (존재하지 않는 seq는 제외).
+        """
+        # 같은 트랜잭션에서 bulk UPDATE 직후 조회할 수 있으므로, 세션에 남아 있는 객체도 DB 값으로 갱신한다.
+        stmt = (
+            select(self.entity)
+            .where(self.primary_key.in_(employee_seqs))
+            .execution_options(populate_existing=True)
+        )
+        return list(map(entity_to_domain, db.execute(stmt).scalars()))
+
+    def get_employees_by_emails(self, db: Session, emails: List[str]) -> List[EmployeeDomain]:
+        """
+        여러 이메일을 기반으로 직원 목록을 한 번의 IN 쿼리로 조회하는 메서드.
+
+        Args:
+            db (Session): 데이터베이스 세션.
+            emails (List[str]): 조회할 이메일 목록.
+
+        Returns:
+            List[EmployeeDomain]: 조회된 직원 목록.
+        """
+        stmt = select(self.entity).where(self.entity.email.in_(emails))
+        return list(map(entity_to_domain, db.execute(stmt).scalars()))
+
+    def exists_by_emails(self, db: Session, emails: List[str]) -> bool:
+        """
+        이메일 목록 중 하나라도 이미 사용 중인지 확인하는 메서드.
+
+        Args:
+            db (Session): 데이터베이스 세션.
+            emails (List[str]): 확인할 이메일 목록.
+
+        Returns:
+            bool: 존재 여부 (True/False).
+        """
+        # email 컬럼은 테이블 전체에 UNIQUE 제약이 있어, 논리 삭제된 데이터까지 함께 확인한다.
+        return self.exists_by(db, self.entity.email.in_(emails), include_deleted=True)
+
     def delete_employee(self, db: Session, employee_seq: int) -> bool:
         """
         특정 seq의 직원을 삭제하는 메서드.
@@ -145,9 +285,11 @@ class EmployeeRepository(BaseRepository[EmployeeEntity]):
             employee_seq (int): 삭제할 직원 seq.
 
         Returns:
-            bool: 삭제 성공 여부 (True/False).
+            bool: 삭제 성공 여부 (True/False). 직원이 없는 경우 False. (논리 삭제된 직원도 영구 삭제)
         """
-        return self.delete_by_id(db=db, entity_id=employee_seq)
+        # 존재 여부 확인 SELECT 없이 DELETE 한 번으로 처리하고, 삭제된 행 수로 존재 여부를 판단
+        stmt = delete(self.entity).where(self.primary_key == employee_seq)
+        return bool(db.execute(stmt).rowcount)
 
     def soft_delete_employee(self, db: Session, employee_seq: int) -> EmployeeDomain:
         """
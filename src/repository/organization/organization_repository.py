@@ -1,5 +1,9 @@
-from typing import Optional, List
+import dataclasses
+from datetime import datetime
+from typing import Any, Dict, Iterator, Optional, List, Tuple
+from sqlalchemy import Row, bindparam, func, select, update
 from sqlalchemy.orm import Session
+from src.entity.employee_entity import EmployeeEntity
 from src.entity.organization_entity import OrganizationEntity
 from src.repository.base_repository import BaseRepository
 from src.mapper.organization_mapper import entity_to_domain, domain_to_entity
@@ -25,8 +29,9 @@ class OrganizationRepository(BaseRepository[OrganizationEntity]):
         size: int = 10,
         sort_by: str = None,
         order: str = "asc",
-        filters: Optional[list] = None
-    ) -> List[OrganizationDomain]:
+        filters: Optional[list] = None,
+        cursor: Optional[Tuple[int, Any]] = None
+    ) -> Tuple[List[OrganizationDomain], bool]:
         """
         페이징 및 정렬을 적용하여 모든 조직을 조회하는 메서드.
 
@@ -37,12 +42,27 @@ class OrganizationRepository(BaseRepository[OrganizationEntity]):
             sort_by (str): 정렬할 컬럼명 (예: "seq", "name").
             order (str): 정렬 방식 ("asc" | "desc").
             filters (Optional[list]): 필터 조건, 예: level, parent_seq.
+            cursor (Optional[Tuple[int, Any]]): 직전 페이지 마지막 항목의 (seq, 정렬 컬럼 값). 지정하면 page 대신 키셋 방식으로 조회.
 
         Returns:
-            List[OrganizationDomain]: 조회된 조직 목록 (OrganizationDomain 객체 리스트).
+            Tuple[List[OrganizationDomain], bool]: 조회된 조직 목록 (OrganizationDomain 객체 리스트)과 다음 페이지 존재 여부.
         """
-        organization_entities = self.find_all(db=db, page=page, size=size, sort_by=sort_by, order=order, filters=filters)
-        return [entity_to_domain(organization) for organization in organization_entities]
+        organization_entities, has_more = self.find_page(db=db, page=page, size=size, sort_by=sort_by, order=order, filters=filters, cursor=cursor)
+        return list(map(entity_to_domain, organization_entities)), has_more
+
+    def get_organization_updated_at(self, db: Session, organization_seq: int) -> Optional[datetime]:
+        """
+        조직 seq를 기반으로 수정 시각(updated_at)만 조회하는 메서드. (ETag 비교용, 기본 키 조회)
+
+        Args:
+            db (Session): 데이터베이스 세션.
+            organization_seq (int): 조회할 조직 seq.
+
+        Returns:
+            Optional[datetime]: 조직 수정 시각 (조직이 없으면 None).
+        """
+        stmt = select(self.entity.updated_at).where(self.primary_key == organization_seq).execution_options(include_deleted=True)
+        return db.execute(stmt).scalar_one_or_none()
 
     def count_organizations(self, db: Session, filters=None) -> int:
         """
@@ -53,8 +73,10 @@ class OrganizationRepository(BaseRepository[OrganizationEntity]):
             filters (Optional[list]): 필터 조건.
 
         Returns:
-            int: 조직 총 개수.
+            int: 조직 총 개수 (필터가 없고 대용량 테이블인 경우 통계 기반 추정치).
         """
+        if not filters:
+            return self.count_fast(db=db)
         return self.count_all(db=db, filters=filters)
 
     def get_organization_by_seq(self, db: Session, organization_seq: int) -> Optional[OrganizationDomain]:
@@ -82,14 +104,24 @@ class OrganizationRepository(BaseRepository[OrganizationEntity]):
         Returns:
             Optional[OrganizationDomain]: 조회된 조직 도메인 객체 (없으면 None).
         """
-        entity = db.query(self.entity).filter(self.entity.name == name).first()
-
-        if entity:
-            entity = db.merge(entity)
-            db.refresh(entity)
+        entity = self.find_one_by(db, self.entity.name == name)
 
         return entity_to_domain(entity) if entity else None
 
+    def exists_with_level(self, db: Session, organization_seq: int, level: int) -> bool:
+        """
+        특정 seq와 레벨을 가진 조직의 존재 여부를 확인하는 메서드. (상위 조직 검증용, 엔티티를 로딩하지 않음)
+
+        Args:
+            db (Session): 데이터베이스 세션.
+            organization_seq (int): 확인할 조직 seq.
+            level (int): 기대하는 조직 레벨 (1: 부문, 2: 본부, 3: 팀).
+
+        Returns:
+            bool: 존재 여부 (True/False).
+        """
+        return self.exists_by(db, self.primary_key == organization_seq, self.entity.level == level)
+
     def create_organization(self, db: Session, organization_domain: OrganizationDomain) -> OrganizationDomain:
         """
         새로운 조직을 생성하는 메서드.
@@ -103,9 +135,156 @@ class OrganizationRepository(BaseRepository[OrganizationEntity]):
         """
         entity = domain_to_entity(organization_domain)
         saved_entity = self.save(db=db, entity=entity)
+
+        # seq는 INSERT 이후에 정해지므로, 상위 조직 경로 + seq로 경로를 채운다.
+        parent_paths = self.get_organization_paths(db, [saved_entity.parent_seq]) if saved_entity.parent_seq else {}
+        self._update_paths(db, {saved_entity.seq: _child_path(parent_paths.get(saved_entity.parent_seq), saved_entity.seq)})
         return entity_to_domain(saved_entity)
 
-    def update_organization(self, db: Session, organization_seq: int, update_data: dict) -> OrganizationDomain:
+    def create_organizations(self, db: Session, organization_domains: List[OrganizationDomain]) -> List[OrganizationDomain]:
+        """
+        여러 조직을 한 번의 flush로 생성하는 메서드.
+
+        Args:
+            db (Session): 데이터베이스 세션.
+            organization_domains (List[OrganizationDomain]): 저장할 OrganizationDomain 객체 목록.
+
+        Returns:
+            List[OrganizationDomain]: 저장된 OrganizationDomain 객체 목록 (요청 순서 유지).
+        """
+        entities = list(map(domain_to_entity, organization_domains))
+        db.add_all(entities)
+        db.flush()
+
+        # 상위 조직 경로를 한 번에 조회하여, 생성된 조직들의 경로를 한 번의 UPDATE(executemany)로 채운다.
+        parent_seqs = list({entity.parent_seq for entity in entities if entity.parent_seq is not None})
+        parent_paths = self.get_organization_paths(db, parent_seqs) if parent_seqs else {}
+        self._update_paths(db, {
+            entity.seq: _child_path(parent_paths.get(entity.parent_seq), entity.seq) for entity in entities
+        })
+
+        # 생성일/수정일 등 DB 기본값은 행마다 refresh하지 않고 한 번의 IN 쿼리로 함께 조회한다.
+        seqs = [entity.seq for entity in entities]
+        created_by_seq = {domain.seq: domain for domain in self.get_organizations_by_seqs(db, seqs)}
+        return [created_by_seq[seq] for seq in seqs]
+
+    def get_organizations_by_seqs(self, db: Session, organization_seqs: List[int]) -> List[OrganizationDomain]:
+        """
+        여러 조직 seq를 기반으로 조직 목록을 한 번의 IN 쿼리로 조회하는 메서드.
+
+        Args:
+            db (Session): 데이터베이스 세션.
+            organization_seqs (List[int]): 조회할 조직 seq 목록.
+
+        Returns:
+            List[OrganizationDomain]: 조회된 조직 목록 (존재하지 않는 seq는 제외).
+        """
+        # 같은 트랜잭션에서 flush 직후 조회할 수 있으므로, 세션에 남아 있는 객체도 DB 값으로 갱신한다.
+        stmt = (
+            select(self.entity)
+            .where(self.primary_key.in_(organization_seqs))
+            .execution_options(populate_existing=True)
+        )
+        return list(map(entity_to_domain, db.execute(stmt).scalars()))
+
+    def get_organization_paths(self, db: Session, organization_seqs: List[int]) -> Dict[int, Optional[str]]:
+        """
+        여러 조직의 경로(path)를 한 번의 IN 쿼리로 조회하는 메서드.
+
+        Args:
+            db (Session): 데이터베이스 세션.
+            organization_seqs (List[int]): 조회할 조직 seq 목록.
+
+        Returns:
+            Dict[int, Optional[str]]: 조직 seq → 경로 (예: "/1/4/17/"). 존재하지 않거나 논리 삭제된 조직은 포함되지 않음.
+        """
+        stmt = select(self.primary_key, self.entity.path).where(self.primary_key.in_(organization_seqs))
+        return dict(db.execute(stmt).all())
+
+    def move_organization_subtree(self, db: Session, old_path: str, new_path: str) -> int:
+        """
+        조직 이동 시 해당 조직과 모든 하위 조직의 경로 접두어를 한 번의 UPDATE로 변경하는 메서드.
+        - 경로 인덱스의 범위 탐색(LIKE '접두어%')으로 하위 조직을 찾으므로 재귀 조회가 필요 없음.
+
+        Args:
+            db (Session): 데이터베이스 세션.
+            old_path (str): 이동 전 조직 경로 (예: "/1/4/").
+            new_path (str): 이동 후 조직 경로 (예: "/2/4/").
+
+        Returns:
+            int: 경로가 변경된 조직 수.
+        """
+        table = self.entity.__table__
+        stmt = (
+            update(table)
+            .where(table.c.path.startswith(old_path, autoescape=True))
+            .values(
+                path=func.concat(new_path, func.substring(table.c.path, len(old_path) + 1)),
+                updated_at=table.c.updated_at,  # 경로만 바뀌는 하위 조직의 수정 시각은 유지
+            )
+        )
+        return db.execute(stmt).rowcount
+
+    def clear_subtree_paths(self, db: Session, old_path: str) -> int:
+        """
+        조직과 모든 하위 조직의 경로를 비우는 메서드. (수정 시각은 변경하지 않음)
+        - 이동할 상위 조직의 경로가 없어 새 경로를 계산할 수 없을 때, 오래된 경로가 남지 않도록 사용한다.
+
+        Args:
+            db (Session): 데이터베이스 세션.
+            old_path (str): 이동 전 조직 경로 (예: "/1/4/").
+
+        Returns:
+            int: 경로를 비운 조직 수.
+        """
+        table = self.entity.__table__
+        stmt = (
+            update(table)
+            .where(table.c.path.startswith(old_path, autoescape=True))
+            .values(path=None, updated_at=table.c.updated_at)
+        )
+        return db.execute(stmt).rowcount
+
+    def is_self_or_descendant(self, db: Session, organization_seq: int, target_seq: int) -> bool:
+        """
+        target_seq 조직이 organization_seq 조직 자신이거나 그 하위 조직인지, 상위 조직(parent_seq)을 따라 올라가며 확인하는 메서드.
+        - 경로(path)가 채워지지 않은 조직의 이동 검증에 사용한다. (조직 계층이 3단계이므로 최대 3회 조회)
+
+        Args:
+            db (Session): 데이터베이스 세션.
+            organization_seq (int): 기준 조직 seq.
+            target_seq (int): 확인할 조직 seq.
+
+        Returns:
+            bool: 자신 또는 하위 조직이면 True.
+        """
+        current_seq, visited = target_seq, set()
+        while current_seq is not None and current_seq not in visited:
+            if current_seq == organization_seq:
+                return True
+            visited.add(current_seq)
+            current_seq = db.execute(
+                select(self.entity.parent_seq).where(self.primary_key == current_seq)
+            ).scalar_one_or_none()
+        return False
+
+    def _update_paths(self, db: Session, paths: Dict[int, str]) -> None:
+        """
+        조직별 경로를 저장하는 내부 메서드. (수정 시각은 변경하지 않음)
+
+        Args:
+            db (Session): 데이터베이스 세션.
+            paths (Dict[int, str]): 조직 seq → 경로.
+        """
+        table = self.entity.__table__
+        stmt = (
+            update(table)
+            .where(table.c.seq == bindparam("b_seq"))
+            .values(path=bindparam("b_path"), updated_at=table.c.updated_at)
+        )
+        db.execute(stmt, [{"b_seq": seq, "b_path": path} for seq, path in paths.items()])
+
+    def update_organization(self, db: Session, organization_seq: int, update_data: dict) -> Optional[OrganizationDomain]:
         """
         특정 조직 정보를 수정하는 메서드.
 
@@ -115,7 +294,7 @@ class OrganizationRepository(BaseRepository[OrganizationEntity]):
             update_data (dict): 수정할 조직 정보.
 
         Returns:
-            OrganizationDomain: 수정된 OrganizationDomain 객체.
+            OrganizationDomain: 수정된 OrganizationDomain 객체 (대상이 없으면 None).
         """
         updated = self.update(db=db, entity_id=organization_seq, **update_data)
         return updated
@@ -147,19 +326,47 @@ class OrganizationRepository(BaseRepository[OrganizationEntity]):
         """
         return self.soft_delete_by_id(db=db, entity_id=organization_seq)
 
-    def has_child_organizations(self, db: Session, organization_seq: int) -> bool:
+    def get_delete_preconditions(self, db: Session, organization_seq: int) -> Tuple[bool, bool, bool]:
         """
-        특정 조직이 하위 조직을 가지고 있는지 확인.
+        조직 삭제 전 확인이 필요한 조건을 한 번의 쿼리로 조회하는 메서드.
+        SELECT EXISTS(조직), EXISTS(소속 직원), EXISTS(하위 조직) 를 한 번에 조회합니다.
+        - 조직: 논리 삭제된 조직도 seq로 (영구) 삭제할 수 있도록 포함
+        - 소속 직원: 논리 삭제(퇴사)된 직원은 제외
+        - 하위 조직: 영구 삭제 시 상위 조직이 없는 조직이 남지 않도록 논리 삭제된 하위 조직도 포함
 
         Args:
             db (Session): 데이터베이스 세션.
-            organization_seq (int): 조직 seq.
+            organization_seq (int): 삭제할 조직 seq.
 
         Returns:
-            bool: 하위 조직 존재 여부 (True/False).
+            Tuple[bool, bool, bool]: (조직 존재 여부, 소속 직원 존재 여부, 하위 조직 존재 여부)
         """
-        # parent_seq 값으로 하위 조직을 가지고 있는지 확인
-        return db.query(self.entity).filter(self.entity.parent_seq == organization_seq).count() > 0
+        # 소속 직원/하위 조직 확인은 각각 ix_employee_organization_seq_deleted_at, ix_organization_parent_seq_deleted_at 인덱스 탐색으로 처리
+        # (전역 필터는 적용하지 않고 논리 삭제 조건을 직접 지정)
+        stmt = select(
+            select(self.primary_key).where(self.primary_key == organization_seq).exists(),
+            select(EmployeeEntity.seq).where(
+                EmployeeEntity.organization_seq == organization_seq,
+                EmployeeEntity.deleted_at.is_(None),
+            ).exists(),
+            select(self.primary_key).where(self.entity.parent_seq == organization_seq).exists(),
+        ).execution_options(include_deleted=True)
+        found, has_employees, has_children = db.execute(stmt).one()
+        return bool(found), bool(has_employees), bool(has_children)
+
+    def stream_organization_rows(self, db: Session, batch_size: int = 500) -> Iterator[Row]:
+        """
+        전체 조직을 계층 순서(level → parent_seq → seq)대로 서버 사이드 커서로 조회하는 메서드.
+        - 결과를 한 번에 메모리에 올리지 않고 batch_size 단위로 가져온다.
+
+        Args:
+            db (Session): 데이터베이스 세션 (반복이 끝날 때까지 커넥션을 점유함).
+            batch_size (int): 한 번에 가져올 행 수.
+
+        Returns:
+            Iterator[Row]: 조직 컬럼 값으로 구성된 Row 반복자.
+        """
+        return self.stream_rows(db, self.entity.level, self.entity.parent_seq, self.entity.seq, batch_size=batch_size)
 
     def get_organization_tree(self, db: Session) -> List[OrganizationDomain]:
         """
@@ -171,34 +378,79 @@ class OrganizationRepository(BaseRepository[OrganizationEntity]):
         Returns:
             List[OrganizationDomain]: 계층 구조로 변환된 전체 조직 목록.
         """
-        total_organization_count = self.count_organizations(db)
-
-        """
-        필터링이나 정렬 옵션 없이, 전체 조직 목록을 페이지 1로 요청하여 모든 조직을 가져온다.
-        page=1, size=전체 조직 수로 요청하여 한 번에 모든 데이터를 가져오도록 설정한다.
-        """
-        all_organizations = self.get_organizations(page=1, size=total_organization_count, sort_by=None, order="asc", filters=[], db=db)
-
-        def build_tree(parent_seq: Optional[int]) -> List[OrganizationDomain]:
+        # COUNT 후 전체 크기로 페이지를 요청하던 2회 조회 대신, 단일 SELECT로 전체 조직을 계층 순서대로 가져온다.
+        # (논리 삭제된 조직은 전역 소프트 삭제 필터로 제외됨)
+        organization_entities = db.execute(
+            select(self.entity).order_by(self.entity.level, self.entity.parent_seq, self.entity.seq)
+        ).scalars().all()
+        all_organizations = list(map(entity_to_domain, organization_entities))
+
+        # seq → 배열 인덱스로 평탄화하여 부모 조직을 인덱스 기반으로 참조한다. (부모가 없으면 -1)
+        index_by_seq = {org.seq: index for index, org in enumerate(all_organizations)}
+        parents = [
+            index_by_seq.get(org.parent_seq, -2) if org.parent_seq is not None else -1
+            for org in all_organizations
+        ]
+        child_starts, child_ids = _build_child_index(parents)
+
+        def build_node(index: int) -> OrganizationDomain:
             """
-            주어진 parent_seq에 해당하는 조직을 찾고, 그 조직들의 하위 조직들을 재귀적으로 찾아 트리 구조를 만든다.
+            CSR 인덱스를 따라 하위 조직을 연결한 새로운 조직 객체를 생성한다.
+            dataclasses.replace를 사용하여 원본 객체를 수정하지 않고 새로운 객체를 반환한다.
 
             Args:
-                parent_seq (Optional[int]): 부모 조직의 순번(주로 상위 조직의 순번). None일 경우 최상위 조직을 의미한다.
+                index (int): all_organizations 내 조직의 인덱스.
 
             Returns:
-                List[OrganizationDomain]: 주어진 parent_seq에 해당하는 조직 목록을 계층 구조로 반환.
-            """
-            import dataclasses
+                OrganizationDomain: children이 채워진 조직 도메인 객체.
             """
-            각 조직에 대해 자식 조직(children)을 설정하는데, 자식 조직도 build_tree를 통해 재귀적으로 찾아 추가한다.
-            dataclasses.replace를 사용하여 원본 객체를 수정하지 않고 새로운 객체를 반환한다.
-            children 필드를 갱신한 새로운 객체가 반환되므로, 중복되는 자식 조직을 추가하지 않고 계층 구조를 정확히 구성할 수 있다.
-            """
-            return [
-                dataclasses.replace(org, children=build_tree(org.seq))        # 원본 객체를 수정하지 않고 새로운 객체를 반환
-                for org in all_organizations if org.parent_seq == parent_seq  # 현재 부모 조직에 해당하는 자식 조직만 필터링
-            ]
+            children = [build_node(child) for child in child_ids[child_starts[index]:child_starts[index + 1]]]
+            return dataclasses.replace(all_organizations[index], children=children)
+
+        # 최상위 조직(parent_seq가 None)부터 트리 구조를 생성하여 반환한다.
+        return [build_node(index) for index, parent in enumerate(parents) if parent == -1]
 
-        # 최상위 조직부터 트리 구조를 생성하여 반환한다.
-        return build_tree(None)
+
+def _child_path(parent_path: Optional[str], seq: int) -> str:
+    """
+    상위 조직 경로와 조직 seq로 조직 경로(Materialized Path)를 만든다.
+    최상위 조직은 "/seq/", 하위 조직은 "상위 경로 + seq/" 형식이다. (예: "/1/4/17/")
+
+    Args:
+        parent_path (Optional[str]): 상위 조직 경로 (최상위 조직이면 None).
+        seq (int): 조직 seq.
+
+    Returns:
+        str: 조직 경로.
+    """
+    return f"{parent_path or '/'}{seq}/"
+
+
+def _build_child_index(parents: List[int]) -> Tuple[List[int], List[int]]:
+    """
+    부모 인덱스 배열을 CSR(Compressed Sparse Row) 형태의 자식 인덱스로 변환한다.
+    i번째 조직의 자식 인덱스는 child_ids[child_starts[i]:child_starts[i + 1]] 구간에 원래 순서대로 위치한다.
+    조직 수(n)에 대해 O(n)으로 동작하며, 조직 수만큼 전체 목록을 반복 필터링하던 O(n²) 방식을 대체한다.
+
+    Args:
+        parents (List[int]): 각 조직의 부모 인덱스 (최상위 조직은 -1, 부모를 찾을 수 없으면 -2).
+
+    Returns:
+        Tuple[List[int], List[int]]: (child_starts, child_ids)
+    """
+    count = len(parents)
+    child_starts = [0] * (count + 1)
+    for parent in parents:
+        if parent >= 0:
+            child_starts[parent + 1] += 1
+    for index in range(count):
+        child_starts[index + 1] += child_starts[index]
+
+    cursor = child_starts[:-1]
+    child_ids = [0] * child_starts[count]
+    for index, parent in enumerate(parents):
+        if parent >= 0:
+            child_ids[cursor[parent]] = index
+            cursor[parent] += 1
+
+    return child_starts, child_ids
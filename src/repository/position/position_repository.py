@@ -1,4 +1,4 @@
-from typing import Optional, List
+from typing import Any, Optional, List, Tuple
 from sqlalchemy.orm import Session
 from src.entity.position_entity import PositionEntity
 from src.repository.base_repository import BaseRepository
@@ -24,8 +24,9 @@ class PositionRepository(BaseRepository[PositionEntity]):
         page: int = 1,
         size: int = 10,
         sort_by: str = None,
-        order: str = "asc"
-    ) -> List[PositionDomain]:
+        order: str = "asc",
+        cursor: Optional[Tuple[int, Any]] = None
+    ) -> Tuple[List[PositionDomain], bool]:
         """
         페이징 및 정렬을 적용하여 모든 직책을 조회하는 메서드.
 
@@ -35,12 +36,13 @@ class PositionRepository(BaseRepository[PositionEntity]):
             size (int): 한 페이지에 가져올 데이터 개수.
             sort_by (str): 정렬할 컬럼명 (예: "seq", "title").
             order (str): 정렬 방식 ("asc" | "desc").
+            cursor (Optional[Tuple[int, Any]]): 직전 페이지 마지막 항목의 (seq, 정렬 컬럼 값). 지정하면 page 대신 키셋 방식으로 조회.
 
         Returns:
-            List[PositionDomain]: 조회된 직책 목록 (PositionDomain 객체 리스트).
+            Tuple[List[PositionDomain], bool]: 조회된 직책 목록 (PositionDomain 객체 리스트)과 다음 페이지 존재 여부.
         """
-        position_entities = self.find_all(db=db, page=page, size=size, sort_by=sort_by, order=order)
-        return [entity_to_domain(position) for position in position_entities]
+        position_entities, has_more = self.find_page(db=db, page=page, size=size, sort_by=sort_by, order=order, cursor=cursor)
+        return list(map(entity_to_domain, position_entities)), has_more
 
     def count_positions(self, db: Session) -> int:
         """
@@ -50,9 +52,9 @@ class PositionRepository(BaseRepository[PositionEntity]):
             db (Session): 데이터베이스 세션.
 
         Returns:
-            int: 직책 총 개수.
+            int: 직책 총 개수 (대용량 테이블은 추정치).
         """
-        return self.count_all(db=db)
+        return self.count_fast(db=db)
 
     def get_position_by_seq(self, db: Session, position_seq: int) -> Optional[PositionDomain]:
         """
@@ -79,14 +81,23 @@ class PositionRepository(BaseRepository[PositionEntity]):
         Returns:
             Optional[PositionDomain]: 조회된 직책 도메인 객체 (없으면 None).
         """
-        entity = db.query(self.entity).filter(self.entity.title == title).first()
-
-        if entity:
-            entity = db.merge(entity)
-            db.refresh(entity)
+        entity = self.find_one_by(db, self.entity.title == title)
 
         return entity_to_domain(entity) if entity else None
 
+    def exists_by_title(self, db: Session, title: str) -> bool:
+        """
+        직책명을 기반으로 직책 존재 여부를 확인하는 메서드.
+
+        Args:
+            db (Session): 데이터베이스 세션.
+            title (str): 확인할 직책명.
+
+        Returns:
+            bool: 존재 여부 (True/False).
+        """
+        return self.exists_by(db, self.entity.title == title)
+
     def create_position(self, db: Session, position_domain: PositionDomain) -> PositionDomain:
         """
         새로운 직책을 생성하는 메서드.
@@ -102,7 +113,7 @@ class PositionRepository(BaseRepository[PositionEntity]):
         saved_entity = self.save(db=db, entity=entity)
         return entity_to_domain(saved_entity)
 
-    def update_position(self, db: Session, position_seq: int, update_data: dict) -> PositionDomain:
+    def update_position(self, db: Session, position_seq: int, update_data: dict) -> Optional[PositionDomain]:
         """
         특정 직책 정보를 수정하는 메서드.
 
@@ -112,7 +123,7 @@ class PositionRepository(BaseRepository[PositionEntity]):
             update_data (dict): 수정할 직책 정보.
 
         Returns:
-            PositionDomain: 수정된 PositionDomain 객체.
+            PositionDomain: 수정된 PositionDomain 객체 (대상이 없으면 None).
         """
         updated = self.update(db=db, entity_id=position_seq, **update_data)
         return updated
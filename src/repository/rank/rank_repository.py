@@ -1,4 +1,4 @@
-from typing import Optional, List
+from typing import Any, Optional, List, Tuple
 from sqlalchemy.orm import Session
 from src.entity.rank_entity import RankEntity
 from src.repository.base_repository import BaseRepository
@@ -24,8 +24,9 @@ class RankRepository(BaseRepository[RankEntity]):
         page: int = 1,
         size: int = 10,
         sort_by: str = None,
-        order: str = "asc"
-    ) -> List[RankDomain]:
+        order: str = "asc",
+        cursor: Optional[Tuple[int, Any]] = None
+    ) -> Tuple[List[RankDomain], bool]:
         """
         페이징 및 정렬을 적용하여 모든 직위를 조회하는 메서드.
 
@@ -35,12 +36,13 @@ class RankRepository(BaseRepository[RankEntity]):
             size (int): 한 페이지에 가져올 데이터 개수.
             sort_by (str): 정렬할 컬럼명 (예: "seq", "title").
             order (str): 정렬 방식 ("asc" 또는 "desc").
+            cursor (Optional[Tuple[int, Any]]): 직전 페이지 마지막 항목의 (seq, 정렬 컬럼 값). 지정하면 page 대신 키셋 방식으로 조회.
 
         Returns:
-            List[RankDomain]: 조회된 직위 목록 (RankDomain 객체 리스트).
+            Tuple[List[RankDomain], bool]: 조회된 직위 목록 (RankDomain 객체 리스트)과 다음 페이지 존재 여부.
         """
-        rank_entities = self.find_all(db=db, page=page, size=size, sort_by=sort_by, order=order)
-        return [entity_to_domain(rank) for rank in rank_entities]
+        rank_entities, has_more = self.find_page(db=db, page=page, size=size, sort_by=sort_by, order=order, cursor=cursor)
+        return list(map(entity_to_domain, rank_entities)), has_more
 
     def count_ranks(self, db: Session) -> int:
         """
@@ -50,9 +52,9 @@ class RankRepository(BaseRepository[RankEntity]):
             db (Session): 데이터베이스 세션.
 
         Returns:
-            int: 직위 총 개수.
+            int: 직위 총 개수 (대용량 테이블은 추정치).
         """
-        return self.count_all(db=db)
+        return self.count_fast(db=db)
 
     def get_rank_by_seq(self, db: Session, rank_seq: int) -> Optional[RankDomain]:
         """
@@ -79,14 +81,23 @@ class RankRepository(BaseRepository[RankEntity]):
         Returns:
             Optional[RankDomain]: 조회된 직위 객체 (없을 경우 None).
         """
-        entity = db.query(self.entity).filter(self.entity.title == title).first()
-
-        if entity:
-            entity = db.merge(entity)
-            db.refresh(entity)
+        entity = self.find_one_by(db, self.entity.title == title)
 
         return entity_to_domain(entity) if entity else None
 
+    def exists_by_title(self, db: Session, title: str) -> bool:
+        """
+        직위명을 기반으로 직위 존재 여부를 확인하는 메서드.
+
+        Args:
+            db (Session): 데이터베이스 세션.
+            title (str): 확인할 직위명.
+
+        Returns:
+            bool: 존재 여부 (True/False).
+        """
+        return self.exists_by(db, self.entity.title == title)
+
     def create_rank(self, db: Session, rank_domain: RankDomain) -> RankDomain:
         """
         새로운 직위를 생성하는 메서드.
@@ -102,7 +113,7 @@ class RankRepository(BaseRepository[RankEntity]):
         saved_entity = self.save(db=db, entity=entity)
         return entity_to_domain(saved_entity)
 
-    def update_rank(self, db: Session, rank_seq: int, update_data: dict) -> RankDomain:
+    def update_rank(self, db: Session, rank_seq: int, update_data: dict) -> Optional[RankDomain]:
         """
         특정 직위 정보를 수정하는 메서드.
 
@@ -112,7 +123,7 @@ class RankRepository(BaseRepository[RankEntity]):
             update_data (dict): 수정할 직위 정보.
 
         Returns:
-            RankDomain: 수정된 RankDomain 객체.
+            RankDomain: 수정된 RankDomain 객체 (대상이 없으면 None).
         """
         updated = self.update(db=db, entity_id=rank_seq, **update_data)
         return updated
@@ -1,10 +1,21 @@
-from typing import Optional, List
+from typing import Any, Optional, List, Tuple
+from sqlalchemy import bindparam, select, update
 from sqlalchemy.orm import Session
 from src.entity.user_entity import UserEntity
 from src.repository.base_repository import BaseRepository
 from src.mapper.user_mapper import entity_to_domain, domain_to_entity
 from src.domain.user_domain import UserDomain
 
+# 로그인/토큰 재발급/로그아웃마다 실행되는 아이디 조회 구문은 모듈 로딩 시 한 번만 구성한다.
+# (구문 생성과 캐시 키 계산을 요청마다 반복하지 않고, 컴파일된 SQL은 엔진 캐시에서 재사용)
+# username 컬럼은 테이블 전체에 UNIQUE 제약이 있어, 논리 삭제된 데이터도 값을 점유하므로 함께 조회한다.
+_select_user_by_username = (
+    select(UserEntity)
+    .where(UserEntity.username == bindparam("username"))
+    .limit(1)
+    .execution_options(populate_existing=True, include_deleted=True)
+)
+
 class UserRepository(BaseRepository[UserEntity]):
     """
     회원(User) 엔티티의 데이터 접근을 담당하는 리포지토리 클래스.
@@ -25,7 +36,8 @@ class UserRepository(BaseRepository[UserEntity]):
         size: int = 10,
         sort_by: str = None,
         order: str = "asc",
-    ) -> List[UserDomain]:
+        cursor: Optional[Tuple[int, Any]] = None
+    ) -> Tuple[List[UserDomain], bool]:
         """
         페이징 및 정렬을 적용하여 모든 회원을 조회하는 메서드.
 
@@ -35,12 +47,13 @@ class UserRepository(BaseRepository[UserEntity]):
             size (int): 한 페이지당 가져올 데이터 개수.
             sort_by (str): 정렬할 컬럼명 (예: "seq", "username").
             order (str): 정렬 방식 ("asc" 또는 "desc").
+            cursor (Optional[Tuple[int, Any]]): 직전 페이지 마지막 항목의 (seq, 정렬 컬럼 값). 지정하면 page 대신 키셋 방식으로 조회.
 
         Returns:
-            List[UserDomain]: 조회된 회원 목록 (UserDomain 객체 리스트).
+            Tuple[List[UserDomain], bool]: 조회된 회원 목록 (UserDomain 객체 리스트)과 다음 페이지 존재 여부.
         """
-        user_entities = self.find_all(db=db, page=page, size=size, sort_by=sort_by, order=order)
-        return [entity_to_domain(user) for user in user_entities]
+        user_entities, has_more = self.find_page(db=db, page=page, size=size, sort_by=sort_by, order=order, cursor=cursor)
+        return list(map(entity_to_domain, user_entities)), has_more
 
     def count_users(self, db: Session) -> int:
         """
@@ -50,9 +63,9 @@ class UserRepository(BaseRepository[UserEntity]):
             db (Session): 데이터베이스 세션.
 
         Returns:
-            int: 회원 총 개수.
+            int: 회원 총 개수 (대용량 테이블은 추정치).
         """
-        return self.count_all(db=db)
+        return self.count_fast(db=db)
 
     def get_user_by_seq(self, db: Session, user_seq: int) -> Optional[UserDomain]:
         """
@@ -79,14 +92,38 @@ class UserRepository(BaseRepository[UserEntity]):
         Returns:
             Optional[UserDomain]: 조회된 UserDomain 객체 (없을 경우 None).
         """
-        entity = db.query(self.entity).filter(self.entity.username == username).first()
-
-        if entity:
-            entity = db.merge(entity)
-            db.refresh(entity)
+        entity = db.execute(_select_user_by_username, {"username": username}).scalar_one_or_none()
 
         return entity_to_domain(entity) if entity else None
 
+    def exists_by_username(self, db: Session, username: str) -> bool:
+        """
+        회원 아이디를 기반으로 회원 존재 여부를 확인하는 메서드.
+
+        Args:
+            db (Session): 데이터베이스 세션.
+            username (str): 확인할 회원 아이디.
+
+        Returns:
+            bool: 존재 여부 (True/False).
+        """
+        # username 컬럼은 테이블 전체에 UNIQUE 제약이 있어, 논리 삭제된 데이터까지 함께 확인한다.
+        return self.exists_by(db, self.entity.username == username, include_deleted=True)
+
+    def exists_by_email(self, db: Session, email: str) -> bool:
+        """
+        회원 이메일을 기반으로 회원 존재 여부를 확인하는 메서드.
+
+        Args:
+            db (Session): 데이터베이스 세션.
+            email (str): 확인할 회원 이메일.
+
+        Returns:
+            bool: 존재 여부 (True/False).
+        """
+        # email 컬럼은 테이블 전체에 UNIQUE 제약이 있어, 논리 삭제된 데이터까지 함께 확인한다.
+        return self.exists_by(db, self.entity.email == email, include_deleted=True)
+
     def create_user(self, db: Session, user_domain: UserDomain, hashed_password: str) -> UserDomain:
         """
         새로운 회원을 생성하는 메서드.
@@ -158,5 +195,10 @@ class UserRepository(BaseRepository[UserEntity]):
         Returns:
             bool: 수정 성공 여부.
         """
-        updated = self.update(db=db, entity_id=user_seq, current_refresh_token=refresh_token)
-        return updated
+        # 엔티티 조회(SELECT) → 변경 → refresh(SELECT) 없이 단일 UPDATE 한 번으로 저장 (로그인 경로의 DB 왕복 최소화)
+        stmt = (
+            update(self.entity)
+            .where(self.primary_key == user_seq, self.entity.deleted_at.is_(None))
+            .values(current_refresh_token=refresh_token)
+        )
+        return db.execute(stmt).rowcount > 0
@@ -1,5 +1,4 @@
 from fastapi import Depends, status, Form
-from dependency_injector.wiring import inject, Provide
 from sqlalchemy.orm import Session
 
 from src.dto.request.auth.login_request_dto import LoginRequestDto
@@ -9,19 +8,21 @@ from src.dto.response.auth.token_response_dto import TokenResponseDto
 from src.dto.response.common_response_dto import CommonResponseDto
 from src.logging.api_logging_router import APILoggingRouter
 from src.service.auth.auth_service import AuthService
-from src.core.container import Container
+from src.core.container import service_dependency
 from src.core.session import get_db
 
 # 인증 관련 엔드포인트를 정의하는 APIRouter
 router = APILoggingRouter()
 
+# 요청마다 wiring을 거치지 않도록 서비스 인스턴스를 한 번만 조회하여 재사용
+_get_auth_service = service_dependency("auth_service")
+
 @router.post("/swagger-token", status_code=status.HTTP_200_OK)
-@inject
-def swagger_login(
+async def swagger_login(
         username: str = Form(...),
         password: str = Form(...),
         db: Session = Depends(get_db),
-        auth_service: AuthService = Depends(Provide[Container.auth_service])
+        auth_service: AuthService = Depends(_get_auth_service)
 ):
     """
     # 🔑 Swagger 전용 로그인 API (OAuth2 password flow 대응)
@@ -45,7 +46,7 @@ def swagger_login(
       - 존재하지 않는 회원일 경우**`404 Not Found`** 오류 반환
       - 비밀번호가 일치하지 않을 경우 **`401 Bad request`** 오류 반환
     """
-    access_token = auth_service.swagger_login(db, username, password)
+    access_token = await auth_service.swagger_login(db, username, password)
 
     return {
         "access_token": access_token,
@@ -54,11 +55,10 @@ def swagger_login(
 
 
 @router.post("/tokens", response_model=CommonResponseDto[TokenResponseDto], status_code=status.HTTP_200_OK)
-@inject
-def issue_tokens(
+async def issue_tokens(
         payload: LoginRequestDto,
         db: Session = Depends(get_db),
-        auth_service: AuthService = Depends(Provide[Container.auth_service])
+        auth_service: AuthService = Depends(_get_auth_service)
 ):
     """
     # 🔑 로그인 API (Access & Refresh Token 발급)
@@ -81,7 +81,7 @@ def issue_tokens(
       - 존재하지 않는 회원일 경우**`404 Not Found`** 오류 반환
       - 비밀번호가 일치하지 않을 경우 **`401 Bad request`** 오류 반환
     """
-    tokens = auth_service.login(db, payload)
+    tokens = await auth_service.login(db, payload)
     return CommonResponseDto(
         status="success",
         data=tokens,
@@ -90,11 +90,10 @@ def issue_tokens(
 
 
 @router.put("/tokens", response_model=CommonResponseDto[TokenResponseDto], status_code=status.HTTP_200_OK)
-@inject
 def refresh_access_token(
         payload: RefreshTokenRequestDto,
         db: Session = Depends(get_db),
-        auth_service: AuthService = Depends(Provide[Container.auth_service])
+        auth_service: AuthService = Depends(_get_auth_service)
 ):
     """
     # 🔄 Refresh Token을 사용한 새로운 Access Token 발급 API
@@ -126,11 +125,10 @@ def refresh_access_token(
 
 
 @router.patch("/tokens", response_model=CommonResponseDto[None], status_code=status.HTTP_200_OK)
-@inject
 def revoke_tokens(
         payload: LogoutRequestDto,
         db: Session = Depends(get_db),
-        auth_service: AuthService = Depends(Provide[Container.auth_service])
+        auth_service: AuthService = Depends(_get_auth_service)
 ):
     """
     # 🚪 로그아웃 API (Refresh Token 폐기)
@@ -1,66 +1,103 @@
-from fastapi import Depends, Query
-from dependency_injector.wiring import inject, Provide
+from typing import Literal
+from fastapi import Depends, Query, Request
 from sqlalchemy.orm import Session
 
-from src.core.container import Container
+from src.core.container import service_dependency
+from src.core.fast_response import ok
 from src.core.session import get_db
 from src.logging.api_logging_router import APILoggingRouter
 from src.service.employee.employee_history_service import EmployeeHistoryService
 from src.dto.response.common_response_dto import CommonResponseDto
-from src.dto.response.paginated_response_dto import PaginatedResponseDto
+from src.dto.response.keyset_paginated_response_dto import KeysetPaginatedResponseDto
+from src.provider.cursor_provider import CursorProvider
+from src.provider.etag_provider import EtagProvider
 from src.dto.response.employee.employee_history_response_dto import EmployeeHistoryResponseDto
 
 # 직원 히스토리 관련 API 엔드포인트를 정의하는 APIRouter
 router = APILoggingRouter()
 
-@router.get("/", response_model=CommonResponseDto[PaginatedResponseDto[EmployeeHistoryResponseDto]])
-@inject
+# 요청마다 wiring을 거치지 않도록 서비스 인스턴스를 한 번만 조회하여 재사용
+_get_employee_history_service = service_dependency("employee_history_service")
+
+@router.get("/", response_model=CommonResponseDto[KeysetPaginatedResponseDto[EmployeeHistoryResponseDto]])
 def get_employee_histories(
-        page: int = Query(1, ge=1, description="현재 페이지 (1부터 시작)"),
+        request: Request,
+        cursor: str | None = Query(None, description="다음 페이지 조회 커서 (첫 페이지는 생략, 이전 응답의 next_cursor 사용)"),
         size: int = Query(10, ge=1, description="페이지 크기"),
-        sort_by: str | None = Query(None, description="정렬 기준 컬럼명 (예: 'seq', 'name')"),
-        order: str = Query("asc", regex="^(asc|desc)$", description="정렬 순서 ('asc' 또는 'desc')"),
+        sort_by: str | None = Query(None, description="정렬 기준 컬럼명 (예: 'seq', 'created_at')"),
+        order: Literal["asc", "desc"] = Query("asc", description="정렬 순서 ('asc' 또는 'desc')"),
         db: Session = Depends(get_db),
-        employee_history_service: EmployeeHistoryService = Depends(Provide[Container.employee_history_service])
+        employee_history_service: EmployeeHistoryService = Depends(_get_employee_history_service)
 ):
     """
-    # 📌 직원 히스토리 목록 조회 API (페이징 및 정렬 지원)
+    # 📌 직원 히스토리 목록 조회 API (키셋 페이지네이션 및 정렬 지원)
 
     ## 📝 Args:
-    - **`page`** (`int`): 현재 페이지 번호 (**1부터 시작**)
+    - **`cursor`** (`str | None`): 다음 페이지 조회 커서
+      - 첫 페이지는 생략하고, 이후에는 이전 응답의 `next_cursor` 값을 전달
     - **`size`** (`int`): 페이지 크기 (**한 페이지당 직원 히스토리수**)
     - **`sort_by`** (`str | None`): 정렬 기준 컬럼명
-      - 예시: `'seq'`, `'name'`
+      - 예시: `'seq'`, `'created_at'`
     - **`order`** (`str`): 정렬 방향
       - `"asc"` (오름차순) | `"desc"` (내림차순)
     - **`employee_history_service`** (`EmployeeHistoryService`): 직원 히스토리 서비스 **의존성 주입**
 
     ## 📤 Returns:
-    - **`CommonResponseDto[PaginatedResponseDto[EmployeeHistoryResponseDto]]`**
-      직원 히스토리 목록과 페이지네이션 정보 반환
+    - **`CommonResponseDto[KeysetPaginatedResponseDto[EmployeeHistoryResponseDto]]`**
+      직원 히스토리 목록과 다음 페이지 커서 반환
+
+    ## 📌 캐시:
+    - 응답에 **`ETag`** 헤더 포함 (최근 히스토리 seq + 조회 조건 기준)
+    - **`If-None-Match`** 가 일치하면 목록 조회 없이 **`304 Not Modified`** 반환
+
+    ## ⚠️ Raises:
+    - **`HTTPException`**:
+      - 커서 형식이 올바르지 않은 경우 **`400 Bad Request`** 오류 반환
     """
-    histories, total_count = employee_history_service.get_employee_histories(db, page, size, sort_by, order)
-    employee_history_responses = [EmployeeHistoryResponseDto.model_validate(h) for h in histories]
-    total_pages = (total_count + size - 1) // size
-
-    return CommonResponseDto(
-        status="success",
-        data=PaginatedResponseDto(
-            items=employee_history_responses,
-            total=total_count,
-            page=page,
-            size=size,
-            total_pages=total_pages
-        ),
-        message=None
-    )
+    # 히스토리는 추가만 되므로, 최근 seq가 같으면 같은 조회 조건의 목록도 변하지 않음
+    latest_seq = employee_history_service.get_latest_employee_history_seq(db)
+    etag = EtagProvider.make(latest_seq, cursor, size, sort_by, order)
+    not_modified = EtagProvider.not_modified(request, etag)
+    if not_modified:
+        return not_modified
+
+    histories, has_more = employee_history_service.get_employee_histories(db, CursorProvider.decode(cursor), size, sort_by, order)
+    # 히스토리는 읽기 전용 컬럼 Row이므로 DTO 검증 없이 dict로 변환하여 orjson으로 바로 직렬화
+    employee_history_responses = [history._asdict() for history in histories]
+    next_cursor = CursorProvider.next_cursor(histories, has_more, sort_by)
+
+    return EtagProvider.attach(ok({
+        "items": employee_history_responses,
+        "size": size,
+        "next_cursor": next_cursor,
+        "has_more": has_more
+    }), etag)
+
+@router.get("/count", response_model=CommonResponseDto[int])
+def count_employee_histories(
+        db: Session = Depends(get_db),
+        employee_history_service: EmployeeHistoryService = Depends(_get_employee_history_service)
+):
+    """
+    # 🔢 전체 직원 히스토리 수 조회 API
+    - 목록 조회 API는 COUNT(*)를 수행하지 않으므로, 전체 개수가 필요한 경우에만 별도로 호출
+
+    ## 📝 Args:
+    - **`employee_history_service`** (`EmployeeHistoryService`): 직원 히스토리 서비스 **의존성 주입**
+
+    ## 📤 Returns:
+    - **`CommonResponseDto[int]`**
+      전체 **직원 히스토리 수 반환**
+    """
+    total_count = employee_history_service.count_employee_histories(db)
+    return CommonResponseDto(status="success", data=total_count, message=None)
 
 @router.get("/{employee_history_seq}", response_model=CommonResponseDto[EmployeeHistoryResponseDto])
-@inject
 def get_employee_history(
         employee_history_seq: int,
+        request: Request,
         db: Session = Depends(get_db),
-        employee_history_service: EmployeeHistoryService = Depends(Provide[Container.employee_history_service])
+        employee_history_service: EmployeeHistoryService = Depends(_get_employee_history_service)
 ):
     """
     # 🔍 특정 직원 히스토리 조회 API
@@ -73,9 +110,18 @@ def get_employee_history(
     - **`CommonResponseDto[EmployeeHistoryResponseDto]`**
       조회된 **직원 히스토리 정보 반환**
 
+    ## 📌 캐시:
+    - 히스토리는 수정되지 않으므로 **`ETag`** 는 seq 기준으로 고정
+    - **`If-None-Match`** 가 일치하면 DB 조회 없이 **`304 Not Modified`** 반환
+
     ## ⚠️ Raises:
     - **`HTTPException`**:
       - 직원 히스토리가 존재하지 않을 경우 **`404 Not Found`** 오류 반환
     """
+    etag = EtagProvider.make(employee_history_seq)
+    not_modified = EtagProvider.not_modified(request, etag)
+    if not_modified:
+        return not_modified
+
     employee_history = employee_history_service.get_employee_history_by_seq(db, employee_history_seq)
-    return CommonResponseDto(status="success", data=employee_history, message=None)
+    return EtagProvider.attach(ok(employee_history), etag)
@@ -1,36 +1,50 @@
-from fastapi import Depends, Query, status
-from dependency_injector.wiring import inject, Provide
+from typing import List, Literal
+import orjson
+from fastapi import Depends, Query, Request, status
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
-from src.core.container import Container
+from src.core.container import service_dependency
+from src.core.database import session_factory
+from src.core.fast_response import ok
 from src.core.session import get_db
-from src.dto.request.employee.employee_update_request_dto import EmployeeUpdateRequestDto
-from src.dto.response.paginated_response_dto import PaginatedResponseDto
+from src.dto.request.employee.employee_update_request_dto import EmployeeUpdateRequestDto, EmployeeBulkUpdateRequestDto
+from src.dto.response.keyset_paginated_response_dto import KeysetPaginatedResponseDto
+from src.provider.cursor_provider import CursorProvider
+from src.provider.etag_provider import EtagProvider
 from src.logging.api_logging_router import APILoggingRouter
 from src.service.employee.employee_service import EmployeeService
 from src.dto.request.employee.employee_create_request_dto import EmployeeCreateRequestDto
 from src.dto.response.employee.employee_response_dto import EmployeeResponseDto
+from src.dto.response.employee.employee_detail_response_dto import EmployeeDetailResponseDto
 from src.dto.response.common_response_dto import CommonResponseDto
 
 # 직원 관리 관련 API 엔드포인트를 정의하는 APIRouter
 router = APILoggingRouter()
 
+# 요청마다 wiring을 거치지 않도록 서비스 인스턴스를 한 번만 조회하여 재사용
+_get_employee_service = service_dependency("employee_service")
 
-@router.get("/", response_model=CommonResponseDto[PaginatedResponseDto[EmployeeResponseDto]])
-@inject
+# 직원 목록을 한 번의 호출로 검증/변환하는 TypeAdapter (모듈 로딩 시 1회 생성)
+_employee_list_adapter = TypeAdapter(List[EmployeeResponseDto])
+
+
+@router.get("/", response_model=CommonResponseDto[KeysetPaginatedResponseDto[EmployeeResponseDto]])
 def get_employees(
-        page: int = Query(1, ge=1, description="현재 페이지 (1부터 시작)"),
+        cursor: str | None = Query(None, description="다음 페이지 조회 커서 (첫 페이지는 생략, 이전 응답의 next_cursor 사용)"),
         size: int = Query(10, ge=1, description="페이지 크기"),
         sort_by: str | None = Query(None, description="정렬 기준 컬럼명 (예: 'seq', 'name')"),
-        order: str = Query("asc", regex="^(asc|desc)$", description="정렬 순서 ('asc' 또는 'desc')"),
+        order: Literal["asc", "desc"] = Query("asc", description="정렬 순서 ('asc' 또는 'desc')"),
         db: Session = Depends(get_db),
-        employee_service: EmployeeService = Depends(Provide[Container.employee_service])
+        employee_service: EmployeeService = Depends(_get_employee_service)
 ):
     """
-    # 📌 직원 목록 조회 API (페이징 및 정렬 지원)
+    # 📌 직원 목록 조회 API (키셋 페이지네이션 및 정렬 지원)
 
     ## 📝 Args:
-    - **`page`** (`int`): 현재 페이지 번호 (**1부터 시작**)
+    - **`cursor`** (`str | None`): 다음 페이지 조회 커서
+      - 첫 페이지는 생략하고, 이후에는 이전 응답의 `next_cursor` 값을 전달
     - **`size`** (`int`): 페이지 크기 (**한 페이지당 직원 수**)
     - **`sort_by`** (`str | None`): 정렬 기준 컬럼명
       - 예시: `'seq'`, `'name'`
@@ -39,32 +53,85 @@ def get_employees(
     - **`employee_service`** (`EmployeeService`): 직원 서비스 **의존성 주입**
 
     ## 📤 Returns:
-    - **`CommonResponseDto[PaginatedResponseDto[EmployeeResponseDto]]`**
-      직원 목록과 페이지네이션 정보 반환
-    """
-    employees, total_count = employee_service.get_employees(db, page, size, sort_by, order)
-    employee_responses = [EmployeeResponseDto.model_validate(e) for e in employees]
-    total_pages = (total_count + size - 1) // size
-
-    return CommonResponseDto(
-        status="success",
-        data=PaginatedResponseDto(
-            items=employee_responses,
-            total=total_count,
-            page=page,
-            size=size,
-            total_pages=total_pages
-        ),
-        message=None
+    - **`CommonResponseDto[KeysetPaginatedResponseDto[EmployeeResponseDto]]`**
+      직원 목록과 다음 페이지 커서 반환
+
+    ## ⚠️ Raises:
+    - **`HTTPException`**:
+      - 커서 형식이 올바르지 않은 경우 **`400 Bad Request`** 오류 반환
+    """
+    employees, has_more = employee_service.get_employees(db, CursorProvider.decode(cursor), size, sort_by, order)
+    # 응답 DTO 검증 후 JSON 호환 값으로 한 번에 변환하여, response_model 재검증 없이 orjson으로 바로 직렬화
+    employee_responses = _employee_list_adapter.dump_python(
+        _employee_list_adapter.validate_python(employees, from_attributes=True), mode="json"
     )
+    next_cursor = CursorProvider.next_cursor(employees, has_more, sort_by)
+
+    return ok({
+        "items": employee_responses,
+        "size": size,
+        "next_cursor": next_cursor,
+        "has_more": has_more
+    })
+
+
+@router.get("/count", response_model=CommonResponseDto[int])
+def count_employees(
+        db: Session = Depends(get_db),
+        employee_service: EmployeeService = Depends(_get_employee_service)
+):
+    """
+    # 🔢 전체 직원 수 조회 API
+    - 목록 조회 API는 COUNT(*)를 수행하지 않으므로, 전체 개수가 필요한 경우에만 별도로 호출
+    - 직원이 10만 명 이상이면 통계 기반 **근사값**을 반환 (논리 삭제된 직원이 포함될 수 있음)
+
+    ## 📝 Args:
+    - **`employee_service`** (`EmployeeService`): 직원 서비스 **의존성 주입**
+
+    ## 📤 Returns:
+    - **`CommonResponseDto[int]`**
+      전체 **직원 수 반환**
+    """
+    total_count = employee_service.count_employees(db)
+    return CommonResponseDto(status="success", data=total_count, message=None)
+
+
+@router.get("/stream", response_class=StreamingResponse)
+def stream_employees(
+        employee_service: EmployeeService = Depends(_get_employee_service)
+):
+    """
+    # 📌 전체 직원 내보내기 API (NDJSON 스트리밍)
+    - 직원 한 건당 한 줄의 JSON으로 응답 (`application/x-ndjson`), seq 오름차순
+    - 서버 사이드 커서로 500건씩 읽어 바로 전송하므로, 직원 수와 관계없이 메모리 사용량이 일정하고
+      마지막 행을 읽기 전에 첫 응답 바이트가 전송됨
+    - 목록 조회 API의 size를 크게 지정하여 전체를 받는 대신 이 API를 사용
+
+    ## 📝 Args:
+    - **`employee_service`** (`EmployeeService`): 직원 서비스 **의존성 주입**
+
+    ## 📤 Returns:
+    - **`StreamingResponse`**
+      직원 정보(NDJSON) 스트림 반환 (EmployeeResponseDto와 동일한 필드 구성)
+    """
+    def generate():
+        # 요청 스코프 세션은 응답 전송 전에 정리되므로, 스트리밍 동안 사용할 세션을 직접 열고 닫는다.
+        db = session_factory()
+        try:
+            for row in employee_service.stream_employees(db):
+                yield orjson.dumps(row._asdict()) + b"\n"
+        finally:
+            db.close()
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
 
 
 @router.get("/{employee_seq}", response_model=CommonResponseDto[EmployeeResponseDto])
-@inject
 def get_employee(
         employee_seq: int,
+        request: Request,
         db: Session = Depends(get_db),
-        employee_service: EmployeeService = Depends(Provide[Container.employee_service])
+        employee_service: EmployeeService = Depends(_get_employee_service)
 ):
     """
     # 🔍 특정 직원 조회 API
@@ -77,20 +144,56 @@ def get_employee(
     - **`CommonResponseDto[EmployeeResponseDto]`**
       조회된 **직원 정보 반환**
 
+    ## 📌 캐시:
+    - 응답에 **`ETag`** 헤더 포함 (직원 seq + 수정 시각 기준)
+    - **`If-None-Match`** 가 일치하면 수정 시각만 조회하고 **`304 Not Modified`** 반환
+
     ## ⚠️ Raises:
     - **`HTTPException`**:
       - 직원이 존재하지 않을 경우 **`404 Not Found`** 오류 반환
     """
+    # 조건부 요청이면 수정 시각만 먼저 조회하여 변경 여부 확인
+    if EtagProvider.is_requested(request):
+        updated_at = employee_service.get_employee_updated_at(db, employee_seq)
+        etag = EtagProvider.make(employee_seq, updated_at) if updated_at else None
+        not_modified = EtagProvider.not_modified(request, etag)
+        if not_modified:
+            return not_modified
+
     employee = employee_service.get_employee_by_seq(db, employee_seq)
-    return CommonResponseDto(status="success", data=employee, message=None)
+    return EtagProvider.attach(ok(employee), EtagProvider.make(employee.seq, employee.updated_at))
+
+
+@router.get("/{employee_seq}/detail", response_model=CommonResponseDto[EmployeeDetailResponseDto])
+def get_employee_detail(
+        employee_seq: int,
+        db: Session = Depends(get_db),
+        employee_service: EmployeeService = Depends(_get_employee_service)
+):
+    """
+    # 🔍 특정 직원 상세 조회 API (소속 조직, 직책, 직위 포함)
+
+    ## 📝 Args:
+    - **`employee_seq`** (`int`): 조회할 직원 **ID**
+    - **`employee_service`** (`EmployeeService`): 직원 서비스 **의존성 주입**
+
+    ## 📤 Returns:
+    - **`CommonResponseDto[EmployeeDetailResponseDto]`**
+      조회된 **직원 정보와 소속 조직, 직책, 직위 정보 반환**
+
+    ## ⚠️ Raises:
+    - **`HTTPException`**:
+      - 직원이 존재하지 않을 경우 **`404 Not Found`** 오류 반환
+    """
+    employee_detail = employee_service.get_employee_detail(db, employee_seq)
+    return CommonResponseDto(status="success", data=employee_detail, message=None)
 
 
 @router.post("/", response_model=CommonResponseDto[EmployeeResponseDto], status_code=status.HTTP_201_CREATED)
-@inject
 def create_employee(
         employee_create_request_dto: EmployeeCreateRequestDto,
         db: Session = Depends(get_db),
-        employee_service: EmployeeService = Depends(Provide[Container.employee_service])
+        employee_service: EmployeeService = Depends(_get_employee_service)
 ):
     """
     # 🆕 새 직원 생성 API
@@ -113,13 +216,71 @@ def create_employee(
     return CommonResponseDto(status="success", data=employee, message="Employee created successfully")
 
 
+@router.post("/bulk", response_model=CommonResponseDto[List[EmployeeResponseDto]], status_code=status.HTTP_201_CREATED)
+def create_employees(
+        employee_create_request_dtos: List[EmployeeCreateRequestDto],
+        db: Session = Depends(get_db),
+        employee_service: EmployeeService = Depends(_get_employee_service)
+):
+    """
+    # 🆕 여러 직원 일괄 생성 API
+    - 전체 요청을 하나의 트랜잭션과 다중 행 INSERT로 처리 (대량 등록용)
+
+    ## 📝 Args:
+    - **`employee_create_request_dtos`** (`List[EmployeeCreateRequestDto]`):
+      - 직원 생성 요청 데이터 목록
+    - **`employee_service`** (`EmployeeService`):
+      - 직원 서비스 **의존성 주입**
+
+    ## 📤 Returns:
+    - **`CommonResponseDto[List[EmployeeResponseDto]]`**
+      - 생성된 **직원 정보 목록 반환** (요청 순서 유지)
+
+    ## ⚠️ Raises:
+    - **`HTTPException`**:
+      - 요청 내 email이 중복되거나 이미 존재하는 email이 포함된 경우 **`400 Bad Request`** 오류 반환 (전체 롤백)
+    """
+    employees = employee_service.create_employees(db, employee_create_request_dtos)
+    employee_responses = _employee_list_adapter.validate_python(employees, from_attributes=True)
+    return CommonResponseDto(status="success", data=employee_responses, message="Employees created successfully")
+
+
+@router.patch("/bulk", response_model=CommonResponseDto[List[EmployeeResponseDto]], status_code=status.HTTP_200_OK)
+def update_employees(
+        employee_update_request_dtos: List[EmployeeBulkUpdateRequestDto],
+        db: Session = Depends(get_db),
+        employee_service: EmployeeService = Depends(_get_employee_service)
+):
+    """
+    # 🔐 여러 직원 정보 일괄 업데이트 API
+    - 직원마다 서로 다른 수정 값을 하나의 트랜잭션과 bulk UPDATE로 처리
+
+    ## 📝 Args:
+    - **`employee_update_request_dtos`** (`List[EmployeeBulkUpdateRequestDto]`):
+      - `employee_seq`를 포함한 **수정할 요청 데이터 목록**
+    - **`employee_service`** (`EmployeeService`):
+      - 직원 서비스 **의존성 주입**
+
+    ## 📤 Returns:
+    - **`CommonResponseDto[List[EmployeeResponseDto]]`**
+      - 수정된 **직원 정보 목록 반환** (요청 순서 유지)
+
+    ## ⚠️ Raises:
+    - **`HTTPException`**:
+      - 존재하지 않는 직원이 포함된 경우 **`404 Not Found`** 오류 반환 (전체 롤백)
+      - 수정할 데이터가 없는 요청이 포함된 경우 **`400 Bad Request`** 오류 반환 (전체 롤백)
+    """
+    employees = employee_service.update_employees(db, employee_update_request_dtos)
+    employee_responses = _employee_list_adapter.validate_python(employees, from_attributes=True)
+    return CommonResponseDto(status="success", data=employee_responses, message="Employees updated successfully")
+
+
 @router.patch("/{employee_seq}", response_model=CommonResponseDto[EmployeeResponseDto], status_code=status.HTTP_200_OK)
-@inject
 def update_employee(
         employee_seq: int,
         employee_update_request_dto: EmployeeUpdateRequestDto,
         db: Session = Depends(get_db),
-        employee_service: EmployeeService = Depends(Provide[Container.employee_service])
+        employee_service: EmployeeService = Depends(_get_employee_service)
 ):
     """
     # 🔐 특정 직원 정보를 업데이트하는 API
@@ -145,11 +306,10 @@ def update_employee(
     return CommonResponseDto(status="success", data=employee, message="Employee updated successfully")
 
 @router.delete("/{employee_seq}", response_model=CommonResponseDto[None], status_code=status.HTTP_200_OK)
-@inject
 def delete_employee(
         employee_seq: int,
         db: Session = Depends(get_db),
-        employee_service: EmployeeService = Depends(Provide[Container.employee_service])
+        employee_service: EmployeeService = Depends(_get_employee_service)
 ):
     """
     # 🗑 특정 직원 삭제 API
@@ -173,11 +333,10 @@ def delete_employee(
 
 
 @router.patch("/{employee_seq}/soft-delete", response_model=CommonResponseDto[EmployeeResponseDto], status_code=status.HTTP_200_OK)
-@inject
 def soft_delete_employee(
         employee_seq: int,
         db: Session = Depends(get_db),
-        employee_service: EmployeeService = Depends(Provide[Container.employee_service])
+        employee_service: EmployeeService = Depends(_get_employee_service)
 ):
     """
     # 🗄 특정 직원 소프트 삭제 API
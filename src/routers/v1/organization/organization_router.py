@@ -1,30 +1,47 @@
-from fastapi import Depends, status, Query
-from dependency_injector.wiring import inject, Provide
+import orjson
+from fastapi import Depends, Request, status, Query
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
-from typing import List, Optional
-from src.core.container import Container
+from starlette.concurrency import run_in_threadpool
+from typing import List, Optional, Literal
+from src.core.container import service_dependency
+from src.core.database import session_factory
+from src.core.fast_response import ok, ok_json
 from src.core.session import get_db
-from src.dto.request.organization.organization_create_request_dto import TeamCreateRequestDto, HeadquartersCreateRequestDto, DepartmentCreateRequestDto
+from src.dto.request.organization.organization_create_request_dto import TeamCreateRequestDto, HeadquartersCreateRequestDto, DepartmentCreateRequestDto, OrganizationBulkCreateRequestDto
 from src.dto.request.organization.organization_update_request_dto import OrganizationNameAndVisibleUpdateRequestDto, OrganizationMoveRequestDto
 from src.dto.response.organization.organization_response_dto import OrganizationResponseDto
 from src.dto.response.common_response_dto import CommonResponseDto
 from src.dto.response.paginated_response_dto import PaginatedResponseDto
 from src.logging.api_logging_router import APILoggingRouter
+from src.provider.cursor_provider import CursorProvider
+from src.provider.etag_provider import EtagProvider
 from src.service.organization.organization_service import OrganizationService
 
 router = APILoggingRouter()
 
+# 요청마다 wiring을 거치지 않도록 서비스 인스턴스를 한 번만 조회하여 재사용
+_get_organization_service = service_dependency("organization_service")
+
+# 조직 목록 정렬에 허용되는 컬럼 (요청 검증 단계에서 허용 값만 통과)
+OrganizationSortBy = Literal["seq", "name", "level", "parent_seq", "created_at", "updated_at"]
+
+# 조직 목록을 한 번의 호출로 검증/변환하는 TypeAdapter (모듈 로딩 시 1회 생성)
+_organization_list_adapter = TypeAdapter(List[OrganizationResponseDto])
+
 @router.get("/", response_model=CommonResponseDto[PaginatedResponseDto[OrganizationResponseDto]])
-@inject
 def get_organizations(
         page: int = Query(1,  ge=1, description="현재 페이지 (1부터 시작)"),
         size: int = Query(10, ge=1, description="페이지 크기"),
-        sort_by: str | None       = Query(None, description="정렬 기준 컬럼명 (예: 'seq', 'name')"),
-        order: str                = Query("asc", regex="^(asc|desc)$", description="정렬 순서 ('asc' 또는 'desc')"),
+        cursor: str | None = Query(None, description="다음 페이지 조회 커서 (지정하면 page 대신 사용, 이전 응답의 next_cursor 사용)"),
+        sort_by: Optional[OrganizationSortBy] = Query(None, description="정렬 기준 컬럼명 (예: 'seq', 'name')"),
+        order: Literal["asc", "desc"] = Query("asc", description="정렬 순서 ('asc' 또는 'desc')"),
         level: Optional[int]      = Query(None, description="조직 수준 (1: 부문, 2: 본부, 3: 팀)"),
         parent_seq: Optional[int] = Query(None, description="상위 조직 seq"),
+        include_total: bool       = Query(False, description="전체 개수(total, total_pages) 포함 여부 (true일 때만 COUNT 수행)"),
         db: Session = Depends(get_db),
-        organization_service: OrganizationService = Depends(Provide[Container.organization_service])
+        organization_service: OrganizationService = Depends(_get_organization_service)
 ):
     """
     # 📌 조직 목록 조회 API (페이징 및 정렬 지원)
@@ -32,6 +49,8 @@ def get_organizations(
     ## 📝 Args:
     - **`page`** (`int`): 현재 페이지 번호 (**1부터 시작**)
     - **`size`** (`int`): 페이지 크기 (**한 페이지당 조직 수**)
+    - **`cursor`** (`str | None`): 다음 페이지 조회 커서
+      - 지정하면 `page` 대신 커서 이후부터 조회 (**키셋 페이지네이션, 뒤쪽 페이지도 OFFSET 없이 조회**)
     - **`sort_by`** (`str | None`): 정렬 기준 컬럼명
       - 예시: `'seq'`, `'name'`
     - **`order`** (`str`): 정렬 방향
@@ -39,34 +58,38 @@ def get_organizations(
     - **`level`** (`int`): 조직 수준
       - `"1"` (부문) | `"2"` (본부) | `"3"` (팀)
     - **`parent_seq`** (`int`): 상위 조직 seq
+    - **`include_total`** (`bool`): 전체 개수 포함 여부
+      - 기본값 `false`: `total`, `total_pages` 없이 `has_more`로 다음 페이지 여부만 반환 (**COUNT 쿼리 생략**)
+      - `true`: 전체 개수를 조회하여 `total`, `total_pages` 포함
+        (level/parent_seq 필터 없이 조회하는 10만 건 이상 대용량 테이블은 통계 기반 **근사값**이며, 논리 삭제된 행이 포함될 수 있음)
     - **`organization_service`** (`OrganizationService`): 조직 서비스 **의존성 주입**
 
     ## 📤 Returns:
     - **`CommonResponseDto[PaginatedResponseDto[OrganizationResponseDto]]`**
       조직 목록과 페이지네이션 정보 반환
     """
-    organizations, total_count = organization_service.get_organizations(db, page, size, sort_by, order, level, parent_seq)
-    organization_responses = [OrganizationResponseDto.model_validate(e) for e in organizations]
-    total_pages = (total_count + size - 1) // size
-
-    return CommonResponseDto(
-        status="success",
-        data=PaginatedResponseDto(
-            items=organization_responses,
-            total=total_count,
-            page=page,
-            size=size,
-            total_pages=total_pages
-        ),
-        message=None
+    organizations, has_more, total_count = organization_service.get_organizations(db, page, size, sort_by, order, level, parent_seq, include_total, CursorProvider.decode(cursor))
+    # 응답 DTO 검증 후 JSON 호환 값으로 한 번에 변환하여, response_model 재검증 없이 orjson으로 바로 직렬화
+    organization_responses = _organization_list_adapter.dump_python(
+        _organization_list_adapter.validate_python(organizations, from_attributes=True), mode="json"
     )
 
+    return ok({
+        "items": organization_responses,
+        "page": page,
+        "size": size,
+        "has_more": has_more,
+        "next_cursor": CursorProvider.next_cursor(organizations, has_more, sort_by),
+        "total": total_count,
+        "total_pages": -(-total_count // size) if total_count is not None else None,
+    })
+
 
 @router.get("/hierarchy", response_model=CommonResponseDto[List[OrganizationResponseDto]])
-@inject
-def get_organization_hierarchy(
+async def get_organization_hierarchy(
+        request: Request,
         db: Session = Depends(get_db),
-        organization_service: OrganizationService = Depends(Provide[Container.organization_service])
+        organization_service: OrganizationService = Depends(_get_organization_service)
 ):
     """
     - 부문 → 본부 → 팀 순서로 계층 구조를 반환
@@ -78,17 +101,62 @@ def get_organization_hierarchy(
     ## 📤 Returns:
     - **`CommonResponseDto[List[OrganizationResponseDto]]`**
       전체 조직도 목록 반환 (부문 → 본부 → 팀 순서로 계층 구조를 반환)
+
+    ## 📌 캐시:
+    - 조직도는 직렬화된 JSON까지 캐시되며, 조직 생성/수정/이동/삭제 시 무효화
+    - 캐시된 조직도가 최신이면 스레드풀을 거치지 않고 이벤트 루프에서 바로 응답 (DTO 검증/직렬화 생략)
+    - 캐시가 없거나 조직이 변경된 경우에만 스레드풀에서 DB를 조회
+    - 응답에 **`ETag`** 헤더 포함 (조직도 JSON 내용 기준)
+    - **`If-None-Match`** 가 일치하면 **`304 Not Modified`** 반환
+    """
+    cached = organization_service.get_cached_organization_tree_json()
+    if cached is None:
+        cached = await run_in_threadpool(organization_service.get_organization_tree_json, db)
+    organization_tree_json, organization_tree_digest = cached
+
+    etag = EtagProvider.make(organization_tree_digest)
+    not_modified = EtagProvider.not_modified(request, etag)
+    if not_modified:
+        return not_modified
+
+    return EtagProvider.attach(ok_json(organization_tree_json), etag)
+
+
+@router.get("/hierarchy/stream", response_class=StreamingResponse)
+def stream_organization_hierarchy(
+        organization_service: OrganizationService = Depends(_get_organization_service)
+):
     """
-    organization_tree = organization_service.get_organization_tree(db)
-    return CommonResponseDto(status="success", data=organization_tree, message=None)
+    # 📌 전체 조직 내보내기 API (NDJSON 스트리밍)
+    - 조직 한 건당 한 줄의 JSON으로 응답 (`application/x-ndjson`)
+    - 부문 → 본부 → 팀 순서(level, parent_seq, seq)로 전송되므로, 상위 조직이 항상 먼저 나옴
+    - 서버 사이드 커서로 500건씩 읽어 전송하므로 조직 수와 관계없이 메모리 사용량이 일정함
+
+    ## 📝 Args:
+    - **`organization_service`** (`OrganizationService`): 조직 서비스 **의존성 주입**
+
+    ## 📤 Returns:
+    - **`StreamingResponse`**
+      조직 정보(NDJSON) 스트림 반환 (children 없이 parent_seq로 계층 표현)
+    """
+    def generate():
+        # 요청 스코프 세션은 응답 전송 전에 정리되므로, 스트리밍 동안 사용할 세션을 직접 열고 닫는다.
+        db = session_factory()
+        try:
+            for row in organization_service.stream_organizations(db):
+                yield orjson.dumps(row._asdict()) + b"\n"
+        finally:
+            db.close()
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
 
 
 @router.get("/{organization_seq}", response_model=CommonResponseDto[OrganizationResponseDto])
-@inject
 def get_organization(
+        request: Request,
         organization_seq: int,
         db: Session = Depends(get_db),
-        organization_service: OrganizationService = Depends(Provide[Container.organization_service])
+        organization_service: OrganizationService = Depends(_get_organization_service)
 ):
     """
     # 🆕 특정 조직 조회 API
@@ -100,19 +168,30 @@ def get_organization(
     ## 📤 Returns:
     - `CommonResponseDto[OrganizationResponseDto]`: 조회된 조직 정보
 
+    ## 📌 캐시:
+    - 응답에 **`ETag`** 헤더 포함 (조직 seq + 수정 시각 기준)
+    - **`If-None-Match`** 가 일치하면 수정 시각만 조회하고 **`304 Not Modified`** 반환
+
     ## ⚠️ Raises:
     - **`HTTPException`**:
       - 조직이 존재하지 않을 경우 **`404 Not Found`** 오류 반환
     """
+    # 조건부 요청이면 수정 시각만 먼저 조회하여 변경 여부 확인
+    if EtagProvider.is_requested(request):
+        updated_at = organization_service.get_organization_updated_at(db, organization_seq)
+        etag = EtagProvider.make(organization_seq, updated_at) if updated_at else None
+        not_modified = EtagProvider.not_modified(request, etag)
+        if not_modified:
+            return not_modified
+
     organization = organization_service.get_organization_by_seq(db, organization_seq)
-    return CommonResponseDto(status="success", data=organization, message=None)
+    return EtagProvider.attach(ok(organization), EtagProvider.make(organization.seq, organization.updated_at))
 
 @router.post("/departments", response_model=CommonResponseDto[OrganizationResponseDto], status_code=status.HTTP_201_CREATED)
-@inject
 def create_department(
         department_create_request_dto: DepartmentCreateRequestDto,
         db: Session = Depends(get_db),
-        organization_service: OrganizationService = Depends(Provide[Container.organization_service])
+        organization_service: OrganizationService = Depends(_get_organization_service)
 ):
     """
     # 🆕 부문 생성 API (level=1)
@@ -133,15 +212,14 @@ def create_department(
       - parent_seq 가 이미 존재하는 경우 **`400 Bad Request`** 오류 반환
     """
     department = organization_service.create_department(db, department_create_request_dto)
-    return CommonResponseDto(status="success", data=department, message="Department created successfully")
+    return ok(department, "Department created successfully", status.HTTP_201_CREATED)
 
 
 @router.post("/headquarters", response_model=CommonResponseDto[OrganizationResponseDto], status_code=status.HTTP_201_CREATED)
-@inject
 def create_headquarters(
         headquarters_create_request_dto: HeadquartersCreateRequestDto,
         db: Session = Depends(get_db),
-        organization_service: OrganizationService = Depends(Provide[Container.organization_service])
+        organization_service: OrganizationService = Depends(_get_organization_service)
 ):
     """
     # 🆕 본부 생성 API (level=2)
@@ -163,15 +241,14 @@ def create_headquarters(
       - 유효한 부문 ID가 아닌 경우 **`400 Bad Request`** 오류 반환
     """
     headquarters = organization_service.create_headquarters(db, headquarters_create_request_dto)
-    return CommonResponseDto(status="success", data=headquarters, message="Headquarters created successfully")
+    return ok(headquarters, "Headquarters created successfully", status.HTTP_201_CREATED)
 
 
 @router.post("/teams", response_model=CommonResponseDto[OrganizationResponseDto], status_code=status.HTTP_201_CREATED)
-@inject
 def create_team(
         team_create_request_dto: TeamCreateRequestDto,
         db: Session = Depends(get_db),
-        organization_service: OrganizationService = Depends(Provide[Container.organization_service])
+        organization_service: OrganizationService = Depends(_get_organization_service)
 ):
     """
     # 🆕 팀 생성 API (level=3)
@@ -193,16 +270,47 @@ def create_team(
       - 유효한 본부 ID가 아닌 경우 **`400 Bad Request`** 오류 반환
     """
     team = organization_service.create_team(db, team_create_request_dto)
-    return CommonResponseDto(status="success", data=team, message="Team created successfully")
+    return ok(team, "Team created successfully", status.HTTP_201_CREATED)
+
+
+@router.post("/bulk", response_model=CommonResponseDto[List[OrganizationResponseDto]], status_code=status.HTTP_201_CREATED)
+def create_organizations(
+        organization_create_request_dtos: List[OrganizationBulkCreateRequestDto],
+        db: Session = Depends(get_db),
+        organization_service: OrganizationService = Depends(_get_organization_service)
+):
+    """
+    # 🆕 여러 조직 일괄 생성 API
+    - 부문/본부/팀을 섞어서 요청할 수 있으며, 전체 요청을 하나의 트랜잭션으로 처리 (대량 등록용)
+    - 상위 조직은 이미 존재하는 조직이어야 함
+
+    ## 📝 Args:
+    - **`organization_create_request_dtos`** (`List[OrganizationBulkCreateRequestDto]`):
+      - 조직 생성 요청 데이터 목록
+    - **`organization_service`** (`OrganizationService`):
+      - 조직 서비스 **의존성 주입**
+
+    ## 📤 Returns:
+    - **`CommonResponseDto[List[OrganizationResponseDto]]`**
+      - 생성된 **조직 정보 목록 반환** (요청 순서 유지)
+
+    ## ⚠️ Raises:
+    - **`HTTPException`**:
+      - 부문에 parent_seq 가 있는 경우 **`400 Bad Request`** 오류 반환 (전체 롤백)
+      - 본부/팀에 parent_seq 가 없는 경우 **`400 Bad Request`** 오류 반환 (전체 롤백)
+      - 상위 조직이 유효한 부문/본부가 아닌 경우 **`400 Bad Request`** 오류 반환 (전체 롤백)
+    """
+    organizations = organization_service.create_organizations(db, organization_create_request_dtos)
+    organization_responses = _organization_list_adapter.validate_python(organizations, from_attributes=True)
+    return CommonResponseDto(status="success", data=organization_responses, message="Organizations created successfully")
 
 
 @router.patch("/{organization_seq}", response_model=CommonResponseDto[OrganizationResponseDto])
-@inject
 def update_organization(
         organization_seq: int,
         request: OrganizationNameAndVisibleUpdateRequestDto,
         db: Session = Depends(get_db),
-        organization_service: OrganizationService = Depends(Provide[Container.organization_service])
+        organization_service: OrganizationService = Depends(_get_organization_service)
 ):
     """
     # 🔐 특정 조직의 이름과 노출 여부를 업데이트 하는 API
@@ -229,11 +337,10 @@ def update_organization(
     return CommonResponseDto(status="success", data=organization, message="Organization updated successfully")
 
 @router.patch("/{organization_seq}/move", response_model=CommonResponseDto[OrganizationResponseDto])
-@inject
 def move_organization(
         organization_move_request: OrganizationMoveRequestDto,
         db: Session = Depends(get_db),
-        organization_service: OrganizationService = Depends(Provide[Container.organization_service])
+        organization_service: OrganizationService = Depends(_get_organization_service)
 ):
     """
     # 🔐 특정 조직이 속한 조직 정보를 업데이트 하는 API
@@ -258,11 +365,10 @@ def move_organization(
     return CommonResponseDto(status="success", data=organization, message="Organization moved successfully")
 
 @router.delete("/{organization_seq}", response_model=CommonResponseDto[None])
-@inject
 def delete_organization(
         organization_seq: int,
         db: Session = Depends(get_db),
-        organization_service: OrganizationService = Depends(Provide[Container.organization_service])
+        organization_service: OrganizationService = Depends(_get_organization_service)
 ):
     """
     # 🗄 특정 조직 삭제 API
@@ -288,11 +394,10 @@ def delete_organization(
     return CommonResponseDto(status="success", data=None, message="Organization deleted successfully")
 
 @router.patch("/{organization_seq}/soft-delete", response_model=CommonResponseDto[OrganizationResponseDto], status_code=status.HTTP_200_OK)
-@inject
 def soft_delete_organization(
         organization_seq: int,
         db: Session = Depends(get_db),
-        organization_service: OrganizationService = Depends(Provide[Container.organization_service])
+        organization_service: OrganizationService = Depends(_get_organization_service)
 ):
     """
     # 🗄 특정 조직 소프트 삭제 API
@@ -1,13 +1,17 @@
+from typing import List, Literal, Optional
+
 from fastapi import Depends, Query, status
-from dependency_injector.wiring import inject, Provide
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
-from src.core.container import Container
+from src.core.container import service_dependency
+from src.core.fast_response import ok
 from src.core.session import get_db
 from src.dto.request.position.position_update_request_dto import PositionUpdateRequestDto
 from src.dto.response.paginated_response_dto import PaginatedResponseDto
 from src.dto.response.position.position_response_dto import PositionResponseDto
 from src.logging.api_logging_router import APILoggingRouter
+from src.provider.cursor_provider import CursorProvider
 from src.service.position.position_service import PositionService
 from src.dto.request.position.position_create_request_dto import PositionCreateRequestDto
 from src.dto.response.common_response_dto import CommonResponseDto
@@ -15,16 +19,26 @@ from src.dto.response.common_response_dto import CommonResponseDto
 # 직책 관리 관련 API 엔드포인트를 정의하는 APIRouter
 router = APILoggingRouter()
 
+# 요청마다 wiring을 거치지 않도록 서비스 인스턴스를 한 번만 조회하여 재사용
+_get_position_service = service_dependency("position_service")
+
+# 직책 목록 정렬에 허용되는 컬럼 (요청 검증 단계에서 허용 값만 통과)
+PositionSortBy = Literal["seq", "title", "role_seq", "created_at", "updated_at"]
+
+# 직책 목록을 한 번의 호출로 검증/변환하는 TypeAdapter (모듈 로딩 시 1회 생성)
+_position_list_adapter = TypeAdapter(List[PositionResponseDto])
+
 
 @router.get("/", response_model=CommonResponseDto[PaginatedResponseDto[PositionResponseDto]])
-@inject
 def get_positions(
         page: int = Query(1, ge=1, description="현재 페이지 (1부터 시작)"),
         size: int = Query(10, ge=1, description="페이지 크기"),
-        sort_by: str | None = Query(None, description="정렬 기준 컬럼명 (예: 'seq', 'title')"),
-        order: str = Query("asc", regex="^(asc|desc)$", description="정렬 순서 ('asc' 또는 'desc')"),
+        cursor: str | None = Query(None, description="다음 페이지 조회 커서 (지정하면 page 대신 사용, 이전 응답의 next_cursor 사용)"),
+        sort_by: Optional[PositionSortBy] = Query(None, description="정렬 기준 컬럼명 (예: 'seq', 'title')"),
+        order: Literal["asc", "desc"] = Query("asc", description="정렬 순서 ('asc' 또는 'desc')"),
+        include_total: bool = Query(False, description="전체 개수(total, total_pages) 포함 여부 (true일 때만 COUNT 수행)"),
         db: Session = Depends(get_db),
-        position_service: PositionService = Depends(Provide[Container.position_service])
+        position_service: PositionService = Depends(_get_position_service)
 ):
     """
     # 📌 직책 목록 조회 API (페이징 및 정렬 지원)
@@ -32,39 +46,44 @@ def get_positions(
     ## 📝 Args:
     - **`page`** (`int`): 현재 페이지 번호 (**1부터 시작**)
     - **`size`** (`int`): 페이지 크기 (**한 페이지당 직책 수**)
+    - **`cursor`** (`str | None`): 다음 페이지 조회 커서
+      - 지정하면 `page` 대신 커서 이후부터 조회 (**키셋 페이지네이션, 뒤쪽 페이지도 OFFSET 없이 조회**)
     - **`sort_by`** (`str | None`): 정렬 기준 컬럼명
       - 예시: `'seq'`, `'name'`
     - **`order`** (`str`): 정렬 방향
       - `"asc"` (오름차순) | `"desc"` (내림차순)
+    - **`include_total`** (`bool`): 전체 개수 포함 여부
+      - 기본값 `false`: `total`, `total_pages` 없이 `has_more`로 다음 페이지 여부만 반환 (**COUNT 쿼리 생략**)
+      - `true`: 전체 개수를 조회하여 `total`, `total_pages` 포함
+        (필터 없이 조회하는 10만 건 이상 대용량 테이블은 통계 기반 **근사값**이며, 논리 삭제된 행이 포함될 수 있음)
     - **`position_service`** (`PositionService`): 직책 서비스 **의존성 주입**
 
     ## 📤 Returns:
     - **`CommonResponseDto[PaginatedResponseDto[PositionResponseDto]]`**
       직책 목록과 페이지네이션 정보 반환
     """
-    positions, total_count = position_service.get_positions(db, page, size, sort_by, order)
-    position_responses = [PositionResponseDto.model_validate(e) for e in positions]
-    total_pages = (total_count + size - 1) // size
-
-    return CommonResponseDto(
-        status="success",
-        data=PaginatedResponseDto(
-            items=position_responses,
-            total=total_count,
-            page=page,
-            size=size,
-            total_pages=total_pages
-        ),
-        message=None
+    positions, has_more, total_count = position_service.get_positions(db, page, size, sort_by, order, include_total, CursorProvider.decode(cursor))
+    # 응답 DTO 검증 후 JSON 호환 값으로 한 번에 변환하여, response_model 재검증 없이 orjson으로 바로 직렬화
+    position_responses = _position_list_adapter.dump_python(
+        _position_list_adapter.validate_python(positions, from_attributes=True), mode="json"
     )
 
+    return ok({
+        "items": position_responses,
+        "page": page,
+        "size": size,
+        "has_more": has_more,
+        "next_cursor": CursorProvider.next_cursor(positions, has_more, sort_by),
+        "total": total_count,
+        "total_pages": -(-total_count // size) if total_count is not None else None,
+    })
+
 
 @router.get("/{position_seq}", response_model=CommonResponseDto[PositionResponseDto])
-@inject
 def get_position(
         position_seq: int,
         db: Session = Depends(get_db),
-        position_service: PositionService = Depends(Provide[Container.position_service])
+        position_service: PositionService = Depends(_get_position_service)
 ):
     """
     # 🔍 특정 직책 조회 API
@@ -86,11 +105,10 @@ def get_position(
 
 
 @router.post("/", response_model=CommonResponseDto[PositionResponseDto], status_code=status.HTTP_201_CREATED)
-@inject
 def create_position(
         position_create_request_dto: PositionCreateRequestDto,
         db: Session = Depends(get_db),
-        position_service: PositionService = Depends(Provide[Container.position_service])
+        position_service: PositionService = Depends(_get_position_service)
 ):
     """
     # 🆕 새 직책 생성 API
@@ -110,16 +128,15 @@ def create_position(
       - 동일한 title 이미 존재하는 경우 **`400 Bad Request`** 오류 반환
     """
     position = position_service.create_position(db, position_create_request=position_create_request_dto)
-    return CommonResponseDto(status="success", data=position, message="Position created successfully")
+    return ok(position, "Position created successfully", status.HTTP_201_CREATED)
 
 
 @router.patch("/{position_seq}", response_model=CommonResponseDto[PositionResponseDto], status_code=status.HTTP_200_OK)
-@inject
 def update_position(
         position_seq: int,
         position_update_request_dto: PositionUpdateRequestDto,
         db: Session = Depends(get_db),
-        position_service: PositionService = Depends(Provide[Container.position_service])
+        position_service: PositionService = Depends(_get_position_service)
 ):
     """
     # 🔐 특정 직책 정보를 업데이트하는 API
@@ -145,11 +162,10 @@ def update_position(
     return CommonResponseDto(status="success", data=position, message="Position updated successfully")
 
 @router.delete("/{position_seq}", response_model=CommonResponseDto[None], status_code=status.HTTP_200_OK)
-@inject
 def delete_position(
         position_seq: int,
         db: Session = Depends(get_db),
-        position_service: PositionService = Depends(Provide[Container.position_service])
+        position_service: PositionService = Depends(_get_position_service)
 ):
     """
     # 🗑 특정 직책 삭제 API
@@ -173,11 +189,10 @@ def delete_position(
 
 
 @router.patch("/{position_seq}/soft-delete", response_model=CommonResponseDto[PositionResponseDto], status_code=status.HTTP_200_OK)
-@inject
 def soft_delete_position(
         position_seq: int,
         db: Session = Depends(get_db),
-        position_service: PositionService = Depends(Provide[Container.position_service])
+        position_service: PositionService = Depends(_get_position_service)
 ):
     """
     # 🗄 특정 직책 소프트 삭제 API
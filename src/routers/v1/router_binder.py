@@ -1,5 +1,7 @@
 from fastapi import FastAPI
 
+from src.core.route_index import install_route_index
+
 from src.routers.v1.auth.auth_router import router as auth_router
 from src.routers.v1.user.user_router import router as user_router
 from src.routers.v1.rank.rank_router import router as rank_router
@@ -27,3 +29,6 @@ def register_routers(app: FastAPI):
     app.include_router(organization_router,         prefix="/v1/organization",         tags=["organization"])
     app.include_router(employee_history_router,     prefix="/v1/employee-history",     tags=["employee-history"])
     app.include_router(organization_history_router, prefix="/v1/organization-history", tags=["organization-history"])
+
+    # 라우터 등록이 끝난 라우트 목록으로 정적 경로 색인을 만들어, 요청마다 전체 라우트를 순회하지 않도록 함
+    install_route_index(app)
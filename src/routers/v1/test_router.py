@@ -1,10 +1,11 @@
-from fastapi import Request
+from fastapi import HTTPException, Request, status
 
 from src.core.session import get_db
+from src.core.settings import settings
 import logging
 
 from src.logging.api_logging_router import APILoggingRouter
-from src.logging.config.logging_config import LoggingConfig
+from src.core.container import container
 from src.logging.extensions.structured_logging_adapter import StructuredLoggingAdapter
 from src.logging.context.request_logging_context import RequestLoggingContext
 import uuid
@@ -16,19 +17,17 @@ from sqlalchemy.orm import Session
 # router = APILoggingRouter(debug=True) # DEBUG 로그만 나옴
 router = APILoggingRouter() # DEBUG 로그 + API 요청 로그
 
+# 디버그 테스트 전용 로거 (모듈 로딩 시 DEBUG 레벨로 한 번만 구성)
+_debug_logger = container.logger_config().get_logger("test_debug", level=logging.DEBUG)
+
 @router.get("/test-debug")
 async def test_debug(request: Request):
-    trace_id = str(uuid.uuid4())
-    # 도메인 설정
-    base_logger = LoggingConfig().get_logger("rank")
-
-    # 로거 및 핸들러 레벨 설정
-    base_logger.setLevel(logging.DEBUG)
-    for handler in base_logger.handlers:
-        handler.setLevel(logging.DEBUG)
-
-    logger = StructuredLoggingAdapter(base_logger, trace_id)
-    RequestLoggingContext.set(logger)
+    # 요청 로그와 같은 trace_id로 디버그 로그를 남김 (로거/핸들러는 요청마다 새로 만들거나 변경하지 않음)
+    try:
+        trace_id = RequestLoggingContext.get().trace_id
+    except LookupError:  # 로깅 라우트가 아닌 경우(debug=True)
+        trace_id = str(uuid.uuid4())
+    logger = StructuredLoggingAdapter(_debug_logger, trace_id)
     logger.debug_structured(
         message="🐛 테스트 로그",
         context={"active": True},
@@ -39,12 +38,21 @@ async def test_debug(request: Request):
 
     return {"message": "ok"}
 
-@router.get("/test/slow-sql")
+def _require_non_production():
+    """
+    운영 환경에서는 테스트용 API를 노출하지 않도록 404를 반환합니다.
+    (라우트 핸들러보다 먼저 실행되므로 DB 세션/커넥션을 점유하기 전에 차단됨)
+    """
+    if settings.APP_ENV == "production":
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+
+@router.get("/test/slow-sql", dependencies=[Depends(_require_non_production)])
 def test_slow_sql(db: Session = Depends(get_db)):
     """
     슬로우 쿼리 테스트용 API
 
     - 쿼리 실행 시간이 1초를 초과하면 structured 슬로우 쿼리 로그가 남음
+    - 커넥션을 1.5초간 점유하므로 운영 환경(APP_ENV=production)에서는 404 반환
     """
     db.execute(text("SELECT SLEEP(1.5)"))  # MySQL 기준. 1.5초 지연 쿼리
     return {"status": "ok"}
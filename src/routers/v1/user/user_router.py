@@ -1,11 +1,15 @@
+from typing import List, Literal
+
 from fastapi import Depends, Query, status
-from dependency_injector.wiring import inject, Provide
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
-from src.core.container import Container
+from src.core.container import service_dependency
+from src.core.fast_response import ok, ok_json, ok_page
 from src.core.session import get_db
 from src.dto.response.paginated_response_dto import PaginatedResponseDto
 from src.logging.api_logging_router import APILoggingRouter
+from src.provider.cursor_provider import CursorProvider
 from src.service.user.user_service import UserService
 from src.dto.request.user.user_create_request_dto import UserCreateRequestDto
 from src.dto.request.user.password_update_request_dto import PasswordUpdateRequestDto
@@ -18,15 +22,32 @@ from src.dto.response.common_response_dto import CommonResponseDto
 # )
 router = APILoggingRouter()
 
+# 요청마다 wiring을 거치지 않도록 서비스 인스턴스를 한 번만 조회하여 재사용
+_get_user_service = service_dependency("user_service")
+
+# 회원 목록을 한 번의 호출로 검증/변환하는 TypeAdapter (모듈 로딩 시 1회 생성)
+_user_list_adapter = TypeAdapter(List[UserResponseDto])
+# 단건 회원 응답 TypeAdapter (비밀번호 등 응답 DTO에 없는 도메인 필드는 제외하고 직렬화)
+_user_adapter = TypeAdapter(UserResponseDto)
+
+
+def _user_json(user) -> bytes:
+    """
+    회원 도메인을 응답 DTO로 검증한 뒤 JSON 바이트로 바로 직렬화합니다. (response_model 재검증 생략)
+    """
+    return _user_adapter.dump_json(_user_adapter.validate_python(user, from_attributes=True))
+
+
 @router.get("/", response_model=CommonResponseDto[PaginatedResponseDto[UserResponseDto]])
-@inject
 def get_users(
         page: int = Query(1, ge=1, description="현재 페이지 (1부터 시작)"),
         size: int = Query(10, ge=1, description="페이지 크기"),
+        cursor: str | None = Query(None, description="다음 페이지 조회 커서 (지정하면 page 대신 사용, 이전 응답의 next_cursor 사용)"),
         sort_by: str | None = Query(None, description="정렬 기준 컬럼명 (예: 'seq', 'username')"),
-        order: str = Query("asc", regex="^(asc|desc)$", description="정렬 순서 ('asc' 또는 'desc')"),
+        order: Literal["asc", "desc"] = Query("asc", description="정렬 순서 ('asc' 또는 'desc')"),
+        include_total: bool = Query(False, description="전체 개수(total, total_pages) 포함 여부 (true일 때만 COUNT 수행)"),
         db: Session = Depends(get_db),
-        user_service: UserService = Depends(Provide[Container.user_service])
+        user_service: UserService = Depends(_get_user_service)
 ):
     """
     # 📌 회원 목록 조회 API (페이징 및 정렬 지원)
@@ -34,39 +55,41 @@ def get_users(
     ## 📝 Args:
     - **`page`** (`int`): 현재 페이지 번호 (**1부터 시작**)
     - **`size`** (`int`): 페이지 크기 (**한 페이지당 회원 수**)
+    - **`cursor`** (`str | None`): 다음 페이지 조회 커서
+      - 지정하면 `page` 대신 커서 이후부터 조회 (**키셋 페이지네이션, 뒤쪽 페이지도 OFFSET 없이 조회**)
     - **`sort_by`** (`str | None`): 정렬 기준 컬럼명
       - 예시: `'seq'`, `'username'`
     - **`order`** (`str`): 정렬 방향
       - `"asc"` (오름차순) | `"desc"` (내림차순)
+    - **`include_total`** (`bool`): 전체 개수 포함 여부
+      - 기본값 `false`: `total`, `total_pages` 없이 `has_more`로 다음 페이지 여부만 반환 (**COUNT 쿼리 생략**)
+      - `true`: 전체 개수를 조회하여 `total`, `total_pages` 포함
+        (필터 없이 조회하는 10만 건 이상 대용량 테이블은 통계 기반 **근사값**이며, 논리 삭제된 행이 포함될 수 있음)
     - **`user_service`** (`UserService`): 회원 서비스 **의존성 주입**
 
     ## 📤 Returns:
     - **`CommonResponseDto[PaginatedResponseDto[UserResponseDto]]`**
       회원 목록과 페이지네이션 정보 반환
     """
-    users, total_count = user_service.get_users(db, page, size, sort_by, order)
-    user_responses = [UserResponseDto.model_validate(e) for e in users]
-    total_pages = (total_count + size - 1) // size
-
-    return CommonResponseDto(
-        status="success",
-        data=PaginatedResponseDto(
-            items=user_responses,
-            total=total_count,
-            page=page,
-            size=size,
-            total_pages=total_pages
-        ),
-        message=None
-    )
+    users, has_more, total_count = user_service.get_users(db, page, size, sort_by, order, include_total, CursorProvider.decode(cursor))
+    # 응답 DTO 검증 후 중간 dict 목록 없이 JSON 바이트로 바로 직렬화 (response_model 재검증도 생략)
+    items_json = _user_list_adapter.dump_json(_user_list_adapter.validate_python(users, from_attributes=True))
+
+    return ok_page(items_json, {
+        "page": page,
+        "size": size,
+        "has_more": has_more,
+        "next_cursor": CursorProvider.next_cursor(users, has_more, sort_by),
+        "total": total_count,
+        "total_pages": -(-total_count // size) if total_count is not None else None,
+    })
 
 
 @router.get("/{user_seq}", response_model=CommonResponseDto[UserResponseDto])
-@inject
 def get_user(
         user_seq: int,
         db: Session = Depends(get_db),
-        user_service: UserService = Depends(Provide[Container.user_service])
+        user_service: UserService = Depends(_get_user_service)
 ):
     """
     # 🔍 특정 회원 조회 API
@@ -84,15 +107,14 @@ def get_user(
       - 회원이 존재하지 않을 경우 **`404 Not Found`** 오류 반환
     """
     user = user_service.get_user_by_seq(db, user_seq)
-    return CommonResponseDto(status="success", data=user, message=None)
+    return ok_json(_user_json(user))
 
 
 @router.post("/", response_model=CommonResponseDto[UserResponseDto], status_code=status.HTTP_201_CREATED)
-@inject
-def create_user(
+async def create_user(
         user_create_request_dto: UserCreateRequestDto,
         db: Session = Depends(get_db),
-        user_service: UserService = Depends(Provide[Container.user_service])
+        user_service: UserService = Depends(_get_user_service)
 ):
     """
     # 🆕 새 회원 생성 API
@@ -108,17 +130,16 @@ def create_user(
     - **`CommonResponseDto[UserResponseDto]`**
       - 생성된 **회원 정보 반환**
     """
-    user = user_service.create_user(db, user_create_request=user_create_request_dto)
-    return CommonResponseDto(status="success", data=user, message="User created successfully")
+    user = await user_service.create_user(db, user_create_request=user_create_request_dto)
+    return ok_json(_user_json(user), "User created successfully", status.HTTP_201_CREATED)
 
 
 @router.patch("/{user_seq}/password", response_model=CommonResponseDto[UserResponseDto], status_code=status.HTTP_200_OK)
-@inject
-def update_password(
+async def update_password(
         user_seq: int,
         password_update_request_dto: PasswordUpdateRequestDto,
         db: Session = Depends(get_db),
-        user_service: UserService = Depends(Provide[Container.user_service])
+        user_service: UserService = Depends(_get_user_service)
 ):
     """
     # 🔐 특정 회원의 비밀번호 변경 API
@@ -139,16 +160,15 @@ def update_password(
     - **`HTTPException`**:
       - 회원이 존재하지 않을 경우 **`404 Not Found`** 오류 반환
     """
-    user = user_service.update_password(db, user_seq, password_update_request_dto.password)
-    return CommonResponseDto(status="success", data=user, message="Password updated successfully")
+    user = await user_service.update_password(db, user_seq, password_update_request_dto.password)
+    return ok_json(_user_json(user), "Password updated successfully")
 
 
 @router.delete("/{user_seq}", response_model=CommonResponseDto[None], status_code=status.HTTP_200_OK)
-@inject
 def delete_user(
         user_seq: int,
         db: Session = Depends(get_db),
-        user_service: UserService = Depends(Provide[Container.user_service])
+        user_service: UserService = Depends(_get_user_service)
 ):
     """
     # 🗑 특정 회원 삭제 API
@@ -168,14 +188,13 @@ def delete_user(
       - 회원이 존재하지 않을 경우 **`404 Not Found`** 오류 반환
     """
     user_service.delete_user(db, user_seq)
-    return CommonResponseDto(status="success", data=None, message="User deleted successfully")
+    return ok(None, "User deleted successfully")
 
 @router.patch("/{user_seq}/soft-delete", response_model=CommonResponseDto[UserResponseDto], status_code=status.HTTP_200_OK)
-@inject
 def soft_delete_user(
         user_seq: int,
         db: Session = Depends(get_db),
-        user_service: UserService = Depends(Provide[Container.user_service])
+        user_service: UserService = Depends(_get_user_service)
 ):
     """
     # 🗄 특정 회원 소프트 삭제 API
@@ -196,4 +215,4 @@ def soft_delete_user(
       - 회원이 존재하지 않을 경우 **`404 Not Found`** 오류 반환
     """
     user = user_service.soft_delete_user(db, user_seq)
-    return CommonResponseDto(status="success", data=user, message="User soft deleted successfully")
+    return ok_json(_user_json(user), "User soft deleted successfully")
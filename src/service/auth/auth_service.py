@@ -1,17 +1,65 @@
+import hashlib
+import hmac
+
+from starlette.concurrency import run_in_threadpool
+
+from src.domain.user_domain import UserDomain
 from src.dto.request.auth.login_request_dto import LoginRequestDto
 from src.dto.request.auth.logout_request_dto import LogoutRequestDto
 from src.dto.response.auth.token_response_dto import TokenResponseDto
 from src.exception.token_exceptions import InvalidRefreshTokenSubjectMissingException, RefreshTokenLoggedOutException, \
     RefreshTokenMismatchException
 from src.repository.user.user_repository import UserRepository
-from src.utils.security import verify_password  # 평문 vs 해시 비교 함수
+from src.utils.security import verify_password_async  # 평문 vs 해시 비교 함수 (bcrypt 프로세스 풀)
+from src.utils.ttl_cache import TTLCache
 from src.provider.jwt_token_provider import JwtTokenProvider  # 토큰 생성/검증 유틸리티
 from src.exception.auth_exceptions import UnauthorizedException
 from src.exception.user_exceptions import UserNotFoundException
+from src.core.settings import settings
 from src.service.base_service import BaseService
 from src.decorator.transaction import Transactional  # 트랜잭션 데코레이터 추가
 from sqlalchemy.orm import Session
 
+# Swagger 로그인 결과(Access Token) 캐시 유지 시간 (초)
+# 같은 계정으로 동시에 몰리는 로그인 요청이 bcrypt 검증을 반복하지 않도록 짧게 재사용
+SWAGGER_TOKEN_CACHE_TTL_SECONDS = 1
+
+_swagger_token_cache = TTLCache(maxsize=1024, ttl=SWAGGER_TOKEN_CACHE_TTL_SECONDS)
+
+
+def _swagger_token_cache_key(username: str, password: str) -> tuple:
+    """
+    Swagger 로그인 토큰 캐시 키를 생성합니다.
+    평문 비밀번호가 메모리에 남지 않도록, 솔트 없는 해시 대신 앱 비밀값으로 HMAC-SHA256 처리합니다.
+    (캐시 메모리가 노출되어도 사전 공격으로 비밀번호를 역산할 수 없음)
+
+    Args:
+        username (str): 로그인 아이디.
+        password (str): 로그인 비밀번호.
+
+    Returns:
+        tuple: (아이디, 비밀번호 HMAC 다이제스트)
+    """
+    digest = hmac.new(settings.JWT_SECRET.encode("utf-8"), password.encode("utf-8"), hashlib.sha256).digest()
+    return username, digest
+
+
+def _refresh_token_matches(stored_token: str | None, refresh_token: str) -> bool:
+    """
+    저장된 Refresh Token과 요청의 Refresh Token을 상수 시간으로 비교합니다.
+    (일치하는 앞부분 길이에 따라 비교 시간이 달라지는 타이밍 공격 방지)
+
+    Args:
+        stored_token (str | None): 회원 테이블에 저장된 Refresh Token (로그아웃 상태면 None).
+        refresh_token (str): 요청으로 전달된 Refresh Token.
+
+    Returns:
+        bool: 일치 여부.
+    """
+    if stored_token is None:
+        return False
+    return hmac.compare_digest(stored_token.encode("utf-8"), refresh_token.encode("utf-8"))
+
 
 class AuthService(BaseService):
     """
@@ -28,9 +76,10 @@ class AuthService(BaseService):
         """
         self.user_repository = user_repository
 
-    def swagger_login(self, db: Session, username: str, password: str) -> str:
+    async def swagger_login(self, db: Session, username: str, password: str) -> str:
         """
         Swagger UI용 로그인 처리 (Access Token만 반환).
+        DB 조회는 스레드풀에서, bcrypt 검증은 프로세스 풀에서 수행하여 이벤트 루프를 막지 않습니다.
 
         Args:
             db (Session): 데이터베이스 세션.
@@ -44,20 +93,56 @@ class AuthService(BaseService):
             UserNotFoundException: 존재하지 않는 회원일 경우.
             UnauthorizedException: 비밀번호가 일치하지 않을 경우.
         """
-        user_domain = self.user_repository.get_user_by_username(db, username)
+        # 평문 비밀번호는 캐시 키에 그대로 남기지 않고 HMAC 다이제스트로 변환
+        cache_key = _swagger_token_cache_key(username, password)
+        access_token = _swagger_token_cache.get(cache_key)
+        if access_token is not None:
+            return access_token
+
+        user_domain = await self._verify_credentials(db, username, password)
+
+        access_token = JwtTokenProvider.generate_access_token(user_domain.username)
+        _swagger_token_cache.set(cache_key, access_token)
+        return access_token
+
+    async def _verify_credentials(self, db: Session, username: str, password: str) -> UserDomain:
+        """
+        아이디로 회원을 조회하고 비밀번호를 검증하는 내부 메서드.
+
+        Raises:
+            UserNotFoundException: 존재하지 않는 회원일 경우.
+            UnauthorizedException: 비밀번호가 일치하지 않을 경우.
+        """
+        user_domain = await run_in_threadpool(self._find_user, db, username)
         if not user_domain:
             raise UserNotFoundException()
 
-        if not user_domain.password or not verify_password(password, user_domain.password):
+        if not user_domain.password or not await verify_password_async(password, user_domain.password):
             raise UnauthorizedException()
 
-        return JwtTokenProvider.generate_access_token(user_domain.username)
+        return user_domain
 
+    def _find_user(self, db: Session, username: str) -> UserDomain | None:
+        """
+        아이디로 회원을 조회한 뒤, 조회로 시작된 읽기 트랜잭션을 바로 종료하는 내부 메서드.
+        bcrypt 검증(프로세스 풀) 대기 동안 커넥션을 점유하지 않도록 같은 스레드풀 작업 안에서 커넥션을 풀에 반환합니다.
 
-    @Transactional
-    def login(self, db: Session, payload: LoginRequestDto) -> TokenResponseDto:
+        Args:
+            db (Session): 데이터베이스 세션.
+            username (str): 로그인 아이디.
+
+        Returns:
+            UserDomain | None: 조회된 회원 도메인 객체 (없으면 None).
+        """
+        try:
+            return self.user_repository.get_user_by_username(db, username)
+        finally:
+            db.rollback()
+
+    async def login(self, db: Session, payload: LoginRequestDto) -> TokenResponseDto:
         """
         회원 로그인 처리 및 JWT Access Token / Refresh Token 발급.
+        비밀번호 검증은 프로세스 풀에서 비동기로 수행하고, Refresh Token 저장은 트랜잭션으로 처리합니다.
 
         Args:
             db (Session): 데이터베이스 세션.
@@ -70,16 +155,21 @@ class AuthService(BaseService):
             UserNotFoundException: 존재하지 않는 회원일 경우.
             UnauthorizedException: 비밀번호가 일치하지 않을 경우.
         """
-        username = payload.username
-        password = payload.password
+        user_domain = await self._verify_credentials(db, payload.username, payload.password)
+        return await run_in_threadpool(self._issue_tokens, db, user_domain)
 
-        user_domain = self.user_repository.get_user_by_username(db, username)
-        if not user_domain:
-            raise UserNotFoundException()
+    @Transactional
+    def _issue_tokens(self, db: Session, user_domain: UserDomain) -> TokenResponseDto:
+        """
+        검증된 회원에게 Access Token / Refresh Token을 발급하고 Refresh Token을 저장하는 내부 메서드.
 
-        if not user_domain.password or not verify_password(password, user_domain.password):
-            raise UnauthorizedException()
+        Args:
+            db (Session): 데이터베이스 세션.
+            user_domain (UserDomain): 비밀번호 검증을 마친 회원 도메인 객체.
 
+        Returns:
+            TokenResponseDto: 발급된 Access Token과 Refresh Token.
+        """
         access_token = JwtTokenProvider.generate_access_token(user_domain.username)
         refresh_token = JwtTokenProvider.generate_refresh_token(user_domain.username)
 
@@ -117,7 +207,7 @@ class AuthService(BaseService):
             raise UserNotFoundException()
 
         # 저장된 refresh token과 비교
-        if user_domain.current_refresh_token != refresh_token:
+        if not _refresh_token_matches(user_domain.current_refresh_token, refresh_token):
             raise RefreshTokenLoggedOutException()
 
         # 새로운 Access Token 생성
@@ -148,7 +238,10 @@ class AuthService(BaseService):
             raise UserNotFoundException()
 
         # 저장된 refresh token과 비교하여 일치하는 경우에만 삭제
-        if user_domain.current_refresh_token != payload.refresh_token:
+        if not _refresh_token_matches(user_domain.current_refresh_token, payload.refresh_token):
             raise RefreshTokenMismatchException()
 
+        # 로그아웃된 Refresh Token의 검증 결과가 캐시에 남지 않도록 제거
+        JwtTokenProvider.invalidate_token(payload.refresh_token)
+
         return self.user_repository.update_refresh_token(db, user_domain.seq, None)
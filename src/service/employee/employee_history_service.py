@@ -1,11 +1,17 @@
-from typing import List, Tuple
+from typing import Any, List, Optional, Tuple
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
 
 from src.domain.employee_history_domain import EmployeeHistoryDomain
 from src.exception.employee_history_exceptions import EmployeeHistoryNotFoundException
 from src.repository.employee.employee_history_repository import EmployeeHistoryRepository
-from src.entity.employee_history_entity import EmployeeHistoryEntity
 from src.service.base_service import BaseService
+from src.utils.ttl_cache import TTLCache
+
+# 전체 직원 히스토리 수(COUNT) 캐시. 히스토리는 추가만 되므로 짧은 TTL 동안만 재사용한다.
+EMPLOYEE_HISTORY_COUNT_CACHE_TTL_SECONDS = 5
+
+_count_cache = TTLCache(maxsize=1, ttl=EMPLOYEE_HISTORY_COUNT_CACHE_TTL_SECONDS)
 
 
 class EmployeeHistoryService(BaseService):
@@ -28,29 +34,54 @@ class EmployeeHistoryService(BaseService):
     def get_employee_histories(
         self,
         db: Session,
-        page: int,
+        cursor: Optional[Tuple[int, Any]],
         size: int,
         sort_by: str | None,
         order: str
-    ) -> Tuple[List[EmployeeHistoryEntity], int]:
+    ) -> Tuple[List[Row], bool]:
         """
-        페이징 및 정렬을 적용하여 직원 히스토리 목록을 조회하는 메서드.
+        키셋 페이지네이션 및 정렬을 적용하여 직원 히스토리 목록을 조회하는 메서드.
 
         Args:
             db (Session): 데이터베이스 세션.
-            page (int): 1부터 시작하는 페이지 번호.
+            cursor (Optional[Tuple[int, Any]]): 직전 페이지 마지막 항목의 (seq, 정렬 컬럼 값), 첫 페이지는 None.
             size (int): 한 페이지에 가져올 데이터 개수.
-            sort_by (str | None): 정렬할 컬럼명 (예: "seq", "name").
+            sort_by (str | None): 정렬할 컬럼명 (예: "seq", "created_at").
             order (str): 정렬 방식 ("asc" 또는 "desc").
 
         Returns:
-            Tuple[List[EmployeeHistoryEntity], int]:
-                직원 히스토리 목록과 전체 개수.
+            Tuple[List[Row], bool]:
+                직원 히스토리 목록과 다음 페이지 존재 여부.
+        """
+        return self.employee_history_repository.find_rows_by_keyset(db, cursor, size, sort_by, order)
+
+    def get_latest_employee_history_seq(self, db: Session) -> Optional[int]:
+        """
+        가장 최근 직원 히스토리의 seq를 조회하는 메서드. (목록 ETag 계산용)
 
+        Args:
+            db (Session): 데이터베이스 세션.
+
+        Returns:
+            Optional[int]: 가장 최근 직원 히스토리 seq (없으면 None).
+        """
+        return self.employee_history_repository.get_max_seq(db)
+
+    def count_employee_histories(self, db: Session) -> int:
+        """
+        전체 직원 히스토리 수를 조회하는 메서드.
+
+        Args:
+            db (Session): 데이터베이스 세션.
+
+        Returns:
+            int: 전체 직원 히스토리 수.
         """
-        history_domains = self.employee_history_repository.find_all(db, page, size, sort_by, order)
-        total_count = self.employee_history_repository.count_all(db)
-        return history_domains, total_count
+        total_count = _count_cache.get("employee_history")
+        if total_count is None:
+            total_count = self.employee_history_repository.count_all(db)
+            _count_cache.set("employee_history", total_count)
+        return total_count
 
     def get_employee_history_by_seq(self, db: Session, employee_history_seq: int) -> EmployeeHistoryDomain:
         """
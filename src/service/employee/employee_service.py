@@ -1,14 +1,38 @@
-from typing import Tuple, List
+from datetime import datetime
+from functools import wraps
+from typing import Any, Iterator, Optional, Tuple, List
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
 from src.dto.request.employee.employee_create_request_dto import EmployeeCreateRequestDto
-from src.dto.request.employee.employee_update_request_dto import EmployeeUpdateRequestDto
+from src.dto.request.employee.employee_update_request_dto import EmployeeUpdateRequestDto, EmployeeBulkUpdateRequestDto
 from src.exception.employee_exceptions import EmployeeNotFoundException, EmployeeAlreadyExistsException, \
     EmployeeUpdateDataNotFoundException
 from src.repository.employee.employee_repository import EmployeeRepository
 from src.service.base_service import BaseService
 from src.domain.employee_domain import EmployeeDomain
+from src.domain.employee_detail_domain import EmployeeDetailDomain
 from src.decorator.transaction import Transactional  # 트랜잭션 데코레이터 추가
-from src.decorator.history import History
+from src.decorator.history import History, record_histories
+from src.utils.ttl_cache import TTLCache
+
+# 전체 직원 수(COUNT) 캐시. 직원 생성/삭제 시 즉시 비워지고,
+# 다른 프로세스에서 발생한 변경은 TTL이 지나면 반영된다.
+EMPLOYEE_COUNT_CACHE_TTL_SECONDS = 5
+
+_count_cache = TTLCache(maxsize=1, ttl=EMPLOYEE_COUNT_CACHE_TTL_SECONDS)
+
+
+def _invalidates_count(func):
+    """
+    직원 수를 변경하는 메서드에 적용하여, 실행이 성공하면 직원 수 캐시를 비우는 데코레이터.
+    @Transactional 바깥에 적용하여 커밋이 완료된 이후에 캐시가 무효화되도록 한다.
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        result = func(*args, **kwargs)
+        _count_cache.clear()
+        return result
+    return wrapper
 
 class EmployeeService(BaseService):
     """
@@ -30,28 +54,54 @@ class EmployeeService(BaseService):
     def get_employees(
         self,
         db: Session,
-        page: int,
+        cursor: Optional[Tuple[int, Any]],
         size: int,
         sort_by: str | None,
         order: str
-    ) -> Tuple[List[EmployeeDomain], int]:
+    ) -> Tuple[List[EmployeeDomain], bool]:
         """
-        페이징 및 정렬을 적용하여 직원 목록을 조회하는 메서드.
+        키셋 페이지네이션 및 정렬을 적용하여 직원 목록을 조회하는 메서드.
 
         Args:
             db (Session): 데이터베이스 세션.
-            page (int): 1부터 시작하는 페이지 번호.
+            cursor (Optional[Tuple[int, Any]]): 직전 페이지 마지막 항목의 (seq, 정렬 컬럼 값), 첫 페이지는 None.
             size (int): 한 페이지에 가져올 데이터 개수.
             sort_by (str | None): 정렬할 컬럼명 (예: "seq", "name").
             order (str): 정렬 방식 ("asc" 또는 "desc").
 
         Returns:
-            Tuple[List[EmployeeDomain], int]:
-                직원 도메인 리스트와 전체 직원 수.
+            Tuple[List[EmployeeDomain], bool]:
+                직원 도메인 리스트와 다음 페이지 존재 여부.
+        """
+        return self.employee_repository.get_employees(db, cursor, size, sort_by, order)
+
+    def stream_employees(self, db: Session) -> Iterator[Row]:
+        """
+        전체 직원을 seq 순서대로 스트리밍 조회하는 메서드.
+
+        Args:
+            db (Session): 데이터베이스 세션.
+
+        Returns:
+            Iterator[Row]: 직원 컬럼 값으로 구성된 Row 반복자.
+        """
+        return self.employee_repository.stream_employee_rows(db)
+
+    def count_employees(self, db: Session) -> int:
+        """
+        전체 직원 수를 조회하는 메서드.
+
+        Args:
+            db (Session): 데이터베이스 세션.
+
+        Returns:
+            int: 전체 직원 수 (대용량 테이블은 추정치).
         """
-        employee_domains = self.employee_repository.get_employees(db, page, size, sort_by, order)
-        total_count = self.employee_repository.count_employees(db)
-        return employee_domains, total_count
+        total_count = _count_cache.get("employee")
+        if total_count is None:
+            total_count = self.employee_repository.count_employees(db)
+            _count_cache.set("employee", total_count)
+        return total_count
 
     def get_employee_by_seq(self, db: Session, employee_seq: int) -> EmployeeDomain:
         """
@@ -72,6 +122,39 @@ class EmployeeService(BaseService):
             raise EmployeeNotFoundException()
         return employee_domain
 
+    def get_employee_updated_at(self, db: Session, employee_seq: int) -> Optional[datetime]:
+        """
+        특정 직원의 수정 시각만 조회하는 메서드. (ETag 비교용)
+
+        Args:
+            db (Session): 데이터베이스 세션.
+            employee_seq (int): 조회할 직원 seq.
+
+        Returns:
+            Optional[datetime]: 직원 수정 시각 (직원이 없으면 None).
+        """
+        return self.employee_repository.get_employee_updated_at(db, employee_seq)
+
+    def get_employee_detail(self, db: Session, employee_seq: int) -> EmployeeDetailDomain:
+        """
+        특정 직원 정보를 소속 조직, 직책, 직위와 함께 조회하는 메서드.
+
+        Args:
+            db (Session): 데이터베이스 세션.
+            employee_seq (int): 조회할 직원 seq.
+
+        Returns:
+            EmployeeDetailDomain: 조회된 직원 상세 도메인 객체.
+
+        Raises:
+            EmployeeNotFoundException: 직원이 존재하지 않을 경우.
+        """
+        employee_detail_domain = self.employee_repository.get_employee_with_relations(db, employee_seq)
+        if employee_detail_domain is None:
+            raise EmployeeNotFoundException()
+        return employee_detail_domain
+
+    @_invalidates_count
     @Transactional
     @History(entity="employee", action="INSERT")
     def create_employee(self, db: Session, employee_create_request: EmployeeCreateRequestDto) -> EmployeeDomain:
@@ -89,11 +172,10 @@ class EmployeeService(BaseService):
             EmployeeAlreadyExistsException: 동일한 이메일을 가진 직원이 이미 존재하는 경우.
         """
         # 직원이 이미 존재하는지 확인
-        existing_employee = self.employee_repository.get_employee_by_email(db, employee_create_request.email)
-        if existing_employee:
+        if self.employee_repository.exists_by_email(db, employee_create_request.email):
             raise EmployeeAlreadyExistsException()
 
-        employee_domain = EmployeeDomain(**employee_create_request.model_dump())
+        employee_domain = EmployeeDomain(**employee_create_request.__dict__)
 
         return self.employee_repository.create_employee(db, employee_domain)
 
@@ -115,18 +197,90 @@ class EmployeeService(BaseService):
             EmployeeNotFoundException: 해당 직원이 존재하지 않을 경우.
             EmployeeUpdateDataNotFoundException: 수정할 데이터가 없을 경우.
         """
-        employee_domain = self.employee_repository.get_employee_by_seq(db, employee_seq)
-        if employee_domain is None:
-            raise EmployeeNotFoundException()
-
-        # DTO를 dict로 변환
+        # DTO를 dict로 변환 (수정할 데이터가 없으면 DB 조회 없이 바로 예외)
         update_data = update_request.model_dump(exclude_unset=True)
 
         if not update_data:
             raise EmployeeUpdateDataNotFoundException()
 
-        return self.employee_repository.update_employee(db, employee_seq, update_data)
+        # 별도의 존재 여부 조회 없이 수정하고, 대상이 없으면 예외
+        updated = self.employee_repository.update_employee(db, employee_seq, update_data)
+        if updated is None:
+            raise EmployeeNotFoundException()
+        return updated
+
+    @_invalidates_count
+    @Transactional
+    def create_employees(self, db: Session, employee_create_requests: List[EmployeeCreateRequestDto]) -> List[EmployeeDomain]:
+        """
+        여러 직원을 한 번의 트랜잭션으로 생성하는 메서드. (다중 행 INSERT)
+
+        Args:
+            db (Session): 데이터베이스 세션.
+            employee_create_requests (List[EmployeeCreateRequestDto]): 직원 생성 요청 DTO 목록.
+
+        Returns:
+            List[EmployeeDomain]: 생성된 직원 도메인 객체 목록 (요청 순서 유지).
+
+        Raises:
+            EmployeeAlreadyExistsException: 요청 내 이메일이 중복되거나 이미 존재하는 이메일이 포함된 경우.
+        """
+        emails = [request.email for request in employee_create_requests]
+        if len(set(emails)) != len(emails) or self.employee_repository.exists_by_emails(db, emails):
+            raise EmployeeAlreadyExistsException()
+
+        employee_domains = [EmployeeDomain(**request.__dict__) for request in employee_create_requests]
+        self.employee_repository.create_employees(db, employee_domains)
+
+        # 다중 행 INSERT는 생성된 seq를 돌려주지 않으므로(MySQL), 이메일로 한 번에 재조회한다.
+        created_by_email = {
+            domain.email: domain for domain in self.employee_repository.get_employees_by_emails(db, emails)
+        }
+        created = [created_by_email[email] for email in emails]
+
+        record_histories(db, "employee", "INSERT", [(domain.seq, None, domain) for domain in created])
+        return created
 
+    @Transactional
+    def update_employees(self, db: Session, employee_update_requests: List[EmployeeBulkUpdateRequestDto]) -> List[EmployeeDomain]:
+        """
+        여러 직원 정보를 직원마다 서로 다른 값으로 한 번의 트랜잭션에서 수정하는 메서드.
+
+        Args:
+            db (Session): 데이터베이스 세션.
+            employee_update_requests (List[EmployeeBulkUpdateRequestDto]): 직원 seq를 포함한 수정 요청 DTO 목록.
+
+        Returns:
+            List[EmployeeDomain]: 수정된 직원 도메인 객체 목록 (요청 순서 유지).
+
+        Raises:
+            EmployeeNotFoundException: 존재하지 않는 직원이 포함된 경우.
+            EmployeeUpdateDataNotFoundException: 수정할 데이터가 없는 요청이 포함된 경우.
+        """
+        employee_seqs = [request.employee_seq for request in employee_update_requests]
+
+        before_by_seq = {domain.seq: domain for domain in self.employee_repository.get_employees_by_seqs(db, employee_seqs)}
+        if len(before_by_seq) != len(set(employee_seqs)):
+            raise EmployeeNotFoundException()
+
+        update_mappings = []
+        for request in employee_update_requests:
+            update_data = request.model_dump(exclude_unset=True, exclude={"employee_seq"})
+            if not update_data:
+                raise EmployeeUpdateDataNotFoundException()
+            update_mappings.append({"seq": request.employee_seq, **update_data})
+
+        self.employee_repository.update_employees_by_seq(db, update_mappings)
+
+        after_by_seq = {domain.seq: domain for domain in self.employee_repository.get_employees_by_seqs(db, employee_seqs)}
+        updated = [after_by_seq[seq] for seq in employee_seqs]
+
+        record_histories(
+            db, "employee", "UPDATE", [(seq, before_by_seq[seq], after_by_seq[seq]) for seq in employee_seqs]
+        )
+        return updated
+
+    @_invalidates_count
     @Transactional
     @History(entity="employee", action="DELETE")
     def delete_employee(self, db: Session, employee_seq: int) -> bool:
@@ -143,12 +297,12 @@ class EmployeeService(BaseService):
         Raises:
             EmployeeNotFoundException: 해당 직원이 존재하지 않을 경우.
         """
-        employee_domain = self.employee_repository.get_employee_by_seq(db, employee_seq)
-        if employee_domain is None:
+        # 별도의 존재 여부 조회 없이 삭제하고, 삭제된 행이 없으면 예외
+        if not self.employee_repository.delete_employee(db, employee_seq):
             raise EmployeeNotFoundException()
+        return True
 
-        return self.employee_repository.delete_employee(db, employee_seq)
-
+    @_invalidates_count
     @Transactional
     @History(entity="employee", action="UPDATE")
     def soft_delete_employee(self, db: Session, employee_seq: int) -> EmployeeDomain:
@@ -165,8 +319,8 @@ class EmployeeService(BaseService):
         Raises:
             EmployeeNotFoundException: 해당 직원이 존재하지 않을 경우.
         """
-        employee_domain = self.employee_repository.get_employee_by_seq(db, employee_seq)
-        if employee_domain is None:
+        # 별도의 존재 여부 조회 없이 논리 삭제하고, 대상이 없으면 예외
+        employee = self.employee_repository.soft_delete_employee(db, employee_seq)
+        if employee is None:
             raise EmployeeNotFoundException()
-
-        return self.employee_repository.soft_delete_employee(db, employee_seq)
+        return employee
@@ -1,20 +1,63 @@
-from typing import Tuple, List, Optional
+import hashlib
+import time
+from datetime import datetime
+from functools import wraps
+from typing import Any, Iterator, Tuple, List, Optional
+
+import orjson
+from sqlalchemy import Row
 from sqlalchemy.orm import Session
+from src.core.session import submit_count
 
-from src.decorator.history import History
+from src.decorator.history import History, record_histories
 from src.decorator.transaction import Transactional  # 트랜잭션 데코레이터 추가
 from src.domain.organization_domain import OrganizationDomain
 from src.dto.request.organization.organization_create_request_dto import TeamCreateRequestDto, \
-    HeadquartersCreateRequestDto, DepartmentCreateRequestDto
+    HeadquartersCreateRequestDto, DepartmentCreateRequestDto, OrganizationBulkCreateRequestDto
 from src.dto.request.organization.organization_update_request_dto import OrganizationNameAndVisibleUpdateRequestDto, \
     OrganizationMoveRequestDto
 from src.exception.organization_exceptions import OrganizationNotFoundException, SubOrganizationsExistException, \
     InvalidDivisionParentException, MissingParentForHeadquarterException, InvalidDivisionIdException, \
     MissingParentForTeamException, InvalidHeadquarterIdException, InvalidOrganizationLevelException, \
-    EmployeesExistInOrganizationException, OrganizationUpdateDataNotFoundException
+    EmployeesExistInOrganizationException, OrganizationUpdateDataNotFoundException, InvalidOrganizationMoveException
 from src.repository.employee.employee_repository import EmployeeRepository
 from src.repository.organization.organization_repository import OrganizationRepository
 from src.service.base_service import BaseService
+from src.utils.ttl_cache import TTLCache
+
+# 조직 계층 구조 캐시 (버전, 트리, 직렬화된 JSON, JSON 다이제스트, 만료 시각). 조직 변경 시 _tree_version이 증가하여 캐시가 무효화되고,
+# 다른 프로세스에서 발생한 변경은 TTL이 지나면 반영된다.
+ORGANIZATION_TREE_CACHE_TTL_SECONDS = 30
+
+_tree_cache: tuple[int, List[OrganizationDomain], bytes, str, float] | None = None
+_tree_version = 0
+
+# 조직 수(COUNT) 캐시. 키에 _tree_version을 포함하므로 조직 변경 시 자동으로 무효화되고,
+# 다른 프로세스에서 발생한 변경은 TTL이 지나면 반영된다.
+ORGANIZATION_COUNT_CACHE_TTL_SECONDS = 30
+
+_count_cache = TTLCache(maxsize=256, ttl=ORGANIZATION_COUNT_CACHE_TTL_SECONDS)
+
+
+def _is_tree_cache_fresh(cache: tuple[int, List[OrganizationDomain], bytes, str, float] | None) -> bool:
+    """
+    조직도 캐시가 현재 버전이고 만료되지 않았는지 확인한다.
+    """
+    return cache is not None and cache[0] == _tree_version and cache[4] > time.monotonic()
+
+
+def _invalidates_tree(func):
+    """
+    조직 데이터를 변경하는 메서드에 적용하여, 실행이 성공하면 조직 트리 캐시 버전을 증가시키는 데코레이터.
+    @Transactional 바깥에 적용하여 커밋이 완료된 이후에 캐시가 무효화되도록 한다.
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        global _tree_version
+        result = func(*args, **kwargs)
+        _tree_version += 1
+        return result
+    return wrapper
 
 
 class OrganizationService(BaseService):
@@ -40,6 +83,9 @@ class OrganizationService(BaseService):
         """
         self.organization_repository = organization_repository
         self.employee_repository = employee_repository
+        # 목록 필터에 사용하는 컬럼 (요청마다 엔티티 속성을 다시 조회하지 않도록 미리 보관)
+        self._level_column = organization_repository.entity.level
+        self._parent_seq_column = organization_repository.entity.parent_seq
 
     def get_organizations(
         self,
@@ -49,8 +95,10 @@ class OrganizationService(BaseService):
         sort_by: str | None,
         order: str,
         level: Optional[int],
-        parent_seq: Optional[int]
-    ) -> Tuple[List[OrganizationDomain], int]:
+        parent_seq: Optional[int],
+        include_total: bool = False,
+        cursor: Optional[Tuple[int, Any]] = None
+    ) -> Tuple[List[OrganizationDomain], bool, Optional[int]]:
         """
         페이징 및 정렬을 적용하여 조직 목록을 조회하는 메서드.
 
@@ -62,20 +110,57 @@ class OrganizationService(BaseService):
             order (str): 정렬 방식 ("asc" | "desc").
             level (Optional[int]): 조직 level (1: 부문, 2: 본부, 3: 팀).
             parent_seq (Optional[int]): 상위 조직 seq.
+            include_total (bool): 전체 개수 조회 여부 (True일 때만 COUNT 쿼리 수행).
+            cursor (Optional[Tuple[int, Any]]): 직전 페이지 마지막 항목의 (seq, 정렬 컬럼 값). 지정하면 page 대신 키셋 방식으로 조회.
 
         Returns:
-            Tuple[List[OrganizationDomain], int]:
-                조직 도메인 리스트와 전체 조직 수.
+            Tuple[List[OrganizationDomain], bool, Optional[int]]:
+                조직 도메인 리스트, 다음 페이지 존재 여부, 전체 조직 수 (include_total이 False면 None).
         """
-        filters = []
-        if level is not None:
-            filters.append(self.organization_repository.entity.level == level)
-        if parent_seq is not None:
-            filters.append(self.organization_repository.entity.parent_seq == parent_seq)
+        filters = [
+            column == value
+            for column, value in ((self._level_column, level), (self._parent_seq_column, parent_seq))
+            if value is not None
+        ]
+
+        # COUNT는 별도 커넥션에서 페이지 조회와 동시에 실행
+        total_future = submit_count(self._count_organizations, level, parent_seq, filters) if include_total else None
+        organization_domains, has_more = self.organization_repository.get_organizations(db, page, size, sort_by, order, filters, cursor)
+        total_count = total_future.result() if total_future is not None else None
+        return organization_domains, has_more, total_count
+
+    def _count_organizations(self, db: Session, level: Optional[int], parent_seq: Optional[int], filters: list) -> int:
+        """
+        조건에 맞는 조직 수를 반환하며, 결과를 짧은 TTL 동안 캐시하는 메서드.
 
-        organization_domains = self.organization_repository.get_organizations(db, page, size, sort_by, order, filters)
-        total_count = self.organization_repository.count_organizations(db, filters)
-        return organization_domains, total_count
+        Args:
+            db (Session): 데이터베이스 세션.
+            level (Optional[int]): 조직 level 필터.
+            parent_seq (Optional[int]): 상위 조직 seq 필터.
+            filters (list): level, parent_seq로 구성된 필터 조건.
+
+        Returns:
+            int: 조직 수.
+        """
+        cache_key = (_tree_version, level, parent_seq)
+        total_count = _count_cache.get(cache_key)
+        if total_count is None:
+            total_count = self.organization_repository.count_organizations(db, filters)
+            _count_cache.set(cache_key, total_count)
+        return total_count
+
+    def get_organization_updated_at(self, db: Session, organization_seq: int) -> Optional[datetime]:
+        """
+        특정 조직의 수정 시각만 조회하는 메서드. (ETag 비교용)
+
+        Args:
+            db (Session): 데이터베이스 세션.
+            organization_seq (int): 조회할 조직 seq.
+
+        Returns:
+            Optional[datetime]: 조직 수정 시각 (조직이 없으면 None).
+        """
+        return self.organization_repository.get_organization_updated_at(db, organization_seq)
 
     def get_organization_by_seq(self, db: Session, organization_seq: int) -> OrganizationDomain:
         """
@@ -96,6 +181,7 @@ class OrganizationService(BaseService):
             raise OrganizationNotFoundException()
         return organization_domain
 
+    @_invalidates_tree
     @Transactional
     @History(entity="organization", action="INSERT")
     def create_department(self, db: Session, department_create_request_dto: DepartmentCreateRequestDto) -> OrganizationDomain:
@@ -120,10 +206,11 @@ class OrganizationService(BaseService):
         if department_create_request_dto.parent_seq is not None:
             raise InvalidDivisionParentException()
 
-        department_domain = OrganizationDomain(**department_create_request_dto.model_dump())
+        department_domain = OrganizationDomain(**department_create_request_dto.__dict__)
 
         return self.organization_repository.create_organization(db=db, organization_domain=department_domain)
 
+    @_invalidates_tree
     @Transactional
     @History(entity="organization", action="INSERT")
     def create_headquarters(self, db: Session, headquarters_create_request_dto: HeadquartersCreateRequestDto) -> OrganizationDomain:
@@ -149,14 +236,14 @@ class OrganizationService(BaseService):
         if headquarters_create_request_dto.parent_seq is None:
             raise MissingParentForHeadquarterException()
 
-        existing_department = self.organization_repository.get_organization_by_seq(db, headquarters_create_request_dto.parent_seq)
-        if not existing_department or existing_department.level != 1:
+        if not self.organization_repository.exists_with_level(db, headquarters_create_request_dto.parent_seq, 1):
             raise InvalidDivisionIdException()
 
-        headquarters_domain = OrganizationDomain(**headquarters_create_request_dto.model_dump())
+        headquarters_domain = OrganizationDomain(**headquarters_create_request_dto.__dict__)
 
         return self.organization_repository.create_organization(db=db, organization_domain=headquarters_domain)
 
+    @_invalidates_tree
     @Transactional
     @History(entity="organization", action="INSERT")
     def create_team(self, db: Session, team_create_request_dto: TeamCreateRequestDto) -> OrganizationDomain:
@@ -182,14 +269,66 @@ class OrganizationService(BaseService):
         if team_create_request_dto.parent_seq is None:
             raise MissingParentForTeamException()
 
-        existing_headquarters = self.organization_repository.get_organization_by_seq(db, team_create_request_dto.parent_seq)
-        if not existing_headquarters or existing_headquarters.level != 2:
+        if not self.organization_repository.exists_with_level(db, team_create_request_dto.parent_seq, 2):
             raise InvalidHeadquarterIdException()
 
-        team_domain = OrganizationDomain(**team_create_request_dto.model_dump())
+        team_domain = OrganizationDomain(**team_create_request_dto.__dict__)
 
         return self.organization_repository.create_organization(db=db, organization_domain=team_domain)
 
+    @_invalidates_tree
+    @Transactional
+    def create_organizations(
+        self,
+        db: Session,
+        organization_create_requests: List[OrganizationBulkCreateRequestDto]
+    ) -> List[OrganizationDomain]:
+        """
+        여러 조직(부문/본부/팀)을 한 번의 트랜잭션으로 생성하는 메서드.
+        - 상위 조직은 이미 존재해야 하며, 한 번의 IN 쿼리로 함께 검증
+
+        Args:
+            db (Session): 데이터베이스 세션.
+            organization_create_requests (List[OrganizationBulkCreateRequestDto]): 조직 생성 요청 DTO 목록.
+
+        Returns:
+            List[OrganizationDomain]: 생성된 조직 도메인 객체 목록 (요청 순서 유지).
+
+        Raises:
+            InvalidDivisionParentException: 부문에 parent_seq가 있는 경우.
+            MissingParentForHeadquarterException: 본부에 parent_seq가 없는 경우.
+            MissingParentForTeamException: 팀에 parent_seq가 없는 경우.
+            InvalidDivisionIdException: 본부의 상위 조직이 유효한 부문이 아닌 경우.
+            InvalidHeadquarterIdException: 팀의 상위 조직이 유효한 본부가 아닌 경우.
+        """
+        parent_seqs = {request.parent_seq for request in organization_create_requests if request.parent_seq is not None}
+        parent_levels = {
+            domain.seq: domain.level
+            for domain in self.organization_repository.get_organizations_by_seqs(db, list(parent_seqs))
+        } if parent_seqs else {}
+
+        for request in organization_create_requests:
+            if request.level == 1:
+                if request.parent_seq is not None:
+                    raise InvalidDivisionParentException()
+            elif request.level == 2:
+                if request.parent_seq is None:
+                    raise MissingParentForHeadquarterException()
+                if parent_levels.get(request.parent_seq) != 1:
+                    raise InvalidDivisionIdException()
+            else:
+                if request.parent_seq is None:
+                    raise MissingParentForTeamException()
+                if parent_levels.get(request.parent_seq) != 2:
+                    raise InvalidHeadquarterIdException()
+
+        organization_domains = [OrganizationDomain(**request.__dict__) for request in organization_create_requests]
+        created = self.organization_repository.create_organizations(db, organization_domains)
+
+        record_histories(db, "organization", "INSERT", [(domain.seq, None, domain) for domain in created])
+        return created
+
+    @_invalidates_tree
     @Transactional
     @History(entity="organization", action="UPDATE")
     def update_organization(self, db: Session, organization_seq: int, update_request: OrganizationNameAndVisibleUpdateRequestDto) -> OrganizationDomain:
@@ -207,19 +346,21 @@ class OrganizationService(BaseService):
 
         Raises:
             OrganizationNotFoundException: 조직이 존재하지 않는 경우.
+            OrganizationUpdateDataNotFoundException: 수정할 데이터가 없을 경우.
         """
-
-        organization_domain = self.organization_repository.get_organization_by_seq(db, organization_seq)
-        if organization_domain is None:
-            raise OrganizationNotFoundException()
-
+        # DTO를 dict로 변환 (수정할 데이터가 없으면 DB 조회 없이 바로 예외)
         update_data = update_request.model_dump(exclude_unset=True)
 
         if not update_data:
-            return OrganizationUpdateDataNotFoundException()
+            raise OrganizationUpdateDataNotFoundException()
 
-        return self.organization_repository.update_organization(db, organization_seq, update_data)
+        # 별도의 존재 여부 조회 없이 수정하고, 대상이 없으면 예외
+        updated = self.organization_repository.update_organization(db, organization_seq, update_data)
+        if updated is None:
+            raise OrganizationNotFoundException()
+        return updated
 
+    @_invalidates_tree
     @Transactional
     @History(entity="organization", action="UPDATE")
     def move_organization(self, db: Session, organization_move_request: OrganizationMoveRequestDto) -> OrganizationDomain:
@@ -235,21 +376,59 @@ class OrganizationService(BaseService):
 
         Raises:
             OrganizationNotFoundException: 대상 또는 상위 조직이 존재하지 않는 경우.
+            InvalidOrganizationMoveException: 자기 자신 또는 하위 조직 아래로 이동하려는 경우.
         """
-        # 조직 정보를 변경할 조직 seq
+        # 조직 정보를 변경할 조직 seq, 새 부모 조직 seq
         organization_seq = organization_move_request.organization_seq
-        organization_domain = self.organization_repository.get_organization_by_seq(db, organization_seq)
-        if organization_domain is None:
-            raise OrganizationNotFoundException()
-
-        # 새 부모 조직 seq
         new_parent_seq = organization_move_request.new_parent_seq
-        organization_domain = self.organization_repository.get_organization_by_seq(db, new_parent_seq)
-        if organization_domain is None:
+
+        # 두 조직의 존재 여부와 경로를 한 번의 IN 쿼리로 조회
+        paths = self.organization_repository.get_organization_paths(db, [organization_seq, new_parent_seq])
+        if organization_seq not in paths or new_parent_seq not in paths:
             raise OrganizationNotFoundException()
 
+        old_path, parent_path = paths[organization_seq], paths[new_parent_seq]
+        if old_path and parent_path:
+            # 조직 경로로 자기 자신 또는 하위 조직 아래로의 이동(순환 구조)을 차단한다.
+            if parent_path.startswith(old_path):
+                raise InvalidOrganizationMoveException()
+
+            # 이동한 조직과 모든 하위 조직의 경로를 한 번의 UPDATE로 변경한다.
+            self.organization_repository.move_organization_subtree(db, old_path, f"{parent_path}{organization_seq}/")
+        else:
+            # 경로가 채워지지 않은 조직은 상위 조직을 따라 올라가며 순환 구조를 확인한다.
+            if self.organization_repository.is_self_or_descendant(db, organization_seq, new_parent_seq):
+                raise InvalidOrganizationMoveException()
+
+            # 새 경로를 계산할 수 없으므로, 이후 검증에서 오래된 경로를 사용하지 않도록 하위 트리의 경로를 비운다.
+            if old_path:
+                self.organization_repository.clear_subtree_paths(db, old_path)
+
+        # 경로 변경 후에 수정(flush + refresh)하므로, 반환값과 히스토리 after에 변경된 경로가 반영된다.
         return self.organization_repository.update_organization(db, organization_seq, update_data={"parent_seq": new_parent_seq})
 
+    def _check_deletable(self, db: Session, organization_seq: int) -> None:
+        """
+        조직을 (논리) 삭제할 수 있는지 한 번의 쿼리로 확인하는 내부 메서드.
+
+        Raises:
+            EmployeesExistInOrganizationException: 직원이 소속된 경우.
+            SubOrganizationsExistException: 하위 조직이 존재하는 경우.
+            OrganizationNotFoundException: 조직이 존재하지 않는 경우.
+        """
+        found, has_employees, has_children = self.organization_repository.get_delete_preconditions(db, organization_seq)
+        # 삭제 하는 조직 ID 에 매핑 되어있는 직원이 있는지
+        if has_employees:
+            raise EmployeesExistInOrganizationException()
+
+        # 하위 조직이 있는지
+        if has_children:
+            raise SubOrganizationsExistException()
+
+        if not found:
+            raise OrganizationNotFoundException()
+
+    @_invalidates_tree
     @Transactional
     @History(entity="organization", action="DELETE")
     def delete_organization(self, db: Session, organization_seq: int) -> bool:
@@ -270,22 +449,11 @@ class OrganizationService(BaseService):
             SubOrganizationsExistException: 하위 조직이 존재하는 경우.
             OrganizationNotFoundException: 조직이 존재하지 않는 경우.
         """
-
-        # 삭제 하는 조직 ID 에 매핑 되어있는 직원이 있는지
-        has_employees = self.employee_repository.count_employees_by_organization_seq(db, organization_seq)
-        if has_employees > 0:
-            raise EmployeesExistInOrganizationException()
-
-        has_children = self.organization_repository.has_child_organizations(db, organization_seq)
-        if has_children:
-            raise SubOrganizationsExistException()
-
-        organization_domain = self.organization_repository.get_organization_by_seq(db, organization_seq)
-        if organization_domain is None:
-            raise OrganizationNotFoundException()
+        self._check_deletable(db, organization_seq)
 
         return self.organization_repository.delete_organization(db, organization_seq)
 
+    @_invalidates_tree
     @Transactional
     @History(entity="organization", action="UPDATE")
     def soft_delete_organization(self, db: Session, organization_seq: int) -> OrganizationDomain:
@@ -306,26 +474,40 @@ class OrganizationService(BaseService):
             SubOrganizationsExistException: 하위 조직이 존재하는 경우.
             OrganizationNotFoundException: 조직이 존재하지 않는 경우.
         """
+        self._check_deletable(db, organization_seq)
 
-        # 삭제 하는 조직 ID 에 매핑 되어있는 직원이 있는지
-        has_employees = self.employee_repository.count_employees_by_organization_seq(db, organization_seq)
-        if has_employees > 0:
-            raise EmployeesExistInOrganizationException()
+        return self.organization_repository.soft_delete_organization(db, organization_seq)
 
-        # 하위 조직이 있는지
-        has_children = self.organization_repository.has_child_organizations(db, organization_seq)
-        if has_children:
-            raise SubOrganizationsExistException()
+    def stream_organizations(self, db: Session) -> Iterator[Row]:
+        """
+        전체 조직을 계층 순서(부문 → 본부 → 팀)대로 스트리밍 조회.
+        - 상위 조직이 항상 하위 조직보다 먼저 나오므로, 소비하는 쪽에서 한 번의 순회로 트리를 구성할 수 있음.
 
-        organization_domain = self.organization_repository.get_organization_by_seq(db, organization_seq)
-        if organization_domain is None:
-            raise OrganizationNotFoundException()
+        Args:
+            db (Session): 데이터베이스 세션.
 
-        return self.organization_repository.soft_delete_organization(db, organization_seq)
+        Returns:
+            Iterator[Row]: 조직 컬럼 값으로 구성된 Row 반복자.
+        """
+        return self.organization_repository.stream_organization_rows(db)
+
+    def get_cached_organization_tree_json(self) -> Optional[Tuple[bytes, str]]:
+        """
+        DB 접근 없이 캐시된 조직도 JSON과 그 다이제스트를 반환.
+        - 이벤트 루프에서 바로 호출할 수 있도록 세션을 사용하지 않음.
+
+        Returns:
+            Optional[Tuple[bytes, str]]: 캐시가 최신이면 (직렬화된 전체 조직도 JSON, JSON의 SHA-1 다이제스트), 아니면 None.
+        """
+        cache = _tree_cache
+        if _is_tree_cache_fresh(cache):
+            return cache[2], cache[3]
+        return None
 
     def get_organization_tree(self, db: Session) -> List[OrganizationDomain]:
         """
         전체 조직도 계층 구조로 조회.
+        - 마지막 조회 이후 조직 변경이 없으면 캐시된 트리를 그대로 반환.
 
         Args:
             db (Session): 데이터베이스 세션.
@@ -333,5 +515,47 @@ class OrganizationService(BaseService):
         Returns:
             List[OrganizationDomain]: 계층 구조의 전체 조직 리스트.
         """
-        return self.organization_repository.get_organization_tree(db)
+        return self._load_organization_tree(db)[1]
+
+    def get_organization_tree_json(self, db: Session) -> Tuple[bytes, str]:
+        """
+        전체 조직도를 계층 구조 JSON으로 조회.
+        - 트리와 함께 직렬화 결과도 캐시하므로, 조직 변경이 없으면 재직렬화 없이 그대로 반환.
+
+        Args:
+            db (Session): 데이터베이스 세션.
+
+        Returns:
+            Tuple[bytes, str]: (계층 구조의 전체 조직 리스트를 직렬화한 JSON, JSON의 SHA-1 다이제스트).
+        """
+        cache = self._load_organization_tree(db)
+        return cache[2], cache[3]
 
+    def _load_organization_tree(self, db: Session) -> tuple[int, List[OrganizationDomain], bytes, str, float]:
+        """
+        캐시가 최신이면 그대로, 아니면 조직도를 다시 조회/직렬화하여 캐시를 갱신한 뒤 반환.
+
+        Args:
+            db (Session): 데이터베이스 세션.
+
+        Returns:
+            tuple[int, List[OrganizationDomain], bytes, str, float]: (캐시 버전, 조직 트리, 직렬화된 JSON, JSON 다이제스트, 만료 시각)
+        """
+        global _tree_cache
+        version = _tree_version
+        cache = _tree_cache
+        if _is_tree_cache_fresh(cache):
+            return cache
+
+        organization_tree = self.organization_repository.get_organization_tree(db)
+        organization_tree_json = orjson.dumps(organization_tree)
+        # 조직도 내용 기준의 다이제스트 (프로세스 간에도 같은 내용이면 같은 값이므로 ETag로 사용 가능)
+        cache = (
+            version,
+            organization_tree,
+            organization_tree_json,
+            hashlib.sha1(organization_tree_json).hexdigest(),
+            time.monotonic() + ORGANIZATION_TREE_CACHE_TTL_SECONDS,
+        )
+        _tree_cache = cache
+        return cache
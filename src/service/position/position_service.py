@@ -1,5 +1,7 @@
-from typing import Tuple, List
+from functools import wraps
+from typing import Any, Optional, Tuple, List
 from sqlalchemy.orm import Session
+from src.core.session import submit_count
 from src.decorator.transaction import Transactional  # 트랜잭션 데코레이터 추가
 from src.domain.position_domain import PositionDomain
 from src.dto.request.position.position_create_request_dto import PositionCreateRequestDto
@@ -8,6 +10,28 @@ from src.exception.position_exceptions import PositionNotFoundException, Positio
     PositionUpdateDataNotFoundException
 from src.repository.position.position_repository import PositionRepository
 from src.service.base_service import BaseService
+from src.utils.ttl_cache import TTLCache
+
+# 직책 목록 조회 결과 캐시. 키에 _list_version을 포함하므로 직책 변경 시 자동으로 무효화되고,
+# 다른 프로세스에서 발생한 변경은 TTL이 지나면 반영된다.
+POSITION_LIST_CACHE_TTL_SECONDS = 60
+
+_list_cache = TTLCache(maxsize=128, ttl=POSITION_LIST_CACHE_TTL_SECONDS)
+_list_version = 0
+
+
+def _invalidates_list(func):
+    """
+    직책 데이터를 변경하는 메서드에 적용하여, 실행이 성공하면 목록 캐시 버전을 증가시키는 데코레이터.
+    @Transactional 바깥에 적용하여 커밋이 완료된 이후에 캐시가 무효화되도록 한다.
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        global _list_version
+        result = func(*args, **kwargs)
+        _list_version += 1
+        return result
+    return wrapper
 
 
 class PositionService(BaseService):
@@ -33,8 +57,10 @@ class PositionService(BaseService):
         page: int,
         size: int,
         sort_by: str | None,
-        order: str
-    ) -> Tuple[List[PositionDomain], int]:
+        order: str,
+        include_total: bool = False,
+        cursor: Optional[Tuple[int, Any]] = None
+    ) -> Tuple[List[PositionDomain], bool, Optional[int]]:
         """
         페이징 및 정렬을 적용하여 직책 목록을 조회하는 메서드.
 
@@ -44,14 +70,27 @@ class PositionService(BaseService):
             size (int): 한 페이지에 가져올 데이터 개수.
             sort_by (str | None): 정렬할 컬럼명 (예: "seq", "name")
             order (str): 정렬 방식 ("asc" | "desc")
+            include_total (bool): 전체 개수 조회 여부 (True일 때만 COUNT 쿼리 수행).
+            cursor (Optional[Tuple[int, Any]]): 직전 페이지 마지막 항목의 (seq, 정렬 컬럼 값). 지정하면 page 대신 키셋 방식으로 조회.
 
         Returns:
-            Tuple[List[PositionDomain], int]:
-                조회된 직책 리스트와 전체 직책 수.
+            Tuple[List[PositionDomain], bool, Optional[int]]:
+                조회된 직책 리스트, 다음 페이지 존재 여부, 전체 직책 수 (include_total이 False면 None).
         """
-        position_domains = self.position_repository.get_positions(db, page, size, sort_by, order)
-        total_count = self.position_repository.count_positions(db)
-        return position_domains, total_count
+        # 변경이 드문 기준 데이터이므로 조회 조건별 결과를 캐시 (변경 전에 시작된 조회는 이전 버전 키로 저장됨)
+        cache_key = (_list_version, page, size, sort_by, order, include_total, cursor)
+        cached = _list_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # COUNT는 별도 커넥션에서 페이지 조회와 동시에 실행
+        total_future = submit_count(self.position_repository.count_positions) if include_total else None
+        position_domains, has_more = self.position_repository.get_positions(db, page, size, sort_by, order, cursor)
+        total_count = total_future.result() if total_future is not None else None
+
+        result = (position_domains, has_more, total_count)
+        _list_cache.set(cache_key, result)
+        return result
 
     def get_position_by_seq(self, db: Session, position_seq: int) -> PositionDomain:
         """
@@ -72,6 +111,7 @@ class PositionService(BaseService):
             raise PositionNotFoundException()
         return position_domain
 
+    @_invalidates_list
     @Transactional
     def create_position(self, db: Session, position_create_request: PositionCreateRequestDto) -> PositionDomain:
         """
@@ -88,14 +128,14 @@ class PositionService(BaseService):
             PositionAlreadyExistsException: 동일한 title이 이미 존재하는 경우.
         """
         # 직책이 이미 존재하는지 확인
-        existing_position = self.position_repository.get_position_by_title(db, position_create_request.title)
-        if existing_position:
+        if self.position_repository.exists_by_title(db, position_create_request.title):
             raise PositionAlreadyExistsException()
 
-        position_domain = PositionDomain(**position_create_request.model_dump())
+        position_domain = PositionDomain(**position_create_request.__dict__)
 
         return self.position_repository.create_position(db, position_domain)
 
+    @_invalidates_list
     @Transactional
     def update_position(self, db: Session, position_seq: int, update_request: PositionUpdateRequestDto) -> PositionDomain:
         """
@@ -111,19 +151,21 @@ class PositionService(BaseService):
 
         Raises:
             PositionNotFoundException: 해당 직책이 존재하지 않을 경우.
+            PositionUpdateDataNotFoundException: 수정할 데이터가 없을 경우.
         """
-        position_domain = self.position_repository.get_position_by_seq(db, position_seq)
-        if position_domain is None:
-            raise PositionNotFoundException()
-
-        # DTO를 dict로 변환
+        # DTO를 dict로 변환 (수정할 데이터가 없으면 DB 조회 없이 바로 예외)
         update_data = update_request.model_dump(exclude_unset=True)
 
         if not update_data:
-            return PositionUpdateDataNotFoundException()
+            raise PositionUpdateDataNotFoundException()
 
-        return self.position_repository.update_position(db, position_seq, update_data)
+        # 별도의 존재 여부 조회 없이 수정하고, 대상이 없으면 예외
+        updated = self.position_repository.update_position(db, position_seq, update_data)
+        if updated is None:
+            raise PositionNotFoundException()
+        return updated
 
+    @_invalidates_list
     @Transactional
     def delete_position(self, db: Session, position_seq: int) -> bool:
         """
@@ -145,6 +187,7 @@ class PositionService(BaseService):
 
         return self.position_repository.delete_position(db, position_seq)
 
+    @_invalidates_list
     @Transactional
     def soft_delete_position(self, db: Session, position_seq: int) -> PositionDomain:
         """
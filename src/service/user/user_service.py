@@ -1,10 +1,12 @@
-from typing import Tuple, List
+from typing import Any, Optional, Tuple, List
 from sqlalchemy.orm import Session
+from src.core.session import submit_count
+from starlette.concurrency import run_in_threadpool
 from src.dto.request.user.user_create_request_dto import UserCreateRequestDto
 from src.exception.user_exceptions import UserNotFoundException, UserAlreadyExistsException
 from src.repository.user.user_repository import UserRepository
 from src.service.base_service import BaseService
-from src.utils.security import hash_password
+from src.utils.security import hash_password_async
 from src.domain.user_domain import UserDomain
 from src.decorator.transaction import Transactional  # 트랜잭션 데코레이터 추가
 
@@ -32,8 +34,10 @@ class UserService(BaseService):
         page: int,
         size: int,
         sort_by: str | None,
-        order: str
-    ) -> Tuple[List[UserDomain], int]:
+        order: str,
+        include_total: bool = False,
+        cursor: Optional[Tuple[int, Any]] = None
+    ) -> Tuple[List[UserDomain], bool, Optional[int]]:
         """
         페이징 및 정렬을 적용하여 회원 목록을 조회하는 메서드.
 
@@ -43,14 +47,18 @@ class UserService(BaseService):
             size (int): 한 페이지에 가져올 데이터 개수.
             sort_by (str | None): 정렬할 컬럼명 (예: "seq", "username")
             order (str): 정렬 방식 ("asc" | "desc")
+            include_total (bool): 전체 개수 조회 여부 (True일 때만 COUNT 쿼리 수행).
+            cursor (Optional[Tuple[int, Any]]): 직전 페이지 마지막 항목의 (seq, 정렬 컬럼 값). 지정하면 page 대신 키셋 방식으로 조회.
 
         Returns:
-            Tuple[List[UserDomain], int]:
-                회원 도메인 리스트와 전체 회원 수.
+            Tuple[List[UserDomain], bool, Optional[int]]:
+                회원 도메인 리스트, 다음 페이지 존재 여부, 전체 회원 수 (include_total이 False면 None).
         """
-        user_domains = self.user_repository.get_users(db, page, size, sort_by, order)
-        total_count = self.user_repository.count_users(db)
-        return user_domains, total_count
+        # COUNT는 별도 커넥션에서 페이지 조회와 동시에 실행
+        total_future = submit_count(self.user_repository.count_users) if include_total else None
+        user_domains, has_more = self.user_repository.get_users(db, page, size, sort_by, order, cursor)
+        total_count = total_future.result() if total_future is not None else None
+        return user_domains, has_more, total_count
 
     def get_user_by_seq(self, db: Session, user_seq: int) -> UserDomain:
         """
@@ -71,10 +79,10 @@ class UserService(BaseService):
             raise UserNotFoundException()
         return user_domain
 
-    @Transactional
-    def create_user(self, db: Session, user_create_request: UserCreateRequestDto) -> UserDomain:
+    async def create_user(self, db: Session, user_create_request: UserCreateRequestDto) -> UserDomain:
         """
         새로운 회원을 생성하는 메서드.
+        비밀번호 해시는 프로세스 풀에서, 중복 확인과 저장은 스레드풀에서 하나의 트랜잭션으로 수행합니다.
 
         Args:
             db (Session): 데이터베이스 세션.
@@ -84,26 +92,38 @@ class UserService(BaseService):
             UserDomain: 생성된 회원 도메인 객체.
 
         Raises:
-            UserAlreadyExistsException: 동일한 username을 가진 회원이 이미 존재하는 경우.
+            UserAlreadyExistsException: 동일한 username 또는 email을 가진 회원이 이미 존재하는 경우.
+        """
+        hashed_password = await hash_password_async(user_create_request.password)
+        return await run_in_threadpool(self._create_user, db, user_create_request, hashed_password)
+
+    @Transactional
+    def _create_user(self, db: Session, user_create_request: UserCreateRequestDto, hashed_password: str) -> UserDomain:
+        """
+        해시된 비밀번호로 회원을 저장하는 내부 메서드.
+
+        Raises:
+            UserAlreadyExistsException: 동일한 username 또는 email을 가진 회원이 이미 존재하는 경우.
         """
-        # 유저가 이미 존재하는지 확인
-        existing_user = self.user_repository.get_user_by_username(db, user_create_request.username)
-        if existing_user:
+        # 같은 아이디 또는 이메일(UNIQUE)의 회원이 이미 존재하는지 확인 (엔티티를 로딩하지 않는 EXISTS 조회)
+        if (
+            self.user_repository.exists_by_username(db, user_create_request.username)
+            or self.user_repository.exists_by_email(db, user_create_request.email)
+        ):
             raise UserAlreadyExistsException()
 
-        hashed_password = hash_password(user_create_request.password)
         user_create_request.type = user_create_request.type or 100
         user_create_request.status = user_create_request.status or 100
 
-        user_domain = UserDomain(**user_create_request.model_dump())
+        user_domain = UserDomain(**user_create_request.__dict__)
 
         # Repository에서 저장 후 Domain 반환
         return self.user_repository.create_user(db, user_domain, hashed_password)
 
-    @Transactional
-    def update_password(self, db: Session, user_seq: int, new_password: str) -> UserDomain:
+    async def update_password(self, db: Session, user_seq: int, new_password: str) -> UserDomain:
         """
         회원의 비밀번호를 변경하는 메서드.
+        비밀번호 해시는 프로세스 풀에서, 회원 확인과 변경은 스레드풀에서 하나의 트랜잭션으로 수행합니다.
 
         Args:
             db (Session): 데이터베이스 세션.
@@ -113,6 +133,17 @@ class UserService(BaseService):
         Returns:
             bool: 비밀번호 변경 성공 여부.
 
+        Raises:
+            UserNotFoundException: 해당 회원이 존재하지 않을 경우.
+        """
+        hashed_password = await hash_password_async(new_password)
+        return await run_in_threadpool(self._update_password, db, user_seq, hashed_password)
+
+    @Transactional
+    def _update_password(self, db: Session, user_seq: int, hashed_password: str) -> UserDomain:
+        """
+        해시된 비밀번호로 회원 비밀번호를 변경하는 내부 메서드.
+
         Raises:
             UserNotFoundException: 해당 회원이 존재하지 않을 경우.
         """
@@ -120,7 +151,6 @@ class UserService(BaseService):
         if user_domain is None:
             raise UserNotFoundException
 
-        hashed_password = hash_password(new_password)
         return self.user_repository.update_password(db, user_seq, hashed_password)
 
     @Transactional
@@ -1,15 +1,67 @@
-from passlib.context import CryptContext
+import asyncio
+import hashlib
+import hmac
+import secrets
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+import bcrypt
+
+from src.core.executors import bcrypt_pool
+from src.core.settings import settings
+from src.utils.ttl_cache import TTLCache
+
+# bcrypt가 사용하는 최대 입력 길이 (바이트). 초과분은 해시에 반영되지 않으므로 요청 DTO에서 거부함
+BCRYPT_MAX_PASSWORD_BYTES = 72
+
+# 비밀번호 검증 성공 결과 캐시 유지 시간 (초)
+# 같은 계정/비밀번호로 짧은 시간 안에 반복되는 로그인 요청은 bcrypt 검증을 다시 수행하지 않음
+PASSWORD_VERIFY_CACHE_TTL_SECONDS = 30
+
+# 캐시 키 생성용 프로세스 로컬 비밀값 (프로세스 재시작 시 새로 생성되어 캐시 키를 외부에서 재현할 수 없음)
+_verify_cache_pepper = secrets.token_bytes(32)
+_verified_cache = TTLCache(maxsize=10_000, ttl=PASSWORD_VERIFY_CACHE_TTL_SECONDS)
 
 def hash_password(password: str) -> str:
     """
-    주어진 비밀번호를 해시하여 반환합니다.
+    주어진 비밀번호를 bcrypt로 해시하여 반환합니다. (cost factor: settings.BCRYPT_ROUNDS)
+    """
+    hashed = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS))
+    return hashed.decode("ascii")
+
+async def hash_password_async(password: str) -> str:
+    """
+    비밀번호 해시를 bcrypt 전용 프로세스 풀에서 수행합니다.
+    해시 연산 동안 이벤트 루프와 엔드포인트 스레드풀을 점유하지 않습니다.
     """
-    return pwd_context.hash(password)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(bcrypt_pool, hash_password, password)
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     평문 비밀번호와 해시된 비밀번호를 비교합니다.
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    return bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password.encode("ascii"))
+
+def _verify_cache_key(plain_password: str, hashed_password: str) -> bytes:
+    """
+    검증 결과 캐시 키를 생성합니다.
+    평문 비밀번호가 메모리에 남지 않도록 프로세스 로컬 비밀값으로 HMAC-SHA256 처리하며,
+    저장된 해시를 키에 포함하므로 비밀번호가 변경되면 이전 검증 결과는 사용되지 않습니다.
+    """
+    message = f"{hashed_password}\0{plain_password}".encode()
+    return hmac.new(_verify_cache_pepper, message, hashlib.sha256).digest()
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    평문 비밀번호와 해시된 비밀번호를 bcrypt 전용 프로세스 풀에서 비교합니다.
+    (verify_password는 모듈 최상위 함수이므로 워커 프로세스로 전달(pickle) 가능)
+    최근 검증에 성공한 조합은 캐시에서 바로 반환하며, 실패한 결과는 캐시하지 않습니다.
+    """
+    cache_key = _verify_cache_key(plain_password, hashed_password)
+    if _verified_cache.get(cache_key):
+        return True
+
+    loop = asyncio.get_running_loop()
+    verified = await loop.run_in_executor(bcrypt_pool, verify_password, plain_password, hashed_password)
+    if verified:
+        _verified_cache.set(cache_key, True)
+    return verified
@@ -0,0 +1,83 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """
+    만료 시간(TTL)을 지원하는 스레드 안전한 인메모리 캐시.
+
+    - 동기(def) 엔드포인트는 스레드풀에서 동시에 실행되므로 모든 접근을 Lock으로 보호합니다.
+    - 최대 크기(maxsize)를 초과하면 가장 오래전에 저장된 항목부터 제거합니다.
+    - 만료 시각은 time.monotonic() 기준으로 계산하여 시스템 시간 변경의 영향을 받지 않습니다.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        Args:
+            maxsize (int): 최대 저장 항목 수
+            ttl (float): 기본 만료 시간 (초 단위)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        키에 해당하는 값을 반환합니다. 없거나 만료된 경우 default를 반환합니다.
+
+        Args:
+            key (Hashable): 조회할 키
+            default (Any): 값이 없을 때 반환할 기본값
+
+        Returns:
+            Any: 캐시된 값 또는 default
+        """
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        값을 저장합니다. ttl이 0 이하이면 저장하지 않습니다.
+
+        Args:
+            key (Hashable): 저장할 키
+            value (Any): 저장할 값
+            ttl (Optional[float]): 항목별 만료 시간 (None이면 기본 ttl 사용)
+        """
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = (time.monotonic() + ttl, value)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        """
+        키에 해당하는 항목을 제거합니다.
+
+        Args:
+            key (Hashable): 제거할 키
+        """
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        모든 항목을 제거합니다.
+        """
+        with self._lock:
+            self._data.clear()
@@ -0,0 +1,30 @@
+from fastapi import Depends
+from fastapi.dependencies import utils as dependency_utils
+
+from src.logging.api_logging_router import APILoggingRouter
+
+
+def _dependency() -> int:
+    return 1
+
+
+def test_router_does_not_patch_fastapi_dependency_helpers():
+    originals = {
+        name: getattr(dependency_utils, name)
+        for name in ("get_typed_signature", "is_gen_callable", "is_async_gen_callable", "is_coroutine_callable")
+    }
+
+    router = APILoggingRouter(debug=True)
+
+    @router.get("/ping")
+    async def ping(value: int = Depends(_dependency)):
+        return {"value": value}
+
+    # 엔드포인트 시그니처/의존성 분석은 라우트 등록 시 FastAPI가 한 번 수행
+    route = router.routes[-1]
+    assert route.dependant.call is ping
+    assert [dependant.call for dependant in route.dependant.dependencies] == [_dependency]
+
+    for name, func in originals.items():
+        assert getattr(dependency_utils, name) is func
+        assert func.__module__ == "fastapi.dependencies.utils"
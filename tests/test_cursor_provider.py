@@ -0,0 +1,32 @@
+import base64
+import json
+
+import pytest
+
+from src.exception.pagination_exceptions import InvalidCursorException
+from src.provider.cursor_provider import CursorProvider
+
+
+def _raw_cursor(payload) -> str:
+    return base64.urlsafe_b64encode(json.dumps(payload).encode("utf-8")).decode("ascii")
+
+
+@pytest.mark.parametrize("last_val", [None, "홍길동", 3, 1.5, True])
+def test_decode_round_trips_scalar_values(last_val):
+    assert CursorProvider.decode(CursorProvider.encode(7, last_val)) == (7, last_val)
+
+
+@pytest.mark.parametrize("last_val", [[1], {}, {"a": 1}])
+def test_decode_rejects_non_scalar_last_val(last_val):
+    with pytest.raises(InvalidCursorException):
+        CursorProvider.decode(_raw_cursor({"last_seq": 1, "last_val": last_val}))
+
+
+@pytest.mark.parametrize("payload", [{"last_seq": "1"}, {"last_seq": True}, {"last_val": 1}, [1, 2]])
+def test_decode_rejects_invalid_last_seq(payload):
+    with pytest.raises(InvalidCursorException):
+        CursorProvider.decode(_raw_cursor(payload))
+
+
+def test_decoded_cursor_is_hashable():
+    hash(CursorProvider.decode(CursorProvider.encode(1, "2026-01-01 00:00:00")))
@@ -0,0 +1,30 @@
+from typing import List
+
+import pytest
+from pydantic import TypeAdapter, ValidationError
+
+from src.dto.request.employee.employee_update_request_dto import EmployeeBulkUpdateRequestDto
+
+_bulk_adapter = TypeAdapter(List[EmployeeBulkUpdateRequestDto])
+
+
+def test_partial_bulk_update_item_is_valid():
+    requests = _bulk_adapter.validate_python([
+        {"employee_seq": 1, "name": "홍길동"},
+        {"employee_seq": 2, "status": "200"},
+    ])
+
+    assert requests[0].model_dump(exclude_unset=True, exclude={"employee_seq"}) == {"name": "홍길동"}
+    assert requests[1].model_dump(exclude_unset=True, exclude={"employee_seq"}) == {"status": "200"}
+
+
+def test_bulk_update_item_does_not_fill_defaults():
+    request = EmployeeBulkUpdateRequestDto(employee_seq=1, phone_number="010-0000-0000")
+
+    update_data = request.model_dump(exclude_unset=True, exclude={"employee_seq"})
+    assert set(update_data) == {"phone_number"}
+
+
+def test_bulk_update_item_requires_employee_seq():
+    with pytest.raises(ValidationError):
+        EmployeeBulkUpdateRequestDto(name="홍길동")
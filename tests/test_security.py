@@ -0,0 +1,33 @@
+import pytest
+from pydantic import ValidationError
+
+from src.core.settings import settings
+from src.dto.request.user.password_update_request_dto import PasswordUpdateRequestDto
+from src.utils.security import hash_password, verify_password
+
+
+@pytest.fixture(autouse=True)
+def _fast_rounds(monkeypatch):
+    monkeypatch.setattr(settings, "BCRYPT_ROUNDS", 4)
+
+
+def test_hash_password_produces_plain_bcrypt_hash():
+    hashed = hash_password("secret-pw")
+    assert hashed.startswith("$2b$04$")
+    assert verify_password("secret-pw", hashed)
+    assert not verify_password("other-pw", hashed)
+
+
+def test_verify_password_accepts_baseline_bcrypt_hash():
+    # 기존(passlib bcrypt 스킴) 저장 해시와 동일한 $2b$ 형식
+    import bcrypt
+    stored = bcrypt.hashpw("비밀번호123".encode("utf-8"), bcrypt.gensalt(rounds=4)).decode("ascii")
+    assert verify_password("비밀번호123", stored)
+
+
+def test_password_over_bcrypt_limit_is_rejected():
+    PasswordUpdateRequestDto(password="a" * 72)
+    with pytest.raises(ValidationError):
+        PasswordUpdateRequestDto(password="a" * 73)
+    with pytest.raises(ValidationError):
+        PasswordUpdateRequestDto(password="가" * 25)  # 75바이트
@@ -0,0 +1,79 @@
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.core.soft_delete import register_soft_delete_filter
+from src.entity import EmployeeEntity
+from src.entity.rank_entity import RankEntity
+from src.repository.employee.employee_repository import EmployeeRepository
+from src.repository.rank.rank_repository import RankRepository
+
+
+@pytest.fixture
+def db():
+    """
+    전역 논리 삭제 필터를 등록한 인메모리 SQLite 세션. (직위 1: 정상, 직위 2: 논리 삭제, 직원 10: 논리 삭제)
+    """
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    RankEntity.__table__.create(engine)
+    EmployeeEntity.__table__.create(engine)
+    session_factory = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+    register_soft_delete_filter(session_factory)
+
+    session = session_factory()
+    session.add_all([
+        RankEntity(seq=1, title="부문장"),
+        RankEntity(seq=2, title="본부장", deleted_at=datetime(2026, 1, 1)),
+        EmployeeEntity(
+            seq=10, name="홍길동", email="hong@example.com", phone_number="010-0000-0000",
+            extension_number="1000", hire_date=date(2020, 1, 1), birth_date=date(1990, 1, 1),
+            deleted_at=datetime(2026, 1, 1),
+        ),
+    ])
+    session.commit()
+    session.expunge_all()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+def test_orm_select_excludes_soft_deleted_rows(db):
+    assert [rank.seq for rank in db.execute(select(RankEntity)).scalars()] == [1]
+    assert db.execute(select(RankEntity.title)).scalars().all() == ["부문장"]
+
+
+def test_include_deleted_option_returns_all_rows(db):
+    stmt = select(RankEntity).order_by(RankEntity.seq).execution_options(include_deleted=True)
+    assert [rank.seq for rank in db.execute(stmt).scalars()] == [1, 2]
+
+
+def test_lookup_by_id_returns_soft_deleted_row(db):
+    repository = RankRepository()
+
+    assert repository.find_by_id(db, 2).title == "본부장"
+    assert repository.exists_by_id(db, 2)
+    assert repository.get_rank_by_seq(db, 3) is None
+
+
+def test_hard_delete_removes_soft_deleted_row(db):
+    repository = RankRepository()
+
+    assert repository.delete_by_id(db, 2)
+    db.commit()
+    stmt = select(RankEntity.seq).execution_options(include_deleted=True)
+    assert db.execute(stmt).scalars().all() == [1]
+
+
+def test_employee_hard_delete_removes_soft_deleted_employee(db):
+    repository = EmployeeRepository()
+
+    assert repository.delete_employee(db, 10)
+    assert not repository.delete_employee(db, 11)
+    db.commit()
+    stmt = select(EmployeeEntity.seq).execution_options(include_deleted=True)
+    assert db.execute(stmt).scalars().all() == []